@@ -0,0 +1,125 @@
+from sintactico import ErrorSemantico
+from sintactico import TablaSimbolos
+
+# Acciones semánticas que se ejecutan dentro del analizador LL(1), en la misma pasada que el parseo.
+# Construyen la tabla de símbolos y verifican las variables sin recorrer el árbol sintáctico,
+# con los mismos resultados que construir_tabla_simbolos seguido de verificar_variable.
+class AnalisisSemanticoFusionado:
+    def __init__(self, tabla_ll1, tabla_simbolos=None):
+        self.tabla_simbolos = tabla_simbolos if tabla_simbolos is not None else TablaSimbolos()
+        self.ambito = None  # Ámbito de la función que se está analizando
+        self.funcion = None  # Atributos de la función actual en el ámbito global
+        self.profundidad = 0  # Llaves abiertas dentro de la función actual
+        self.declaracion = False  # La instrucción actual es una 'asignaciones' del cuerpo de la función
+        self.nombre_pendiente = None  # Identificador que espera su 'tipodato'
+        self.esperando = None  # Qué se declara con el siguiente 'tipodato': 'parametro', 'variable' o 'retorno'
+        self.usos = []  # Tokens de los identificadores de la función actual
+        self.usos_globales = []  # Identificadores que solo pueden resolverse en el ámbito global
+
+        num_terminales = tabla_ll1.num_terminales
+        self.expansiones = [None] * (len(tabla_ll1.simbolos) - num_terminales)
+        self.emparejamientos = [None] * num_terminales
+        acciones_no_terminales = {
+            'restomain': self._restomain,
+            'restofuncn': self._restofuncn,
+            'parametrosf': self._parametrosf,
+            'opciondato': self._opciondato,
+            'instruccion': self._instruccion,
+            'asignaciones': self._asignaciones,
+            'ext': self._ext,
+            'tipodato': self._tipodato,
+        }
+        for nombre, accion in acciones_no_terminales.items():
+            self.expansiones[tabla_ll1.id_no_terminal[nombre]] = accion
+        self.emparejamientos[tabla_ll1.id_terminal['id']] = self._id
+        self.emparejamientos[tabla_ll1.id_terminal['llaveabi']] = self._llaveabi
+        self.emparejamientos[tabla_ll1.id_terminal['llavecerr']] = self._llavecerr
+        self.id_asignaciones = num_terminales + tabla_ll1.id_no_terminal['asignaciones']
+        self.id_tipodato = num_terminales + tabla_ll1.id_no_terminal['tipodato']
+
+    # Registra la función en el ámbito global y entra a su ámbito.
+    def _abrir_funcion(self, nombre, retorno):
+        self.funcion = self.tabla_simbolos.agregar_simbolo(nombre, categoria='function', parámetros=[], retorno=retorno)
+        self.ambito = self.tabla_simbolos.entrar_ambito(nombre)
+
+    def _restomain(self, produccion, token):
+        self._abrir_funcion('main', 'tentero')
+
+    def _restofuncn(self, produccion, token):
+        # restofuncn -> id pabierto parametrosf pcerrado opciondato llaveabi masinstrucciones llavecerr
+        self._abrir_funcion(token.valor, 'tvacio')
+
+    def _parametrosf(self, produccion, token):
+        # parametrosf -> id tipodato masparametrosf
+        if produccion:
+            self.nombre_pendiente = token.valor
+            self.esperando = 'parametro'
+
+    def _opciondato(self, produccion, token):
+        # opciondato -> tipodato
+        if produccion[0] == self.id_tipodato:
+            self.esperando = 'retorno'
+
+    def _instruccion(self, produccion, token):
+        # Solo se declaran las variables de las instrucciones que están directamente en el cuerpo.
+        self.declaracion = self.profundidad == 1 and produccion[0] == self.id_asignaciones
+
+    def _asignaciones(self, produccion, token):
+        # asignaciones -> id ext
+        self.nombre_pendiente = token.valor if self.declaracion else None
+        self.declaracion = False
+
+    def _ext(self, produccion, token):
+        # ext -> tipodato opcionesasig
+        if self.nombre_pendiente is not None and produccion[0] == self.id_tipodato:
+            self.esperando = 'variable'
+        else:
+            self.nombre_pendiente = None
+
+    def _tipodato(self, produccion, token):
+        tipo = token.tipo
+        if self.esperando == 'parametro':
+            # Si el nombre de la función estaba repetido no hay atributos que completar.
+            if self.funcion is not None:
+                self.funcion['parámetros'].append({'nombre': self.nombre_pendiente, 'tipo': tipo})
+            self.ambito.agregar_simbolo(self.nombre_pendiente, tipo=tipo, categoria='parametro')
+        elif self.esperando == 'variable':
+            self.ambito.agregar_simbolo(self.nombre_pendiente, tipo=tipo, categoria='variable')
+        elif self.esperando == 'retorno' and self.funcion is not None:
+            self.funcion['retorno'] = tipo
+        self.nombre_pendiente = None
+        self.esperando = None
+
+    def _id(self, token):
+        self.usos.append(token)
+
+    def _llaveabi(self, token):
+        self.profundidad += 1
+
+    def _llavecerr(self, token):
+        self.profundidad -= 1
+        if self.profundidad == 0:
+            self._cerrar_funcion()
+
+    # Al cerrar la función se resuelven sus identificadores locales; el resto se deja para el final
+    # porque pueden nombrar funciones que aún no se han declarado.
+    def _cerrar_funcion(self):
+        simbolos = self.ambito.simbolos
+        self.usos_globales.extend(uso for uso in self.usos if uso.valor not in simbolos)
+        self.usos = []
+        self.ambito.salir_ambito()
+        self.ambito = None
+        self.funcion = None
+
+    # Resuelve los identificadores pendientes contra el ámbito global y retorna la tabla de símbolos.
+    # Los errores de variables no declaradas quedan después de los de declaración, como en las dos pasadas.
+    def finalizar(self):
+        globales = self.tabla_simbolos.simbolos
+        for uso in self.usos_globales:
+            if uso.valor not in globales:
+                # La columna solo se resuelve para los identificadores que producen un error.
+                linea, columna = uso.linea, uso.columna
+                mensaje = f"La variable '{uso.valor}' no está declarada en la línea {linea}, columna {columna}"
+                self.tabla_simbolos.errores.append(ErrorSemantico(mensaje, linea, columna))
+        self.usos_globales = []
+        return self.tabla_simbolos
@@ -0,0 +1,1163 @@
+# Analizador sintáctico generado por generador-ll1.py a partir de gramatica.txt; no editar a mano.
+from sintactico import AlmacenArbol
+from sintactico import ErrorSintactico
+from sintactico import TOKEN_FIN
+from sintactico import obtener_tabla_ll1
+
+# Huella de la gramática y de los tokens con los que se generó este módulo.
+HUELLA = 'f59f5ea63d3159169d61b2f8eb85a956cd52ade4'
+
+# Símbolos en el orden de ids de la tabla LL(1): primero terminales y luego no terminales.
+SIMBOLOS = ['funcion', 'principal', 'pabierto', 'pcerrado', 'imprimir', 'comillas', 'id', 'coma', 'fsentencia', 'devolver', 'detener', 'llaveabi', 'llavecerr', 'tentero', 'tflotante', 'tbooleano', 'tcadena', 'tvacio', 'si', 'y', 'o', 'sino', 'entonces', 'mientras', 'para', 'suma', 'resta', 'mul', 'div', 'residuo', 'menorque', 'mayorque', 'menorigualque', 'mayorigualque', 'igual', 'igualbool', 'diferentede', 'nentero', 'nflotante', 'ncadena', 'nbooleano', 'leer', '$', 'programaprincipal', 'opcionprincipal', 'masfuncn', 'restomain', 'restofuncn', 'parametrosf', 'masparametrosf', 'opciondato', 'instruccion', 'masinstrucciones', 'buclepara', 'buclemientras', 'condicional', 'posibilidad', 'mostrar', 'comandos', 'macomandos', 'mascomandos', 'asignaciones', 'ext', 'extension', 'opcionesasig', 'expresion', 'masexpresiones', 'opciones', 'parametros', 'restoparametros', 'operacion', 'valordato', 'tipodato']
+TERMINALES = frozenset(SIMBOLOS[:43])
+
+_OPCIONDATO_0 = frozenset(['tbooleano', 'tcadena', 'tentero', 'tflotante'])
+_MASINSTRUCCIONES_0 = frozenset(['detener', 'devolver', 'id', 'imprimir', 'leer', 'mientras', 'para', 'si'])
+_POSIBILIDAD_0 = frozenset(['detener', 'devolver', 'id', 'imprimir', 'leer', 'llavecerr', 'mientras', 'para', 'si'])
+_COMANDOS_0 = frozenset(['id', 'nbooleano', 'ncadena', 'nentero', 'nflotante', 'pabierto'])
+_EXT_0 = frozenset(['igual', 'pabierto'])
+_EXT_1 = frozenset(['tbooleano', 'tcadena', 'tentero', 'tflotante'])
+_OPCIONESASIG_0 = frozenset(['fsentencia', 'pcerrado'])
+_EXPRESION_2 = frozenset(['nbooleano', 'ncadena', 'nentero', 'nflotante'])
+_MASEXPRESIONES_0 = frozenset(['coma', 'fsentencia', 'pcerrado'])
+_MASEXPRESIONES_1 = frozenset(['diferentede', 'div', 'igualbool', 'mayorigualque', 'mayorque', 'menorigualque', 'menorque', 'mul', 'o', 'residuo', 'resta', 'suma', 'y'])
+_OPCIONES_1 = frozenset(['coma', 'diferentede', 'div', 'fsentencia', 'igualbool', 'mayorigualque', 'mayorque', 'menorigualque', 'menorque', 'mul', 'o', 'pcerrado', 'residuo', 'resta', 'suma', 'y'])
+_PARAMETROS_0 = frozenset(['id', 'nbooleano', 'ncadena', 'nentero', 'nflotante', 'pabierto'])
+
+# Excepción interna que detiene el análisis; lleva el ErrorSintactico o None.
+class _Fallo(Exception):
+    pass
+
+# Función que analiza un flujo de tokens igual que sintactico.analizador_sintactico.
+# Retorna (exito, raiz del árbol o None, errores sintácticos).
+def analizador_sintactico(flujo_de_tokens, tabla_ll1=None):
+    if tabla_ll1 is None:
+        tabla_ll1 = obtener_tabla_ll1()
+    if tabla_ll1.simbolos != SIMBOLOS:
+        raise ValueError("El analizador generado no corresponde a la tabla LL(1); vuelva a generarlo")
+    errores_sintacticos = []
+    arbol = AlmacenArbol(tabla_ll1)
+    agregar_hijos = arbol.agregar_hijos
+    asignar_valor = arbol.asignar_valor
+    lineas = arbol.linea
+    posiciones = arbol.posicion
+    flujo = iter(flujo_de_tokens)
+    siguiente = next
+    actual = siguiente(flujo, TOKEN_FIN)
+    arbol.lineas = actual.lineas
+
+    # Error al expandir un no terminal: 'e' si el token es de la gramática pero no tiene producción.
+    def fallar(no_terminal):
+        encontrado = 'e' if actual.tipo in TERMINALES else ''
+        raise _Fallo(ErrorSintactico(no_terminal, encontrado, actual.linea, actual.columna))
+
+    def p_programaprincipal(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'funcion':
+            # programaprincipal -> funcion opcionprincipal masfuncn
+            primero = agregar_hijos(nodo, (0, 44, 45))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_opcionprincipal(primero + 1)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            return p_masfuncn, primero + 2
+        else:
+            fallar('programaprincipal')
+
+    def p_opcionprincipal(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'principal':
+            # opcionprincipal -> restomain
+            primero = agregar_hijos(nodo, (46,))
+            return p_restomain, primero
+        elif tipo == 'id':
+            # opcionprincipal -> restofuncn
+            primero = agregar_hijos(nodo, (47,))
+            return p_restofuncn, primero
+        else:
+            fallar('opcionprincipal')
+
+    def p_masfuncn(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'funcion':
+            # masfuncn -> programaprincipal
+            primero = agregar_hijos(nodo, (43,))
+            return p_programaprincipal, primero
+        elif tipo == '$':
+            # masfuncn -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        else:
+            fallar('masfuncn')
+
+    def p_restomain(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'principal':
+            # restomain -> principal pabierto pcerrado tentero llaveabi masinstrucciones llavecerr
+            primero = agregar_hijos(nodo, (1, 2, 3, 13, 11, 52, 12))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'pabierto':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'pcerrado':
+                raise _Fallo(None)
+            asignar_valor(primero + 2, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 2] = actual.linea
+                posiciones[primero + 2] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'tentero':
+                raise _Fallo(None)
+            asignar_valor(primero + 3, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 3] = actual.linea
+                posiciones[primero + 3] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'llaveabi':
+                raise _Fallo(None)
+            asignar_valor(primero + 4, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 4] = actual.linea
+                posiciones[primero + 4] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_masinstrucciones(primero + 5)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'llavecerr':
+                raise _Fallo(None)
+            asignar_valor(primero + 6, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 6] = actual.linea
+                posiciones[primero + 6] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        else:
+            fallar('restomain')
+
+    def p_restofuncn(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'id':
+            # restofuncn -> id pabierto parametrosf pcerrado opciondato llaveabi masinstrucciones llavecerr
+            primero = agregar_hijos(nodo, (6, 2, 48, 3, 50, 11, 52, 12))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'pabierto':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_parametrosf(primero + 2)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'pcerrado':
+                raise _Fallo(None)
+            asignar_valor(primero + 3, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 3] = actual.linea
+                posiciones[primero + 3] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_opciondato(primero + 4)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'llaveabi':
+                raise _Fallo(None)
+            asignar_valor(primero + 5, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 5] = actual.linea
+                posiciones[primero + 5] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_masinstrucciones(primero + 6)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'llavecerr':
+                raise _Fallo(None)
+            asignar_valor(primero + 7, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 7] = actual.linea
+                posiciones[primero + 7] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        else:
+            fallar('restofuncn')
+
+    def p_parametrosf(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'pcerrado':
+            # parametrosf -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        elif tipo == 'id':
+            # parametrosf -> id tipodato masparametrosf
+            primero = agregar_hijos(nodo, (6, 72, 49))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_tipodato(primero + 1)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            return p_masparametrosf, primero + 2
+        else:
+            fallar('parametrosf')
+
+    def p_masparametrosf(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'pcerrado':
+            # masparametrosf -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        elif tipo == 'coma':
+            # masparametrosf -> coma parametrosf
+            primero = agregar_hijos(nodo, (7, 48))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return p_parametrosf, primero + 1
+        else:
+            fallar('masparametrosf')
+
+    def p_opciondato(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo in _OPCIONDATO_0:
+            # opciondato -> tipodato
+            primero = agregar_hijos(nodo, (72,))
+            return p_tipodato, primero
+        elif tipo == 'tvacio':
+            # opciondato -> tvacio
+            primero = agregar_hijos(nodo, (17,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        else:
+            fallar('opciondato')
+
+    def p_instruccion(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'imprimir':
+            # instruccion -> mostrar fsentencia
+            primero = agregar_hijos(nodo, (57, 8))
+            continuacion = p_mostrar(primero)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'fsentencia':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'id':
+            # instruccion -> asignaciones fsentencia
+            primero = agregar_hijos(nodo, (61, 8))
+            continuacion = p_asignaciones(primero)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'fsentencia':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'devolver':
+            # instruccion -> devolver expresion fsentencia
+            primero = agregar_hijos(nodo, (9, 65, 8))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_expresion(primero + 1)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'fsentencia':
+                raise _Fallo(None)
+            asignar_valor(primero + 2, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 2] = actual.linea
+                posiciones[primero + 2] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'detener':
+            # instruccion -> detener fsentencia
+            primero = agregar_hijos(nodo, (10, 8))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'fsentencia':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'si':
+            # instruccion -> condicional
+            primero = agregar_hijos(nodo, (55,))
+            return p_condicional, primero
+        elif tipo == 'mientras':
+            # instruccion -> buclemientras
+            primero = agregar_hijos(nodo, (54,))
+            return p_buclemientras, primero
+        elif tipo == 'para':
+            # instruccion -> buclepara
+            primero = agregar_hijos(nodo, (53,))
+            return p_buclepara, primero
+        elif tipo == 'leer':
+            # instruccion -> leer pabierto id pcerrado fsentencia
+            primero = agregar_hijos(nodo, (41, 2, 6, 3, 8))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'pabierto':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'id':
+                raise _Fallo(None)
+            asignar_valor(primero + 2, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 2] = actual.linea
+                posiciones[primero + 2] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'pcerrado':
+                raise _Fallo(None)
+            asignar_valor(primero + 3, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 3] = actual.linea
+                posiciones[primero + 3] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'fsentencia':
+                raise _Fallo(None)
+            asignar_valor(primero + 4, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 4] = actual.linea
+                posiciones[primero + 4] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        else:
+            fallar('instruccion')
+
+    def p_masinstrucciones(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo in _MASINSTRUCCIONES_0:
+            # masinstrucciones -> instruccion masinstrucciones
+            primero = agregar_hijos(nodo, (51, 52))
+            continuacion = p_instruccion(primero)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            return p_masinstrucciones, primero + 1
+        elif tipo == 'llavecerr':
+            # masinstrucciones -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        else:
+            fallar('masinstrucciones')
+
+    def p_buclepara(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'para':
+            # buclepara -> para pabierto asignaciones fsentencia expresion fsentencia asignaciones pcerrado llaveabi masinstrucciones llavecerr
+            primero = agregar_hijos(nodo, (24, 2, 61, 8, 65, 8, 61, 3, 11, 52, 12))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'pabierto':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_asignaciones(primero + 2)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'fsentencia':
+                raise _Fallo(None)
+            asignar_valor(primero + 3, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 3] = actual.linea
+                posiciones[primero + 3] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_expresion(primero + 4)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'fsentencia':
+                raise _Fallo(None)
+            asignar_valor(primero + 5, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 5] = actual.linea
+                posiciones[primero + 5] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_asignaciones(primero + 6)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'pcerrado':
+                raise _Fallo(None)
+            asignar_valor(primero + 7, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 7] = actual.linea
+                posiciones[primero + 7] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'llaveabi':
+                raise _Fallo(None)
+            asignar_valor(primero + 8, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 8] = actual.linea
+                posiciones[primero + 8] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_masinstrucciones(primero + 9)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'llavecerr':
+                raise _Fallo(None)
+            asignar_valor(primero + 10, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 10] = actual.linea
+                posiciones[primero + 10] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        else:
+            fallar('buclepara')
+
+    def p_buclemientras(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'mientras':
+            # buclemientras -> mientras pabierto expresion pcerrado llaveabi masinstrucciones llavecerr
+            primero = agregar_hijos(nodo, (23, 2, 65, 3, 11, 52, 12))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'pabierto':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_expresion(primero + 2)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'pcerrado':
+                raise _Fallo(None)
+            asignar_valor(primero + 3, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 3] = actual.linea
+                posiciones[primero + 3] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'llaveabi':
+                raise _Fallo(None)
+            asignar_valor(primero + 4, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 4] = actual.linea
+                posiciones[primero + 4] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_masinstrucciones(primero + 5)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'llavecerr':
+                raise _Fallo(None)
+            asignar_valor(primero + 6, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 6] = actual.linea
+                posiciones[primero + 6] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        else:
+            fallar('buclemientras')
+
+    def p_condicional(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'si':
+            # condicional -> si pabierto expresion pcerrado llaveabi masinstrucciones llavecerr posibilidad
+            primero = agregar_hijos(nodo, (18, 2, 65, 3, 11, 52, 12, 56))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'pabierto':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_expresion(primero + 2)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'pcerrado':
+                raise _Fallo(None)
+            asignar_valor(primero + 3, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 3] = actual.linea
+                posiciones[primero + 3] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'llaveabi':
+                raise _Fallo(None)
+            asignar_valor(primero + 4, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 4] = actual.linea
+                posiciones[primero + 4] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_masinstrucciones(primero + 5)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'llavecerr':
+                raise _Fallo(None)
+            asignar_valor(primero + 6, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 6] = actual.linea
+                posiciones[primero + 6] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return p_posibilidad, primero + 7
+        else:
+            fallar('condicional')
+
+    def p_posibilidad(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo in _POSIBILIDAD_0:
+            # posibilidad -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        elif tipo == 'sino':
+            # posibilidad -> sino pabierto expresion pcerrado llaveabi masinstrucciones llavecerr posibilidad
+            primero = agregar_hijos(nodo, (21, 2, 65, 3, 11, 52, 12, 56))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'pabierto':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_expresion(primero + 2)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'pcerrado':
+                raise _Fallo(None)
+            asignar_valor(primero + 3, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 3] = actual.linea
+                posiciones[primero + 3] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'llaveabi':
+                raise _Fallo(None)
+            asignar_valor(primero + 4, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 4] = actual.linea
+                posiciones[primero + 4] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_masinstrucciones(primero + 5)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'llavecerr':
+                raise _Fallo(None)
+            asignar_valor(primero + 6, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 6] = actual.linea
+                posiciones[primero + 6] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return p_posibilidad, primero + 7
+        elif tipo == 'entonces':
+            # posibilidad -> entonces llaveabi masinstrucciones llavecerr
+            primero = agregar_hijos(nodo, (22, 11, 52, 12))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'llaveabi':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_masinstrucciones(primero + 2)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'llavecerr':
+                raise _Fallo(None)
+            asignar_valor(primero + 3, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 3] = actual.linea
+                posiciones[primero + 3] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        else:
+            fallar('posibilidad')
+
+    def p_mostrar(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'imprimir':
+            # mostrar -> imprimir pabierto comandos pcerrado
+            primero = agregar_hijos(nodo, (4, 2, 58, 3))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            if actual.tipo != 'pabierto':
+                raise _Fallo(None)
+            asignar_valor(primero + 1, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 1] = actual.linea
+                posiciones[primero + 1] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_comandos(primero + 2)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'pcerrado':
+                raise _Fallo(None)
+            asignar_valor(primero + 3, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 3] = actual.linea
+                posiciones[primero + 3] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        else:
+            fallar('mostrar')
+
+    def p_comandos(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo in _COMANDOS_0:
+            # comandos -> expresion mascomandos
+            primero = agregar_hijos(nodo, (65, 60))
+            continuacion = p_expresion(primero)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            return p_mascomandos, primero + 1
+        elif tipo == 'pcerrado':
+            # comandos -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        else:
+            fallar('comandos')
+
+    def p_macomandos(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'suma':
+            # macomandos -> suma expresion mascomandos
+            primero = agregar_hijos(nodo, (25, 65, 60))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_expresion(primero + 1)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            return p_mascomandos, primero + 2
+        else:
+            fallar('macomandos')
+
+    def p_mascomandos(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'pcerrado':
+            # mascomandos -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        else:
+            fallar('mascomandos')
+
+    def p_asignaciones(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'id':
+            # asignaciones -> id ext
+            primero = agregar_hijos(nodo, (6, 62))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return p_ext, primero + 1
+        else:
+            fallar('asignaciones')
+
+    def p_ext(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo in _EXT_0:
+            # ext -> extension
+            primero = agregar_hijos(nodo, (63,))
+            return p_extension, primero
+        elif tipo in _EXT_1:
+            # ext -> tipodato opcionesasig
+            primero = agregar_hijos(nodo, (72, 64))
+            continuacion = p_tipodato(primero)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            return p_opcionesasig, primero + 1
+        else:
+            fallar('ext')
+
+    def p_extension(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'pabierto':
+            # extension -> pabierto parametros pcerrado
+            primero = agregar_hijos(nodo, (2, 68, 3))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_parametros(primero + 1)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'pcerrado':
+                raise _Fallo(None)
+            asignar_valor(primero + 2, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 2] = actual.linea
+                posiciones[primero + 2] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'igual':
+            # extension -> igual expresion
+            primero = agregar_hijos(nodo, (34, 65))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return p_expresion, primero + 1
+        else:
+            fallar('extension')
+
+    def p_opcionesasig(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo in _OPCIONESASIG_0:
+            # opcionesasig -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        elif tipo == 'igual':
+            # opcionesasig -> igual expresion
+            primero = agregar_hijos(nodo, (34, 65))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return p_expresion, primero + 1
+        else:
+            fallar('opcionesasig')
+
+    def p_expresion(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'pabierto':
+            # expresion -> pabierto expresion pcerrado masexpresiones
+            primero = agregar_hijos(nodo, (2, 65, 3, 66))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_expresion(primero + 1)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'pcerrado':
+                raise _Fallo(None)
+            asignar_valor(primero + 2, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 2] = actual.linea
+                posiciones[primero + 2] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return p_masexpresiones, primero + 3
+        elif tipo == 'id':
+            # expresion -> id opciones masexpresiones
+            primero = agregar_hijos(nodo, (6, 67, 66))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_opciones(primero + 1)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            return p_masexpresiones, primero + 2
+        elif tipo in _EXPRESION_2:
+            # expresion -> valordato masexpresiones
+            primero = agregar_hijos(nodo, (71, 66))
+            continuacion = p_valordato(primero)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            return p_masexpresiones, primero + 1
+        else:
+            fallar('expresion')
+
+    def p_masexpresiones(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo in _MASEXPRESIONES_0:
+            # masexpresiones -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        elif tipo in _MASEXPRESIONES_1:
+            # masexpresiones -> operacion expresion
+            primero = agregar_hijos(nodo, (70, 65))
+            continuacion = p_operacion(primero)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            return p_expresion, primero + 1
+        else:
+            fallar('masexpresiones')
+
+    def p_opciones(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'pabierto':
+            # opciones -> pabierto parametros pcerrado
+            primero = agregar_hijos(nodo, (2, 68, 3))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_parametros(primero + 1)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            if actual.tipo != 'pcerrado':
+                raise _Fallo(None)
+            asignar_valor(primero + 2, actual.valor)
+            if actual.linea is not None:
+                lineas[primero + 2] = actual.linea
+                posiciones[primero + 2] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo in _OPCIONES_1:
+            # opciones -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        else:
+            fallar('opciones')
+
+    def p_parametros(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo in _PARAMETROS_0:
+            # parametros -> expresion restoparametros
+            primero = agregar_hijos(nodo, (65, 69))
+            continuacion = p_expresion(primero)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            return p_restoparametros, primero + 1
+        elif tipo == 'pcerrado':
+            # parametros -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        else:
+            fallar('parametros')
+
+    def p_restoparametros(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'pcerrado':
+            # restoparametros -> e
+            arbol.valor[agregar_hijos(nodo, (73,))] = 0
+            return None
+        elif tipo == 'coma':
+            # restoparametros -> coma expresion restoparametros
+            primero = agregar_hijos(nodo, (7, 65, 69))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            continuacion = p_expresion(primero + 1)
+            while continuacion is not None:
+                continuacion = continuacion[0](continuacion[1])
+            return p_restoparametros, primero + 2
+        else:
+            fallar('restoparametros')
+
+    def p_operacion(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'y':
+            # operacion -> y
+            primero = agregar_hijos(nodo, (19,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'o':
+            # operacion -> o
+            primero = agregar_hijos(nodo, (20,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'suma':
+            # operacion -> suma
+            primero = agregar_hijos(nodo, (25,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'resta':
+            # operacion -> resta
+            primero = agregar_hijos(nodo, (26,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'mul':
+            # operacion -> mul
+            primero = agregar_hijos(nodo, (27,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'div':
+            # operacion -> div
+            primero = agregar_hijos(nodo, (28,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'residuo':
+            # operacion -> residuo
+            primero = agregar_hijos(nodo, (29,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'menorque':
+            # operacion -> menorque
+            primero = agregar_hijos(nodo, (30,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'mayorque':
+            # operacion -> mayorque
+            primero = agregar_hijos(nodo, (31,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'menorigualque':
+            # operacion -> menorigualque
+            primero = agregar_hijos(nodo, (32,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'mayorigualque':
+            # operacion -> mayorigualque
+            primero = agregar_hijos(nodo, (33,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'igualbool':
+            # operacion -> igualbool
+            primero = agregar_hijos(nodo, (35,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'diferentede':
+            # operacion -> diferentede
+            primero = agregar_hijos(nodo, (36,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        else:
+            fallar('operacion')
+
+    def p_valordato(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'nentero':
+            # valordato -> nentero
+            primero = agregar_hijos(nodo, (37,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'nflotante':
+            # valordato -> nflotante
+            primero = agregar_hijos(nodo, (38,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'ncadena':
+            # valordato -> ncadena
+            primero = agregar_hijos(nodo, (39,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'nbooleano':
+            # valordato -> nbooleano
+            primero = agregar_hijos(nodo, (40,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        else:
+            fallar('valordato')
+
+    def p_tipodato(nodo):
+        nonlocal actual
+        tipo = actual.tipo
+        if tipo == 'tentero':
+            # tipodato -> tentero
+            primero = agregar_hijos(nodo, (13,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'tflotante':
+            # tipodato -> tflotante
+            primero = agregar_hijos(nodo, (14,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'tbooleano':
+            # tipodato -> tbooleano
+            primero = agregar_hijos(nodo, (15,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        elif tipo == 'tcadena':
+            # tipodato -> tcadena
+            primero = agregar_hijos(nodo, (16,))
+            asignar_valor(primero, actual.valor)
+            if actual.linea is not None:
+                lineas[primero] = actual.linea
+                posiciones[primero] = actual.posicion
+            actual = siguiente(flujo, TOKEN_FIN)
+            return None
+        else:
+            fallar('tipodato')
+
+    nodo_dolar = agregar_hijos(-1, (42,))
+    nodo_inicio = agregar_hijos(-1, (43,))
+    try:
+        continuacion = p_programaprincipal(nodo_inicio)
+        while continuacion is not None:
+            continuacion = continuacion[0](continuacion[1])
+        if actual.tipo != '$':
+            raise _Fallo(None)
+        asignar_valor(nodo_dolar, actual.valor)
+        if actual.linea is not None:
+            lineas[nodo_dolar] = actual.linea
+            posiciones[nodo_dolar] = actual.posicion
+        actual = siguiente(flujo, TOKEN_FIN)
+    except _Fallo as fallo:
+        if fallo.args[0] is not None:
+            errores_sintacticos.append(fallo.args[0])
+        return False, None, errores_sintacticos
+    # El análisis es exitoso si tras el $ no quedan tokens sin consumir.
+    exito = actual is TOKEN_FIN and siguiente(flujo, None) is None
+    return exito, arbol.nodo(nodo_inicio), errores_sintacticos
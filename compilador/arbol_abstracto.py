@@ -0,0 +1,426 @@
+# Árbol de sintaxis abstracta (AST) de FusionCod y la reducción desde el árbol sintáctico LL(1).
+# El AST elimina los nodos 'e', los terminales de puntuación y las cadenas de no terminales
+# (masinstrucciones, masfuncn, ext, masparametrosf, ...), dejando solo la estructura del programa.
+
+# Precedencia de los operadores binarios; todos asocian por la izquierda.
+PRECEDENCIA = {
+    'o': 1,
+    'y': 2,
+    'igualbool': 3, 'diferentede': 3, 'menorque': 3, 'mayorque': 3, 'menorigualque': 3, 'mayorigualque': 3,
+    'suma': 4, 'resta': 4,
+    'mul': 5, 'div': 5, 'residuo': 5,
+}
+
+# Clase base de los nodos del AST. Cada subclase declara en campos sus atributos en orden de código fuente.
+class NodoAST:
+    __slots__ = ('linea', 'columna')
+    campos = ()
+
+    def hijos(self):
+        """Retorna los nodos hijos en el orden en que aparecen en el código fuente."""
+        hijos = []
+        for campo in self.campos:
+            valor = getattr(self, campo)
+            if isinstance(valor, NodoAST):
+                hijos.append(valor)
+            elif isinstance(valor, list):
+                for elemento in valor:
+                    if isinstance(elemento, NodoAST):
+                        hijos.append(elemento)
+                    elif isinstance(elemento, tuple):
+                        hijos.extend(parte for parte in elemento if isinstance(parte, NodoAST))
+        return hijos
+
+    def __repr__(self):
+        atributos = ', '.join(f"{campo}={getattr(self, campo)!r}" for campo in self.campos)
+        return f"{type(self).__name__}({atributos})"
+
+class Programa(NodoAST):
+    __slots__ = ('funciones',)
+    campos = ('funciones',)
+
+    def __init__(self, funciones):
+        self.funciones = funciones
+        self.linea = self.columna = None
+
+class Funcion(NodoAST):
+    __slots__ = ('nombre', 'parametros', 'retorno', 'cuerpo')
+    campos = ('nombre', 'parametros', 'retorno', 'cuerpo')
+
+    def __init__(self, nombre, parametros, retorno, cuerpo, linea=None, columna=None):
+        self.nombre = nombre
+        self.parametros = parametros  # Lista de Parametro
+        self.retorno = retorno  # Tipo de retorno: 'tentero', 'tvacio', ...
+        self.cuerpo = cuerpo  # Lista de instrucciones
+        self.linea = linea
+        self.columna = columna
+
+class Parametro(NodoAST):
+    __slots__ = ('nombre', 'tipo')
+    campos = ('nombre', 'tipo')
+
+    def __init__(self, nombre, tipo, linea=None, columna=None):
+        self.nombre = nombre
+        self.tipo = tipo
+        self.linea = linea
+        self.columna = columna
+
+class Declaracion(NodoAST):
+    __slots__ = ('nombre', 'tipo', 'valor')
+    campos = ('nombre', 'tipo', 'valor')
+
+    def __init__(self, nombre, tipo, valor=None, linea=None, columna=None):
+        self.nombre = nombre
+        self.tipo = tipo
+        self.valor = valor  # Expresión inicial o None
+        self.linea = linea
+        self.columna = columna
+
+class Asignacion(NodoAST):
+    __slots__ = ('nombre', 'valor')
+    campos = ('nombre', 'valor')
+
+    def __init__(self, nombre, valor, linea=None, columna=None):
+        self.nombre = nombre
+        self.valor = valor
+        self.linea = linea
+        self.columna = columna
+
+class Llamada(NodoAST):
+    __slots__ = ('nombre', 'argumentos')
+    campos = ('nombre', 'argumentos')
+
+    def __init__(self, nombre, argumentos, linea=None, columna=None):
+        self.nombre = nombre
+        self.argumentos = argumentos  # Lista de expresiones
+        self.linea = linea
+        self.columna = columna
+
+class Si(NodoAST):
+    __slots__ = ('ramas', 'sino')
+    campos = ('ramas', 'sino')
+
+    def __init__(self, ramas, sino=None, linea=None, columna=None):
+        self.ramas = ramas  # Lista de parejas (condición, cuerpo) para el if y cada elif
+        self.sino = sino  # Cuerpo del else o None
+        self.linea = linea
+        self.columna = columna
+
+    def hijos(self):
+        hijos = []
+        for condicion, cuerpo in self.ramas:
+            hijos.append(condicion)
+            hijos.extend(cuerpo)
+        if self.sino:
+            hijos.extend(self.sino)
+        return hijos
+
+class Mientras(NodoAST):
+    __slots__ = ('condicion', 'cuerpo')
+    campos = ('condicion', 'cuerpo')
+
+    def __init__(self, condicion, cuerpo, linea=None, columna=None):
+        self.condicion = condicion
+        self.cuerpo = cuerpo
+        self.linea = linea
+        self.columna = columna
+
+class Para(NodoAST):
+    __slots__ = ('inicio', 'condicion', 'paso', 'cuerpo')
+    campos = ('inicio', 'condicion', 'paso', 'cuerpo')
+
+    def __init__(self, inicio, condicion, paso, cuerpo, linea=None, columna=None):
+        self.inicio = inicio
+        self.condicion = condicion
+        self.paso = paso
+        self.cuerpo = cuerpo
+        self.linea = linea
+        self.columna = columna
+
+class Mostrar(NodoAST):
+    __slots__ = ('argumentos',)
+    campos = ('argumentos',)
+
+    def __init__(self, argumentos, linea=None, columna=None):
+        self.argumentos = argumentos
+        self.linea = linea
+        self.columna = columna
+
+class Leer(NodoAST):
+    __slots__ = ('nombre',)
+    campos = ('nombre',)
+
+    def __init__(self, nombre, linea=None, columna=None):
+        self.nombre = nombre
+        self.linea = linea
+        self.columna = columna
+
+class Devolver(NodoAST):
+    __slots__ = ('valor',)
+    campos = ('valor',)
+
+    def __init__(self, valor, linea=None, columna=None):
+        self.valor = valor
+        self.linea = linea
+        self.columna = columna
+
+class Detener(NodoAST):
+    __slots__ = ()
+
+    def __init__(self, linea=None, columna=None):
+        self.linea = linea
+        self.columna = columna
+
+class Binaria(NodoAST):
+    __slots__ = ('operador', 'izquierda', 'derecha')
+    campos = ('operador', 'izquierda', 'derecha')
+
+    def __init__(self, operador, izquierda, derecha, linea=None, columna=None):
+        self.operador = operador  # Tipo de token del operador: 'suma', 'menorque', ...
+        self.izquierda = izquierda
+        self.derecha = derecha
+        self.linea = linea
+        self.columna = columna
+
+class Identificador(NodoAST):
+    __slots__ = ('nombre',)
+    campos = ('nombre',)
+
+    def __init__(self, nombre, linea=None, columna=None):
+        self.nombre = nombre
+        self.linea = linea
+        self.columna = columna
+
+class Literal(NodoAST):
+    __slots__ = ('valor', 'tipo')
+    campos = ('valor', 'tipo')
+
+    def __init__(self, valor, tipo, linea=None, columna=None):
+        self.valor = valor
+        self.tipo = tipo  # Tipo de token: 'nentero', 'nflotante', 'ncadena' o 'nbooleano'
+        self.linea = linea
+        self.columna = columna
+
+# Clase que reduce un AlmacenArbol del analizador LL(1) a nodos del AST.
+# Trabaja con los ids de nodo del almacén y recorre las cadenas recursivas por la derecha
+# con bucles, de modo que la profundidad solo depende del anidamiento de bloques y paréntesis.
+class _Reductor:
+    def __init__(self, arbol):
+        self.arbol = arbol
+
+    def tipo(self, nodo):
+        return self.arbol.nombres[self.arbol.simbolo[nodo]]
+
+    def hijos(self, nodo):
+        return self.arbol.hijos(nodo)
+
+    def posicion(self, nodo):
+        linea = self.arbol.linea[nodo]
+        posicion = self.arbol.posicion[nodo]
+        if posicion < 0:
+            return (linea if linea >= 0 else None), None
+        lineas = self.arbol.lineas
+        return (linea if linea >= 0 else None), (lineas.columna(posicion) if lineas is not None else posicion)
+
+    def valor(self, nodo):
+        return self.arbol.valores[self.arbol.valor[nodo]]
+
+    def programa(self, nodo):
+        # programaprincipal -> funcion opcionprincipal masfuncn ; masfuncn -> programaprincipal | e
+        funciones = []
+        while nodo is not None:
+            _, opcionprincipal, masfuncn = self.hijos(nodo)
+            funciones.append(self.funcion(self.hijos(opcionprincipal)[0]))
+            siguiente = self.hijos(masfuncn)[0]
+            nodo = siguiente if self.tipo(siguiente) == 'programaprincipal' else None
+        return Programa(funciones)
+
+    def funcion(self, nodo):
+        hijos = self.hijos(nodo)
+        if self.tipo(nodo) == 'restomain':
+            # restomain -> principal pabierto pcerrado tentero llaveabi masinstrucciones llavecerr
+            linea, columna = self.posicion(hijos[0])
+            return Funcion('main', [], 'tentero', self.instrucciones(hijos[5]), linea, columna)
+        # restofuncn -> id pabierto parametrosf pcerrado opciondato llaveabi masinstrucciones llavecerr
+        linea, columna = self.posicion(hijos[0])
+        opciondato = self.hijos(hijos[4])[0]
+        retorno = self.tipo(opciondato) if self.tipo(opciondato) == 'tvacio' else self.tipo(self.hijos(opciondato)[0])
+        return Funcion(self.valor(hijos[0]), self.parametros_funcion(hijos[2]), retorno,
+                       self.instrucciones(hijos[6]), linea, columna)
+
+    def parametros_funcion(self, nodo):
+        # parametrosf -> id tipodato masparametrosf | e ; masparametrosf -> coma parametrosf | e
+        parametros = []
+        while nodo is not None:
+            hijos = self.hijos(nodo)
+            if len(hijos) == 1:
+                break
+            nodo_id, tipodato, masparametrosf = hijos
+            linea, columna = self.posicion(nodo_id)
+            parametros.append(Parametro(self.valor(nodo_id), self.tipo(self.hijos(tipodato)[0]), linea, columna))
+            siguiente = self.hijos(masparametrosf)
+            nodo = siguiente[1] if len(siguiente) == 2 else None
+        return parametros
+
+    def instrucciones(self, nodo):
+        # masinstrucciones -> instruccion masinstrucciones | e
+        instrucciones = []
+        while True:
+            hijos = self.hijos(nodo)
+            if len(hijos) == 1:
+                return instrucciones
+            instrucciones.append(self.instruccion(hijos[0]))
+            nodo = hijos[1]
+
+    def instruccion(self, nodo):
+        hijos = self.hijos(nodo)
+        primero = hijos[0]
+        tipo = self.tipo(primero)
+        linea, columna = self.posicion(primero)
+        if tipo == 'asignaciones':
+            return self.asignaciones(primero)
+        if tipo == 'mostrar':
+            # mostrar -> imprimir pabierto comandos pcerrado ; comandos -> expresion mascomandos | e
+            imprimir, _, comandos, _ = self.hijos(primero)
+            linea, columna = self.posicion(imprimir)
+            hijos_comandos = self.hijos(comandos)
+            argumentos = [self.expresion(hijos_comandos[0])] if len(hijos_comandos) == 2 else []
+            return Mostrar(argumentos, linea, columna)
+        if tipo == 'buclepara':
+            # para pabierto asignaciones fsentencia expresion fsentencia asignaciones pcerrado llaveabi masinstrucciones llavecerr
+            partes = self.hijos(primero)
+            linea, columna = self.posicion(partes[0])
+            return Para(self.asignaciones(partes[2]), self.expresion(partes[4]), self.asignaciones(partes[6]),
+                        self.instrucciones(partes[9]), linea, columna)
+        if tipo == 'buclemientras':
+            # mientras pabierto expresion pcerrado llaveabi masinstrucciones llavecerr
+            partes = self.hijos(primero)
+            linea, columna = self.posicion(partes[0])
+            return Mientras(self.expresion(partes[2]), self.instrucciones(partes[5]), linea, columna)
+        if tipo == 'condicional':
+            return self.condicional(primero)
+        if tipo == 'detener':
+            return Detener(linea, columna)
+        if tipo == 'leer':
+            # leer pabierto id pcerrado fsentencia
+            return Leer(self.valor(hijos[2]), *self.posicion(hijos[2]))
+        # devolver expresion fsentencia
+        return Devolver(self.expresion(hijos[1]), linea, columna)
+
+    def condicional(self, nodo):
+        # si pabierto expresion pcerrado llaveabi masinstrucciones llavecerr posibilidad
+        partes = self.hijos(nodo)
+        linea, columna = self.posicion(partes[0])
+        ramas = [(self.expresion(partes[2]), self.instrucciones(partes[5]))]
+        sino = None
+        posibilidad = partes[7]
+        while True:
+            partes = self.hijos(posibilidad)
+            tipo = self.tipo(partes[0])
+            if tipo == 'sino':
+                # sino pabierto expresion pcerrado llaveabi masinstrucciones llavecerr posibilidad
+                ramas.append((self.expresion(partes[2]), self.instrucciones(partes[5])))
+                posibilidad = partes[7]
+                continue
+            if tipo == 'entonces':
+                # entonces llaveabi masinstrucciones llavecerr
+                sino = self.instrucciones(partes[2])
+            return Si(ramas, sino, linea, columna)
+
+    def asignaciones(self, nodo):
+        # asignaciones -> id ext ; ext -> tipodato opcionesasig | extension
+        nodo_id, ext = self.hijos(nodo)
+        nombre = self.valor(nodo_id)
+        linea, columna = self.posicion(nodo_id)
+        primero = self.hijos(ext)[0]
+        if self.tipo(primero) == 'tipodato':
+            # opcionesasig -> igual expresion | e
+            opcionesasig = self.hijos(ext)[1]
+            hijos = self.hijos(opcionesasig)
+            valor = self.expresion(hijos[1]) if len(hijos) == 2 else None
+            return Declaracion(nombre, self.tipo(self.hijos(primero)[0]), valor, linea, columna)
+        # extension -> igual expresion | pabierto parametros pcerrado
+        hijos = self.hijos(primero)
+        if self.tipo(hijos[0]) == 'igual':
+            return Asignacion(nombre, self.expresion(hijos[1]), linea, columna)
+        return Llamada(nombre, self.argumentos(hijos[1]), linea, columna)
+
+    def argumentos(self, nodo):
+        # parametros -> expresion restoparametros | e ; restoparametros -> coma expresion restoparametros | e
+        argumentos = []
+        hijos = self.hijos(nodo)
+        if len(hijos) == 1:
+            return argumentos
+        argumentos.append(self.expresion(hijos[0]))
+        resto = self.hijos(hijos[1])
+        while len(resto) == 3:
+            argumentos.append(self.expresion(resto[1]))
+            resto = self.hijos(resto[2])
+        return argumentos
+
+    def expresion(self, nodo):
+        # La gramática encadena las operaciones por la derecha sin precedencia:
+        # expresion -> primario masexpresiones ; masexpresiones -> operacion expresion | e.
+        # Se recogen operandos y operadores en orden y se agrupan según PRECEDENCIA.
+        operandos = []
+        operadores = []
+        while True:
+            hijos = self.hijos(nodo)
+            tipo = self.tipo(hijos[0])
+            if tipo == 'pabierto':
+                # pabierto expresion pcerrado masexpresiones
+                operandos.append(self.expresion(hijos[1]))
+                masexpresiones = hijos[3]
+            elif tipo == 'id':
+                # id opciones masexpresiones ; opciones -> pabierto parametros pcerrado | e
+                linea, columna = self.posicion(hijos[0])
+                opciones = self.hijos(hijos[1])
+                if len(opciones) == 3:
+                    operandos.append(Llamada(self.valor(hijos[0]), self.argumentos(opciones[1]), linea, columna))
+                else:
+                    operandos.append(Identificador(self.valor(hijos[0]), linea, columna))
+                masexpresiones = hijos[2]
+            else:
+                # valordato masexpresiones
+                dato = self.hijos(hijos[0])[0]
+                operandos.append(Literal(self.valor(dato), self.tipo(dato), *self.posicion(dato)))
+                masexpresiones = hijos[1]
+            siguiente = self.hijos(masexpresiones)
+            if len(siguiente) == 1:
+                break
+            operador = self.hijos(siguiente[0])[0]
+            operadores.append((self.tipo(operador), *self.posicion(operador)))
+            nodo = siguiente[1]
+        return agrupar_operaciones(operandos, operadores)
+
+# Función que agrupa una secuencia plana de operandos y operadores según su precedencia.
+def agrupar_operaciones(operandos, operadores):
+    salida = [operandos[0]]
+    pendientes = []
+    for (operador, linea, columna), operando in zip(operadores, operandos[1:]):
+        while pendientes and PRECEDENCIA[pendientes[-1][0]] >= PRECEDENCIA[operador]:
+            _reducir(salida, pendientes.pop())
+        pendientes.append((operador, linea, columna))
+        salida.append(operando)
+    while pendientes:
+        _reducir(salida, pendientes.pop())
+    return salida[0]
+
+def _reducir(salida, operador):
+    derecha = salida.pop()
+    izquierda = salida.pop()
+    salida.append(Binaria(operador[0], izquierda, derecha, operador[1], operador[2]))
+
+# Función que reduce el árbol sintáctico (su nodo raíz) a un AST.
+def reducir_arbol(raiz):
+    return _Reductor(raiz.arbol).programa(raiz.id)
+
+# Función que cuenta los nodos de un AST.
+def contar_nodos(nodo):
+    cantidad = 0
+    pendientes = [nodo]
+    while pendientes:
+        actual = pendientes.pop()
+        cantidad += 1
+        pendientes.extend(actual.hijos())
+    return cantidad
@@ -0,0 +1,533 @@
+import re
+from array import array
+
+from arbol_abstracto import Asignacion
+from arbol_abstracto import Binaria
+from arbol_abstracto import Declaracion
+from arbol_abstracto import Detener
+from arbol_abstracto import Devolver
+from arbol_abstracto import Identificador
+from arbol_abstracto import Leer
+from arbol_abstracto import Literal
+from arbol_abstracto import Llamada
+from arbol_abstracto import Mientras
+from arbol_abstracto import Mostrar
+from arbol_abstracto import Para
+from arbol_abstracto import Si
+from compilacion import compile_source
+from sintactico import ErrorSemantico
+
+# Generador de bytecode para la máquina virtual de pila (ver maquina_virtual.py) a partir del AST.
+# Cada instrucción ocupa dos enteros, el código de operación y su argumento, así el código de una
+# función es un array('i') plano. Las variables locales son índices (slots) en el marco de la función:
+# primero los parámetros y las variables del cuerpo en el orden de su ámbito en la TablaSimbolos,
+# luego las que se declaran dentro de bloques, que la tabla no registra.
+
+# Códigos de operación. Los argumentos que empaquetan dos valores guardan el primero en los 16 bits
+# bajos y el segundo en los altos; los saltos guardan el destino (posición en el código) en los 24 bits bajos.
+CARGAR_LOCAL = 0  # Apila el local arg
+CARGAR_CONST = 1  # Apila la constante arg del módulo
+GUARDAR_LOCAL = 2  # Desapila en el local arg
+SUMA = 3
+RESTA = 4
+MUL = 5
+DIV = 6
+RESIDUO = 7
+COMPARAR = 8  # Compara los dos valores del tope con el comparador arg
+SALTAR = 9
+SALTAR_SI_FALSO = 10  # Desapila y salta si el valor es falso
+SALTAR_SI_VERDADERO = 11
+SALTAR_SI_FALSO_O_SACAR = 12  # Para '&&': salta conservando el valor si es falso, si no lo desapila
+SALTAR_SI_VERDADERO_O_SACAR = 13  # Para '||'
+LLAMAR = 14  # Llama a la función arg con sus argumentos en el tope de la pila
+DEVOLVER = 15  # Termina la función y apila el valor del tope en el marco que la llamó
+SACAR = 16  # Descarta el tope (resultado de una llamada usada como instrucción)
+MOSTRAR = 17  # Escribe el tope sin salto de línea
+LEER = 18  # Lee una línea en el local arg >> 2 con la conversión arg & 3
+A_FLOTANTE = 19  # Convierte el tope a float si es un entero
+# Superinstrucciones que reemplazan secuencias frecuentes.
+CARGAR_LOCAL_CONST = 20  # CARGAR_LOCAL arg & 0xFFFF; CARGAR_CONST arg >> 16
+CARGAR_LOCAL_LOCAL = 21  # CARGAR_LOCAL arg & 0xFFFF; CARGAR_LOCAL arg >> 16
+INCREMENTAR = 22  # local = local + constante, con local arg & 0xFFFF y constante arg >> 16
+SALTAR_SI_NO = 23  # COMPARAR arg >> 24; SALTAR_SI_FALSO arg & 0xFFFFFF
+SALTAR_SI = 24  # COMPARAR arg >> 24; SALTAR_SI_VERDADERO arg & 0xFFFFFF
+
+NOMBRES_OPERACIONES = [
+    'CARGAR_LOCAL', 'CARGAR_CONST', 'GUARDAR_LOCAL', 'SUMA', 'RESTA', 'MUL', 'DIV', 'RESIDUO', 'COMPARAR',
+    'SALTAR', 'SALTAR_SI_FALSO', 'SALTAR_SI_VERDADERO', 'SALTAR_SI_FALSO_O_SACAR', 'SALTAR_SI_VERDADERO_O_SACAR',
+    'LLAMAR', 'DEVOLVER', 'SACAR', 'MOSTRAR', 'LEER', 'A_FLOTANTE', 'CARGAR_LOCAL_CONST', 'CARGAR_LOCAL_LOCAL',
+    'INCREMENTAR', 'SALTAR_SI_NO', 'SALTAR_SI',
+]
+
+# Operaciones cuyo argumento es el destino de un salto, y máscara del destino dentro del argumento.
+SALTOS = {SALTAR, SALTAR_SI_FALSO, SALTAR_SI_VERDADERO, SALTAR_SI_FALSO_O_SACAR, SALTAR_SI_VERDADERO_O_SACAR,
+          SALTAR_SI_NO, SALTAR_SI}
+MASCARA_DESTINO = 0xFFFFFF
+LIMITE_EMPAQUETADO = 1 << 15  # El argumento es un entero de 32 bits con signo
+LIMITE_SLOT_LECTURA = 1 << 29  # Slots que caben en el argumento de LEER junto a la conversión
+
+# Operadores aritméticos y comparadores (índice en COMPARADORES de maquina_virtual.py).
+ARITMETICOS = {'suma': SUMA, 'resta': RESTA, 'mul': MUL, 'div': DIV, 'residuo': RESIDUO}
+COMPARADORES = ['menorque', 'menorigualque', 'mayorque', 'mayorigualque', 'igualbool', 'diferentede']
+
+# Conversiones de read según el tipo del local (índice en CONVERSIONES_LECTURA de maquina_virtual.py).
+TIPOS_LECTURA = ['tentero', 'tflotante', 'tcadena', 'tbooleano']
+
+# Valor de una variable declarada sin valor inicial.
+VALORES_INICIALES = {'tentero': 0, 'tflotante': 0.0, 'tcadena': '', 'tbooleano': False}
+
+# Secuencias de escape que se reconocen en las cadenas (el léxico las deja tal como se escribieron).
+ESCAPES = {'n': '\n', 't': '\t', '\\': '\\'}
+PATRON_ESCAPE = re.compile(r'\\([nt\\])')
+
+# Clase con el bytecode de una función.
+class FuncionBytecode:
+    def __init__(self, nombre, num_parametros, codigo, lineas, iniciales, nombres_locales):
+        self.nombre = nombre
+        self.num_parametros = num_parametros
+        self.codigo = codigo  # array('i') con pares (operación, argumento)
+        self.lineas = lineas  # array('I') con la línea del código fuente de cada instrucción
+        self.iniciales = iniciales  # Valor inicial de cada local que no es parámetro
+        self.nombres_locales = nombres_locales  # Nombre de cada slot, para desensamblar
+
+    def __repr__(self):
+        return f"FuncionBytecode({self.nombre!r}, instrucciones={len(self.codigo) // 2})"
+
+# Clase con el bytecode de un programa: sus funciones y la tabla de constantes compartida.
+class ModuloBytecode:
+    def __init__(self):
+        self.funciones = []
+        self.indices = {}  # Nombre de la función -> índice en funciones
+        self.constantes = []
+        self.errores = []  # ErrorSemantico encontrados al generar el bytecode
+
+    def desensamblar(self):
+        """Retorna el bytecode en texto, una instrucción por línea."""
+        lineas = []
+        for funcion in self.funciones:
+            lineas.append(f"fn {funcion.nombre} (parámetros: {funcion.num_parametros}, locales: {len(funcion.nombres_locales)})")
+            codigo = funcion.codigo
+            for pc in range(0, len(codigo), 2):
+                operacion, argumento = codigo[pc], codigo[pc + 1]
+                lineas.append(f"  {pc:5} {NOMBRES_OPERACIONES[operacion]:<28}{self._describir(funcion, operacion, argumento)}")
+        return "\n".join(lineas)
+
+    def _describir(self, funcion, operacion, argumento):
+        bajo, alto = argumento & 0xFFFF, argumento >> 16
+        if operacion in (CARGAR_LOCAL, GUARDAR_LOCAL):
+            return funcion.nombres_locales[argumento]
+        if operacion == CARGAR_CONST:
+            return repr(self.constantes[argumento])
+        if operacion == CARGAR_LOCAL_LOCAL:
+            return f"{funcion.nombres_locales[bajo]}, {funcion.nombres_locales[alto]}"
+        if operacion in (CARGAR_LOCAL_CONST, INCREMENTAR):
+            return f"{funcion.nombres_locales[bajo]}, {self.constantes[alto]!r}"
+        if operacion == COMPARAR:
+            return COMPARADORES[argumento]
+        if operacion in (SALTAR_SI_NO, SALTAR_SI):
+            return f"{COMPARADORES[argumento >> 24]} -> {argumento & MASCARA_DESTINO}"
+        if operacion in SALTOS:
+            return f"-> {argumento}"
+        if operacion == LLAMAR:
+            return self.funciones[argumento].nombre
+        if operacion == LEER:
+            return f"{funcion.nombres_locales[argumento >> 2]} ({TIPOS_LECTURA[argumento & 3]})"
+        return ''
+
+# Clase con lo que comparten las funciones al generar un módulo: la tabla de constantes, el índice
+# y el número de parámetros de cada función y el ámbito de cada función en la tabla de símbolos.
+class _GeneradorModulo:
+    def __init__(self, tabla_simbolos, optimizar):
+        self.modulo = ModuloBytecode()
+        self.optimizar = optimizar
+        self.indices_constantes = {}
+        self.parametros = []
+        self.ambitos = {}
+        for ambito in tabla_simbolos.hijos:
+            self.ambitos.setdefault(ambito.nombre, ambito)
+
+    def error(self, mensaje, nodo=None):
+        linea, columna = (nodo.linea, nodo.columna) if nodo is not None else (None, None)
+        self.modulo.errores.append(ErrorSemantico(mensaje, linea, columna))
+
+    def constante(self, valor):
+        """Retorna el índice de la constante en la tabla del módulo, agregándola si hace falta."""
+        # El tipo forma parte de la clave para que 1, 1.0 y true no compartan constante.
+        clave = (type(valor), valor)
+        indice = self.indices_constantes.get(clave)
+        if indice is None:
+            indice = self.indices_constantes[clave] = len(self.modulo.constantes)
+            self.modulo.constantes.append(valor)
+        return indice
+
+    def generar(self, programa):
+        modulo = self.modulo
+        # Las funciones se numeran antes de generar, así una llamada puede nombrar una función posterior.
+        funciones = []
+        for funcion in programa.funciones:
+            if funcion.nombre in modulo.indices:
+                self.error(f"La función '{funcion.nombre}' ya fue declarada.", funcion)
+                continue
+            modulo.indices[funcion.nombre] = len(funciones)
+            self.parametros.append(len(funcion.parametros))
+            funciones.append(funcion)
+        if 'main' not in modulo.indices:
+            self.error("El programa no tiene función main.")
+        for funcion in funciones:
+            modulo.funciones.append(_GeneradorFuncion(self, funcion).generar())
+        return modulo
+
+# Clase que genera el bytecode de una función. Las etiquetas son destinos de salto que se resuelven
+# al terminar; con optimizar, cada instrucción nueva puede fusionarse con las anteriores en una
+# superinstrucción, salvo que en medio haya una etiqueta.
+class _GeneradorFuncion:
+    def __init__(self, generador, funcion):
+        self.generador = generador
+        self.funcion = funcion
+        self.optimizar = generador.optimizar
+        self.instrucciones = []  # Listas [operación, argumento]
+        self.lineas = []
+        self.linea = funcion.linea or 0
+        self.etiquetas = []  # Posición (índice de instrucción) de cada etiqueta, -1 si aún no se fija
+        self.ultima_etiqueta = -1  # Posición de la última etiqueta fijada
+        self.fines_bucles = []  # Etiqueta del final de cada bucle abierto, para stop
+        self.nombres = []  # Nombre de cada slot
+        self.tipos = []  # Tipo declarado de cada slot
+        # El primer bloque es el cuerpo: sus locales son los del ámbito de la función en la tabla de
+        # símbolos (parámetros y variables del cuerpo) y son visibles en toda la función.
+        cuerpo = {}
+        for parametro in funcion.parametros:
+            cuerpo.setdefault(parametro.nombre, self.nuevo_slot(parametro.nombre, parametro.tipo))
+        ambito = generador.ambitos.get(funcion.nombre)
+        for nombre, atributos in (ambito.simbolos.items() if ambito is not None else ()):
+            if nombre not in cuerpo:
+                cuerpo[nombre] = self.nuevo_slot(nombre, atributos['tipo'])
+        self.bloques = [cuerpo]  # Pila de bloques: nombre -> slot declarado en el bloque
+        self.declaradas_cuerpo = {parametro.nombre for parametro in funcion.parametros}
+
+    def nuevo_slot(self, nombre, tipo):
+        self.nombres.append(nombre)
+        self.tipos.append(tipo)
+        return len(self.tipos) - 1
+
+    def error(self, mensaje, nodo):
+        self.generador.error(mensaje, nodo)
+
+    def etiqueta(self):
+        self.etiquetas.append(-1)
+        return len(self.etiquetas) - 1
+
+    def fijar(self, etiqueta):
+        posicion = len(self.instrucciones)
+        self.etiquetas[etiqueta] = posicion
+        self.ultima_etiqueta = posicion
+
+    def emitir(self, operacion, argumento=0):
+        instrucciones = self.instrucciones
+        if self.optimizar and instrucciones and self.ultima_etiqueta < len(instrucciones):
+            if self._fusionar(operacion, argumento):
+                return
+        instrucciones.append([operacion, argumento])
+        self.lineas.append(self.linea)
+
+    def _fusionar(self, operacion, argumento):
+        """Intenta reemplazar la última instrucción (o las dos últimas) por una superinstrucción."""
+        instrucciones = self.instrucciones
+        anterior = instrucciones[-1]
+        if operacion in (CARGAR_CONST, CARGAR_LOCAL) and anterior[0] == CARGAR_LOCAL:
+            if anterior[1] < LIMITE_EMPAQUETADO and argumento < LIMITE_EMPAQUETADO:
+                anterior[0] = CARGAR_LOCAL_CONST if operacion == CARGAR_CONST else CARGAR_LOCAL_LOCAL
+                anterior[1] |= argumento << 16
+                return True
+        elif operacion in (SALTAR_SI_FALSO, SALTAR_SI_VERDADERO) and anterior[0] == COMPARAR \
+                and argumento <= MASCARA_DESTINO:
+            # Hasta resolver los saltos, el argumento guarda la etiqueta en lugar del destino.
+            anterior[0] = SALTAR_SI_NO if operacion == SALTAR_SI_FALSO else SALTAR_SI
+            anterior[1] = (anterior[1] << 24) | argumento
+            return True
+        elif operacion == GUARDAR_LOCAL and anterior[0] == SUMA and len(instrucciones) >= 2 \
+                and self.ultima_etiqueta < len(instrucciones) - 1:
+            # local = local + constante numérica
+            carga = instrucciones[-2]
+            if carga[0] == CARGAR_LOCAL_CONST and carga[1] & 0xFFFF == argumento:
+                if type(self.generador.modulo.constantes[carga[1] >> 16]) in (int, float):
+                    carga[0] = INCREMENTAR
+                    instrucciones.pop()
+                    self.lineas.pop()
+                    return True
+        return False
+
+    def ubicar_etiquetas(self):
+        """Retorna el destino (posición en el código) de cada etiqueta y las instrucciones de salto
+        fusionadas que deben separarse porque su destino no cabe en MASCARA_DESTINO."""
+        instrucciones = self.instrucciones
+        # Si el final de la función cabe en 24 bits, cabe cualquier destino.
+        if len(instrucciones) * 2 <= MASCARA_DESTINO:
+            return [posicion * 2 for posicion in self.etiquetas], set()
+        # Separar un salto lo convierte en dos instrucciones y mueve las que siguen, así que se
+        # repite hasta que todos los saltos fusionados que quedan tienen un destino que cabe.
+        separadas = set()
+        while True:
+            posiciones = []
+            posicion = 0
+            for indice in range(len(instrucciones)):
+                posiciones.append(posicion)
+                posicion += 2 if indice in separadas else 1
+            posiciones.append(posicion)
+            destinos = [posiciones[etiqueta] * 2 for etiqueta in self.etiquetas]
+            nuevas = {indice for indice, (operacion, argumento) in enumerate(instrucciones)
+                      if operacion in (SALTAR_SI_NO, SALTAR_SI) and indice not in separadas
+                      and destinos[argumento & MASCARA_DESTINO] > MASCARA_DESTINO}
+            if not nuevas:
+                return destinos, separadas
+            separadas |= nuevas
+
+    def terminar(self):
+        """Resuelve los saltos y retorna la FuncionBytecode."""
+        destinos, separadas = self.ubicar_etiquetas()
+        codigo = array('i')
+        lineas = array('I')
+        for indice, (operacion, argumento) in enumerate(self.instrucciones):
+            linea = self.lineas[indice]
+            if operacion in (SALTAR_SI_NO, SALTAR_SI):
+                destino = destinos[argumento & MASCARA_DESTINO]
+                if indice in separadas:
+                    codigo.append(COMPARAR)
+                    codigo.append(argumento >> 24)
+                    lineas.append(linea)
+                    operacion = SALTAR_SI_FALSO if operacion == SALTAR_SI_NO else SALTAR_SI_VERDADERO
+                    argumento = destino
+                else:
+                    argumento = (argumento & ~MASCARA_DESTINO) | destino
+            elif operacion in SALTOS:
+                argumento = destinos[argumento]
+            codigo.append(operacion)
+            codigo.append(argumento)
+            lineas.append(linea)
+        num_parametros = len(self.funcion.parametros)
+        iniciales = [VALORES_INICIALES.get(tipo) for tipo in self.tipos[num_parametros:]]
+        return FuncionBytecode(self.funcion.nombre, num_parametros, codigo, lineas, iniciales, self.nombres)
+
+    # Generación de las instrucciones.
+
+    def generar(self):
+        funcion = self.funcion
+        # Los parámetros float reciben enteros convertidos, igual que una asignación.
+        for parametro in funcion.parametros:
+            if parametro.tipo == 'tflotante':
+                slot = self.bloques[0][parametro.nombre]
+                self.emitir(CARGAR_LOCAL, slot)
+                self.guardar(slot)
+        self.bloque(funcion.cuerpo, nuevo=False)
+        # Una función que termina sin return devuelve None (void).
+        self.emitir(CARGAR_CONST, self.generador.constante(None))
+        self.emitir(DEVOLVER)
+        return self.terminar()
+
+    def bloque(self, instrucciones, nuevo=True):
+        if nuevo:
+            self.bloques.append({})
+        for instruccion in instrucciones:
+            self.instruccion(instruccion)
+        if nuevo:
+            self.bloques.pop()
+
+    def buscar(self, nombre):
+        for bloque in reversed(self.bloques):
+            if nombre in bloque:
+                return bloque[nombre]
+        return None
+
+    def instruccion(self, nodo):
+        if nodo.linea is not None:
+            self.linea = nodo.linea
+        tipo = type(nodo)
+        if tipo is Declaracion:
+            self.declaracion(nodo)
+        elif tipo is Asignacion:
+            slot = self.variable(nodo.nombre, nodo)
+            self.expresion(nodo.valor)
+            self.guardar(slot)
+        elif tipo is Llamada:
+            self.expresion(nodo)
+            self.emitir(SACAR)
+        elif tipo is Mostrar:
+            for argumento in nodo.argumentos:
+                self.expresion(argumento)
+                self.emitir(MOSTRAR)
+        elif tipo is Si:
+            self.condicional(nodo)
+        elif tipo is Mientras:
+            self.bucle(None, nodo.condicion, None, nodo.cuerpo)
+        elif tipo is Para:
+            # La variable que declara el for solo es visible dentro del bucle.
+            self.bloques.append({})
+            self.bucle(nodo.inicio, nodo.condicion, nodo.paso, nodo.cuerpo)
+            self.bloques.pop()
+        elif tipo is Devolver:
+            self.expresion(nodo.valor)
+            if self.funcion.retorno == 'tflotante':
+                self.emitir(A_FLOTANTE)
+            self.emitir(DEVOLVER)
+        elif tipo is Leer:
+            slot = self.variable(nodo.nombre, nodo)
+            if slot is not None:
+                tipo_local = self.tipos[slot]
+                conversion = TIPOS_LECTURA.index(tipo_local if tipo_local in TIPOS_LECTURA else 'tcadena')
+                if slot >= LIMITE_SLOT_LECTURA:
+                    self.error(f"La función '{self.funcion.nombre}' tiene demasiadas variables para leer '{nodo.nombre}'.", nodo)
+                else:
+                    self.emitir(LEER, (slot << 2) | conversion)
+        elif tipo is Detener:
+            if self.fines_bucles:
+                self.emitir(SALTAR, self.fines_bucles[-1])
+            else:
+                self.error("La instrucción stop solo puede usarse dentro de un bucle.", nodo)
+
+    def declaracion(self, nodo):
+        en_cuerpo = len(self.bloques) == 1
+        if en_cuerpo:
+            # Las variables del cuerpo ya tienen slot desde la tabla de símbolos.
+            if nodo.nombre in self.declaradas_cuerpo:
+                self.error(f"La variable '{nodo.nombre}' ya fue declarada.", nodo)
+            self.declaradas_cuerpo.add(nodo.nombre)
+            slot = self.bloques[0].get(nodo.nombre)
+            if slot is None:
+                slot = self.bloques[0][nodo.nombre] = self.nuevo_slot(nodo.nombre, nodo.tipo)
+        else:
+            if nodo.nombre in self.bloques[-1]:
+                self.error(f"La variable '{nodo.nombre}' ya fue declarada.", nodo)
+            slot = self.nuevo_slot(nodo.nombre, nodo.tipo)
+        if nodo.valor is not None:
+            self.expresion(nodo.valor)
+        else:
+            self.emitir(CARGAR_CONST, self.generador.constante(VALORES_INICIALES.get(nodo.tipo)))
+        # La variable de un bloque es visible desde después de su valor inicial.
+        self.bloques[-1][nodo.nombre] = slot
+        self.guardar(slot)
+
+    def guardar(self, slot):
+        if slot is None:
+            return
+        if self.tipos[slot] == 'tflotante':
+            self.emitir(A_FLOTANTE)
+        self.emitir(GUARDAR_LOCAL, slot)
+
+    def variable(self, nombre, nodo):
+        slot = self.buscar(nombre)
+        if slot is None:
+            self.error(f"La variable '{nombre}' no está declarada en la línea {nodo.linea}, columna {nodo.columna}", nodo)
+        return slot
+
+    def condicional(self, nodo):
+        fin = self.etiqueta()
+        for indice, (condicion, cuerpo) in enumerate(nodo.ramas):
+            siguiente = self.etiqueta()
+            self.expresion(condicion)
+            self.emitir(SALTAR_SI_FALSO, siguiente)
+            self.bloque(cuerpo)
+            if nodo.sino is not None or indice < len(nodo.ramas) - 1:
+                self.emitir(SALTAR, fin)
+            self.fijar(siguiente)
+        if nodo.sino is not None:
+            self.bloque(nodo.sino)
+        self.fijar(fin)
+
+    def bucle(self, inicio, condicion, paso, cuerpo):
+        # La condición va al final del bucle: cada vuelta hace un solo salto, el condicional.
+        if inicio is not None:
+            self.instruccion(inicio)
+        verificar = self.etiqueta()
+        repetir = self.etiqueta()
+        fin = self.etiqueta()
+        self.emitir(SALTAR, verificar)
+        self.fijar(repetir)
+        self.fines_bucles.append(fin)
+        self.bloque(cuerpo)
+        self.fines_bucles.pop()
+        if paso is not None:
+            self.instruccion(paso)
+        self.fijar(verificar)
+        self.expresion(condicion)
+        self.emitir(SALTAR_SI_VERDADERO, repetir)
+        self.fijar(fin)
+
+    def expresion(self, nodo):
+        # Recorrido en postorden con pila explícita: las expresiones largas forman cadenas de Binaria
+        # tan profundas como operadores tengan. Las tuplas de la pila son acciones pendientes.
+        pendientes = [nodo]
+        while pendientes:
+            actual = pendientes.pop()
+            tipo = type(actual)
+            if tipo is tuple:
+                if actual[0] == 'emitir':
+                    _, self.linea, operacion, argumento = actual
+                    self.emitir(operacion, argumento)
+                elif actual[0] == 'etiqueta':
+                    self.fijar(actual[1])
+                else:
+                    self.llamar(actual[1])
+            elif tipo is Binaria:
+                linea = actual.linea if actual.linea is not None else self.linea
+                operador = actual.operador
+                if operador == 'y' or operador == 'o':
+                    fin = self.etiqueta()
+                    salto = SALTAR_SI_FALSO_O_SACAR if operador == 'y' else SALTAR_SI_VERDADERO_O_SACAR
+                    pendientes += [('etiqueta', fin), actual.derecha, ('emitir', linea, salto, fin), actual.izquierda]
+                elif operador in ARITMETICOS:
+                    pendientes += [('emitir', linea, ARITMETICOS[operador], 0), actual.derecha, actual.izquierda]
+                else:
+                    comparador = COMPARADORES.index(operador)
+                    pendientes += [('emitir', linea, COMPARAR, comparador), actual.derecha, actual.izquierda]
+            elif tipo is Literal:
+                self.emitir(CARGAR_CONST, self.generador.constante(valor_literal(actual)))
+            elif tipo is Identificador:
+                slot = self.buscar(actual.nombre)
+                if slot is None:
+                    if actual.nombre in self.generador.modulo.indices:
+                        self.error(f"'{actual.nombre}' es una función y solo puede llamarse.", actual)
+                    else:
+                        self.variable(actual.nombre, actual)
+                    continue
+                self.emitir(CARGAR_LOCAL, slot)
+            elif tipo is Llamada:
+                pendientes.append(('llamar', actual))
+                pendientes.extend(reversed(actual.argumentos))
+
+    def llamar(self, nodo):
+        indice = self.generador.modulo.indices.get(nodo.nombre)
+        if indice is None:
+            self.error(f"La función '{nodo.nombre}' no está declarada.", nodo)
+            return
+        esperados = self.generador.parametros[indice]
+        if esperados != len(nodo.argumentos):
+            self.error(f"La función '{nodo.nombre}' espera {esperados} argumentos y recibió {len(nodo.argumentos)}.", nodo)
+        if nodo.linea is not None:
+            self.linea = nodo.linea
+        self.emitir(LLAMAR, indice)
+
+# Función que convierte el valor de un literal del AST al valor que usa la máquina virtual.
+def valor_literal(nodo):
+    if nodo.tipo == 'nbooleano':
+        return nodo.valor == 'true'
+    if nodo.tipo == 'ncadena':
+        return PATRON_ESCAPE.sub(lambda escape: ESCAPES[escape.group(1)], nodo.valor)
+    return nodo.valor
+
+# Función que genera el bytecode de un programa a partir de su AST y su tabla de símbolos.
+# Los errores (variables o funciones no declaradas, número de argumentos, stop fuera de un bucle)
+# quedan en modulo.errores; el módulo solo puede ejecutarse si no hay ninguno.
+# Con optimizar=False no se forman superinstrucciones (sirve para medir su efecto).
+def generar_bytecode(programa, tabla_simbolos, optimizar=True):
+    return _GeneradorModulo(tabla_simbolos, optimizar).generar(programa)
+
+# Función que compila un código FusionCod hasta el bytecode. Retorna el módulo (None si el código tiene
+# errores léxicos o sintácticos) y la lista de errores. Los errores semánticos de la TablaSimbolos no se
+# usan: la tabla no registra las variables declaradas dentro de bloques y el generador ya resuelve cada
+# nombre con su ámbito de bloque.
+def compilar_bytecode(texto, archivo=None, optimizar=True):
+    resultado = compile_source(texto, archivo, generar_ast=True)
+    if not resultado.sintaxis_valida or resultado.errores_lexicos:
+        return None, resultado.errores_lexicos + resultado.errores_sintacticos
+    modulo = generar_bytecode(resultado.ast, resultado.tabla_simbolos, optimizar)
+    return modulo, modulo.errores
@@ -0,0 +1,149 @@
+import glob
+import hashlib
+import io
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+
+from lexico import huella_especificacion
+from lexico import tokens
+from tabla_binaria import huella_gramatica
+
+# Caché en disco de los artefactos de compilación. Cada entrada es una carpeta nombrada con la clave
+# (sha256 del código, de la versión del compilador y de las opciones) que guarda archivos binarios:
+# resultados serializados con pickle y copias de los archivos de salida. La fecha de modificación
+# de la carpeta marca su último uso; al superar el tamaño máximo se borran las menos usadas.
+directorio = os.path.dirname(os.path.abspath(__file__))
+carpeta_cache = os.path.normpath(os.path.join(directorio, '..', '.cache-compilacion'))
+TAMAÑO_MAXIMO = 256 << 20  # Bytes que puede ocupar la caché
+
+# Versión del formato de las entradas; cambiarla invalida toda la caché.
+VERSION_CACHE = 1
+
+# Huella del compilador calculada una vez por proceso.
+_huella_compilador = None
+
+# Función que calcula la huella de todo lo que influye en los artefactos: el código del compilador,
+# las reglas léxicas y la gramática con la que se genera la tabla LL(1).
+def huella_compilador():
+    global _huella_compilador
+    if _huella_compilador is None:
+        resumen = hashlib.sha256(f"{VERSION_CACHE} {huella_especificacion()}".encode('utf-8'))
+        for ruta in sorted(glob.glob(os.path.join(directorio, '*.py'))):
+            if not os.path.basename(ruta).startswith('lextab_'):
+                with open(ruta, 'rb') as archivo:
+                    resumen.update(archivo.read())
+        ruta_gramatica = os.path.join(directorio, '..', 'gramatica', 'gramatica.txt')
+        if os.path.exists(ruta_gramatica):
+            resumen.update(huella_gramatica(ruta_gramatica, tokens).encode('ascii'))
+        _huella_compilador = resumen.hexdigest()
+    return _huella_compilador
+
+# Clase que administra las entradas de la caché en una carpeta.
+class CacheArtefactos:
+    def __init__(self, carpeta=None, tamaño_maximo=TAMAÑO_MAXIMO):
+        self.carpeta = carpeta or carpeta_cache
+        self.tamaño_maximo = tamaño_maximo
+        self.aciertos = 0
+        self.fallos = 0
+
+    def clave(self, codigo, **opciones):
+        """Retorna la clave de un código (texto, bytes o archivo mapeado) con las opciones indicadas."""
+        resumen = hashlib.sha256(huella_compilador().encode('ascii'))
+        resumen.update(repr(sorted(opciones.items())).encode('utf-8'))
+        resumen.update(codigo.encode('utf-8') if isinstance(codigo, str) else codigo)
+        return resumen.hexdigest()
+
+    def ruta(self, clave):
+        return os.path.join(self.carpeta, clave)
+
+    def obtener(self, clave):
+        """Retorna un diccionario nombre -> bytes con los artefactos de la entrada, o None si no está."""
+        ruta = self.ruta(clave)
+        try:
+            artefactos = {}
+            for nombre in os.listdir(ruta):
+                with open(os.path.join(ruta, nombre), 'rb') as archivo:
+                    artefactos[nombre] = archivo.read()
+            # Marcar la entrada como la más recientemente usada.
+            os.utime(ruta)
+        except OSError:
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        return artefactos
+
+    def guardar(self, clave, artefactos):
+        """Guarda una entrada con los artefactos (nombre -> bytes) y libera espacio si hace falta."""
+        try:
+            os.makedirs(self.carpeta, exist_ok=True)
+            # La entrada se escribe en una carpeta temporal y se renombra, así nunca queda a medias.
+            temporal = tempfile.mkdtemp(prefix='.tmp-', dir=self.carpeta)
+            for nombre, contenido in artefactos.items():
+                with open(os.path.join(temporal, nombre), 'wb') as archivo:
+                    archivo.write(contenido)
+            try:
+                os.rename(temporal, self.ruta(clave))
+            except OSError:
+                # Otro proceso guardó la misma entrada primero.
+                shutil.rmtree(temporal, ignore_errors=True)
+        except OSError as error:
+            print(f"Advertencia: no se pudo guardar en la caché: {error}", file=sys.stderr)
+            return
+        self.desalojar()
+
+    def desalojar(self):
+        """Borra las entradas menos usadas hasta que la caché quepa en el tamaño máximo."""
+        entradas = []
+        total = 0
+        for entrada in os.scandir(self.carpeta):
+            if not entrada.is_dir() or entrada.name.startswith('.tmp-'):
+                continue
+            tamaño = sum(archivo.stat().st_size for archivo in os.scandir(entrada.path))
+            entradas.append((entrada.stat().st_mtime, tamaño, entrada.path))
+            total += tamaño
+        entradas.sort()
+        # Se conserva siempre la entrada más reciente, aunque supere el tamaño máximo por sí sola.
+        for _, tamaño, ruta in entradas[:-1]:
+            if total <= self.tamaño_maximo:
+                break
+            shutil.rmtree(ruta, ignore_errors=True)
+            total -= tamaño
+
+    def limpiar(self):
+        """Borra toda la caché."""
+        shutil.rmtree(self.carpeta, ignore_errors=True)
+
+# Función que serializa un objeto para guardarlo en la caché; retorna None si no se puede.
+def serializar(objeto):
+    try:
+        return pickle.dumps(objeto, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        return None
+
+# Clase que escribe en dos flujos a la vez: la salida real y la copia que se guarda en la caché.
+class _Duplicador(io.TextIOBase):
+    def __init__(self, original, copia):
+        self.original = original
+        self.copia = copia
+
+    def write(self, texto):
+        self.copia.write(texto)
+        return self.original.write(texto)
+
+    def flush(self):
+        self.original.flush()
+
+# Contexto que copia en un StringIO todo lo que se imprime, sin dejar de mostrarlo.
+@contextmanager
+def capturar_salida():
+    copia = io.StringIO()
+    original = sys.stdout
+    sys.stdout = _Duplicador(original, copia)
+    try:
+        yield copia
+    finally:
+        sys.stdout = original
@@ -0,0 +1,74 @@
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+
+# Cliente del servidor de compilación (ver servidor.py). Solo usa la biblioteca estándar para que
+# arranque rápido: el lexer, la tabla LL(1) y la gramática viven en el servidor.
+# El protocolo es un objeto JSON por línea en cada sentido: la petición lleva 'archivo' (ruta) o
+# 'codigo' (texto) y la respuesta trae los tokens (cada uno como [tipo, valor, linea, columna]),
+# los errores y la tabla de símbolos.
+RUTA_SOCKET = os.path.join(tempfile.gettempdir(), f"fusioncod-{os.getuid()}.sock")
+
+# Clase que mantiene una conexión con el servidor y envía peticiones por ella.
+class ClienteCompilacion:
+    def __init__(self, ruta_socket=RUTA_SOCKET):
+        self.conexion = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.conexion.connect(ruta_socket)
+        self.lector = self.conexion.makefile('r', encoding='utf-8')
+
+    def enviar(self, peticion):
+        """Envía una petición (diccionario) y retorna la respuesta del servidor."""
+        self.conexion.sendall(json.dumps(peticion, ensure_ascii=False).encode('utf-8') + b'\n')
+        linea = self.lector.readline()
+        if not linea:
+            raise ConnectionError("el servidor cerró la conexión")
+        return json.loads(linea)
+
+    def compilar_archivo(self, ruta, tokens=True):
+        # El servidor puede tener otro directorio de trabajo, así que la ruta se envía absoluta.
+        return self.enviar({'archivo': os.path.abspath(ruta), 'tokens': tokens})
+
+    def compilar_codigo(self, codigo, tokens=True):
+        return self.enviar({'codigo': codigo, 'tokens': tokens})
+
+    def cerrar(self):
+        self.lector.close()
+        self.conexion.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Compila códigos FusionCod con el servidor de compilación.")
+    parser.add_argument('archivos', nargs='*', help="Rutas de los códigos a compilar ('-' lee el código de la entrada estándar)")
+    parser.add_argument('--socket', dest='ruta_socket', default=RUTA_SOCKET, help=f"Socket del servidor (por defecto {RUTA_SOCKET})")
+    parser.add_argument('--sin-tokens', dest='tokens', action='store_false', help="No incluir los tokens en la respuesta")
+    parser.add_argument('--detener', action='store_true', help="Pedir al servidor que termine")
+    opciones = parser.parse_args(argumentos)
+
+    try:
+        cliente = ClienteCompilacion(opciones.ruta_socket)
+    except OSError as error:
+        print(f"No se pudo conectar con el servidor en {opciones.ruta_socket}: {error}", file=sys.stderr)
+        return 2
+    exito = True
+    with cliente:
+        for ruta in opciones.archivos:
+            if ruta == '-':
+                respuesta = cliente.compilar_codigo(sys.stdin.read(), opciones.tokens)
+            else:
+                respuesta = cliente.compilar_archivo(ruta, opciones.tokens)
+            exito = exito and respuesta.get('exito', False)
+            print(json.dumps(respuesta, ensure_ascii=False))
+        if opciones.detener:
+            cliente.enviar({'orden': 'detener'})
+    return 0 if exito else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+import os
+import pickle
+
+from acciones_semanticas import AnalisisSemanticoFusionado
+from arbol_abstracto import reducir_arbol
+from cache import serializar
+from lexico import generar_tokens
+from lexico import mapear_archivo
+from sintactico import TablaSimbolos
+from sintactico import analizador_sintactico
+from sintactico import construir_tabla_simbolos
+from sintactico import obtener_tabla_ll1
+from sintactico import verificar_variable
+
+# Tamaño desde el que compile_file analiza el archivo mapeado en memoria y por bloques, sin leerlo completo.
+TAMAÑO_MAPEO = 8 << 20
+
+# Clase que reúne el resultado de compilar un código fuente.
+class ResultadoCompilacion:
+    def __init__(self, archivo=None):
+        self.archivo = archivo  # Ruta del código compilado, None si se compiló un texto
+        self.tokens = None  # Lista de tokens, solo si se pidió conservarlos
+        self.sintaxis_valida = False  # El análisis sintáctico aceptó el código
+        self.arbol = None  # Raíz del árbol sintáctico si el análisis sintáctico fue exitoso y se construyó
+        self.ast = None  # Árbol de sintaxis abstracta, solo si se pidió generarlo
+        self.tabla_simbolos = None
+        self.errores_lexicos = []
+        self.errores_sintacticos = []
+        self.errores_semanticos = []
+
+    @property
+    def exito(self):
+        return self.sintaxis_valida and not self.errores
+
+    @property
+    def errores(self):
+        return self.errores_lexicos + self.errores_sintacticos + self.errores_semanticos
+
+    def __repr__(self):
+        return f"ResultadoCompilacion(archivo={self.archivo!r}, exito={self.exito}, errores={len(self.errores)})"
+
+    def a_diccionario(self):
+        """Retorna los tokens, los errores y la tabla de símbolos como diccionarios y listas (para JSON)."""
+        # Cada token es una lista [tipo, valor, linea, columna]: ocupa bastante menos que un diccionario
+        # en programas con cientos de miles de tokens.
+        tokens = None
+        if self.tokens is not None:
+            tokens = [[token.tipo, token.valor, token.linea, token.columna] for token in self.tokens]
+        return {
+            'archivo': self.archivo,
+            'exito': self.exito,
+            'sintaxis_valida': self.sintaxis_valida,
+            'tokens': tokens,
+            'errores': {
+                'lexicos': [error.a_diccionario() for error in self.errores_lexicos],
+                'sintacticos': [error.a_diccionario() for error in self.errores_sintacticos],
+                'semanticos': [error.a_diccionario() for error in self.errores_semanticos],
+            },
+            'tabla_simbolos': self.tabla_simbolos.a_diccionario() if self.tabla_simbolos is not None else None,
+        }
+
+# Función que compila un texto FusionCod sin imprimir ni escribir archivos.
+# El lexer y la tabla LL(1) se construyen una vez y se reutilizan en cada llamada.
+# Con fusionado=True la tabla de símbolos y la verificación de variables se hacen durante el parseo,
+# en una sola pasada; con construir_arbol=False además no se construye el árbol sintáctico
+# (implica fusionado, y el AST no se puede generar).
+# texto también puede ser el contenido UTF-8 en bytes o un archivo mapeado (ver mapear_archivo).
+# Con una CacheArtefactos (ver cache.py) el resultado de un código ya compilado con las mismas opciones
+# se lee de disco en lugar de volver a analizarlo.
+def compile_source(texto, archivo=None, conservar_tokens=False, generar_ast=False, fusionado=False, construir_arbol=True,
+                   cache=None):
+    if cache is None:
+        return _compilar(texto, archivo, conservar_tokens, generar_ast, fusionado, construir_arbol)
+    clave = cache.clave(texto, conservar_tokens=conservar_tokens, generar_ast=generar_ast, fusionado=fusionado,
+                        construir_arbol=construir_arbol)
+    artefactos = cache.obtener(clave)
+    if artefactos is not None and 'resultado.pickle' in artefactos:
+        try:
+            resultado = pickle.loads(artefactos['resultado.pickle'])
+            resultado.archivo = archivo
+            return resultado
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError):
+            pass  # Entrada dañada o de otra versión: se vuelve a compilar y se reemplaza.
+    resultado = _compilar(texto, archivo, conservar_tokens, generar_ast, fusionado, construir_arbol)
+    # Un solo pickle con los tokens, el árbol, el AST, la tabla de símbolos y los errores conserva las
+    # referencias compartidas entre ellos (por ejemplo, el índice de líneas).
+    datos = serializar(resultado)
+    if datos is not None:
+        cache.guardar(clave, {'resultado.pickle': datos})
+    return resultado
+
+# Función que hace la compilación de compile_source, sin caché.
+def _compilar(texto, archivo, conservar_tokens, generar_ast, fusionado, construir_arbol):
+    resultado = ResultadoCompilacion(archivo)
+    flujo_de_tokens = generar_tokens(texto, resultado.errores_lexicos)
+    if conservar_tokens:
+        resultado.tokens = []
+        flujo_de_tokens = _conservar(flujo_de_tokens, resultado.tokens)
+
+    tabla_ll1 = obtener_tabla_ll1()
+    semantico = AnalisisSemanticoFusionado(tabla_ll1) if fusionado or not construir_arbol else None
+    respuesta, arbol, errores_sintacticos = analizador_sintactico(flujo_de_tokens, tabla_ll1, semantico, construir_arbol)
+    resultado.errores_sintacticos = errores_sintacticos
+    if not respuesta:
+        # El parser se detiene en el primer error; el resto del flujo se consume para reportar
+        # también los errores léxicos que hay después, como cuando se tokenizaba todo el código primero.
+        for _ in flujo_de_tokens:
+            pass
+    # Igual que el script, el análisis semántico solo se hace si el léxico y el sintáctico son correctos.
+    if not respuesta or resultado.errores_lexicos:
+        return resultado
+
+    resultado.sintaxis_valida = True
+    resultado.arbol = arbol
+    if semantico is not None:
+        resultado.tabla_simbolos = semantico.finalizar()
+    else:
+        resultado.tabla_simbolos = TablaSimbolos()
+        construir_tabla_simbolos(arbol, resultado.tabla_simbolos)
+        verificar_variable(arbol, resultado.tabla_simbolos)
+    resultado.errores_semanticos = resultado.tabla_simbolos.errores
+    if generar_ast and arbol is not None:
+        resultado.ast = reducir_arbol(arbol)
+    return resultado
+
+# Función que compila un archivo FusionCod; los errores de lectura se propagan al llamador.
+# Los archivos grandes se mapean en memoria y el léxico los analiza por bloques.
+def compile_file(ruta, conservar_tokens=False, generar_ast=False, fusionado=False, construir_arbol=True, cache=None):
+    if os.path.getsize(ruta) >= TAMAÑO_MAPEO:
+        with mapear_archivo(ruta) as datos:
+            return compile_source(datos, os.fspath(ruta), conservar_tokens, generar_ast, fusionado, construir_arbol, cache)
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        texto = archivo.read()
+    return compile_source(texto, os.fspath(ruta), conservar_tokens, generar_ast, fusionado, construir_arbol, cache)
+
+# Generador que guarda en una lista los tokens que van pasando por el flujo.
+def _conservar(flujo_de_tokens, lista_de_tokens):
+    for token in flujo_de_tokens:
+        lista_de_tokens.append(token)
+        yield token
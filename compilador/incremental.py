@@ -0,0 +1,267 @@
+import copy
+
+from acciones_semanticas import AnalisisSemanticoFusionado
+from compilacion import ResultadoCompilacion
+from lexico import BufferTokens
+from lexico import IndiceLineas
+from lexico import Token
+from lexico import generar_tokens_desde
+from lexico import palabras_reservadas
+from sintactico import ErrorSemantico
+from sintactico import TablaSimbolos
+from sintactico import analizador_sintactico
+from sintactico import obtener_tabla_ll1
+
+# Análisis incremental de un código FusionCod, para editores que lo revisan en cada cambio.
+# El código se divide en segmentos, uno por función de primer nivel: desde su 'fn' hasta el 'fn'
+# siguiente (el primero empieza en el inicio del código). Cada segmento guarda sus tokens, su árbol,
+# su ámbito y sus errores con líneas y posiciones relativas al inicio de la línea donde empieza,
+# así un cambio en otra función solo desplaza su origen. Al editar, el léxico se repite desde el
+# segmento afectado hasta que un 'fn' vuelve a caer donde empieza un segmento posterior que el cambio
+# no tocó; desde ahí los tokens son los mismos. Solo los segmentos nuevos se analizan sintáctica y
+# semánticamente, cada uno como un programa de una sola función con las acciones semánticas fusionadas.
+# El ámbito global y los identificadores que no son locales a su función se resuelven al armar el resultado.
+
+# Palabra reservada con la que empieza cada función.
+PALABRA_FUNCION = next(palabra for palabra, tipo in palabras_reservadas.items() if tipo == 'funcion')
+
+# Clase con el análisis de un segmento del código, en coordenadas relativas a su origen.
+class SegmentoFuncion:
+    def __init__(self, inicio, origen, linea):
+        self.inicio = inicio  # Posición donde empieza el segmento: su 'fn', o 0 en el primero
+        self.origen = origen  # Inicio de la línea de self.inicio; las posiciones del segmento son relativas a él
+        self.linea = linea  # Línea del código en la que está el origen, contada como la cuenta el léxico
+        self.tokens = None  # BufferTokens con líneas y posiciones relativas
+        self.errores_lexicos = []
+        self.comilla_sin_cierre = False  # Alguno de los errores léxicos es una comilla que no se cerró
+        self.sintaxis_valida = False
+        self.errores_sintacticos = []
+        self.arbol = None  # Árbol sintáctico del segmento como programa de una sola función
+        self.nombre = None  # Nombre de la función
+        self.atributos = None  # Atributos de la función en el ámbito global
+        self.ambito = None  # Ámbito de la función
+        self.ambitos = []  # El ámbito de la función y sus descendientes, una vez incorporados a la tabla del documento
+        self.errores_declaracion = []  # Símbolos repetidos dentro de la función
+        self.usos_globales = []  # Tokens de los identificadores que no son locales a la función
+
+    def desplazar(self, caracteres, lineas):
+        self.inicio += caracteres
+        self.origen += caracteres
+        self.linea += lineas
+
+    def linea_absoluta(self, linea):
+        """Convierte una línea del segmento en la línea del código completo."""
+        return linea + self.linea - 1 if linea is not None else None
+
+    def __repr__(self):
+        return f"SegmentoFuncion(inicio={self.inicio}, linea={self.linea}, nombre={self.nombre!r})"
+
+# Clase que resuelve las columnas de posiciones del código completo con el índice de líneas de un segmento.
+class _IndiceDesplazado:
+    def __init__(self, lineas, origen):
+        self.lineas = lineas
+        self.origen = origen
+
+    def columna(self, posicion):
+        return self.lineas.columna(posicion - self.origen)
+
+# Clase que mantiene compilado un código mientras se edita.
+class CompilacionIncremental:
+    def __init__(self, texto='', archivo=None, construir_arbol=True):
+        self.texto = texto
+        self.archivo = archivo
+        self.construir_arbol = construir_arbol
+        # Tabla de símbolos del documento; la retorna resultado() y se actualiza con cada cambio.
+        self.tabla_simbolos = TablaSimbolos()
+        self.segmentos, _ = self._analizar_desde(0, 1, [])
+
+    def editar(self, desplazamiento, eliminados, insertado):
+        """Reemplaza eliminados caracteres desde desplazamiento por el texto insertado y vuelve a
+        analizar lo afectado. Retorna los segmentos que se analizaron de nuevo."""
+        if desplazamiento < 0 or eliminados < 0 or desplazamiento + eliminados > len(self.texto):
+            raise ValueError(f"El cambio ({desplazamiento}, {eliminados}) está fuera del código de {len(self.texto)} caracteres")
+        fin = desplazamiento + eliminados
+        self.texto = self.texto[:desplazamiento] + insertado + self.texto[fin:]
+
+        # Se analiza desde el segmento del carácter anterior al cambio, porque lo insertado puede
+        # unirse al último token de ese segmento.
+        primero = 0
+        while primero + 1 < len(self.segmentos) and self.segmentos[primero + 1].inicio < desplazamiento:
+            primero += 1
+        # Si el cambio toca el 'fn' del segmento o el carácter que lo sigue, puede dejar de ser un 'fn'
+        # y entonces sus tokens pertenecen al segmento anterior.
+        if primero > 0 and desplazamiento <= self.segmentos[primero].inicio + len(PALABRA_FUNCION):
+            primero -= 1
+        # Una comilla sin cierre es ilegal porque no hay otra después; si se inserta una, la comilla
+        # abre una cadena que puede cruzar segmentos.
+        if '"' in insertado:
+            for k in range(primero):
+                if self.segmentos[k].comilla_sin_cierre:
+                    primero = k
+                    break
+        # Los segmentos cuya línea de origen empieza después del cambio se pueden reutilizar desplazados.
+        # Sus líneas se corrigen al reutilizarlos, porque el léxico no cuenta los saltos dentro de las cadenas.
+        siguiente = primero + 1
+        while siguiente < len(self.segmentos) and self.segmentos[siguiente].origen <= fin:
+            siguiente += 1
+        posteriores = self.segmentos[siguiente:]
+        diferencia = len(insertado) - eliminados
+        for segmento in posteriores:
+            segmento.inicio += diferencia
+            segmento.origen += diferencia
+
+        anterior = self.segmentos[primero]
+        nuevos, reutilizados = self._analizar_desde(anterior.inicio, anterior.linea, posteriores)
+        self.segmentos[primero:] = nuevos + reutilizados
+        return nuevos
+
+    def _analizar_desde(self, inicio, linea, posteriores):
+        """Analiza el código desde inicio hasta que un 'fn' coincide con el inicio de uno de los
+        segmentos posteriores. Retorna los segmentos nuevos y los posteriores que se conservan."""
+        texto = self.texto
+        errores = []
+        partes = []  # (segmento, tokens) de cada segmento nuevo
+        segmento = SegmentoFuncion(inicio, texto.rfind('\n', 0, inicio) + 1, linea)
+        tokens_segmento = []
+        reutilizados = []
+        j = 0
+        for token in generar_tokens_desde(texto, inicio, linea, errores):
+            tipo, _, linea_token, posicion = token
+            if tipo == 'funcion' and tokens_segmento:
+                while j < len(posteriores) and posteriores[j].inicio < posicion:
+                    j += 1
+                if j < len(posteriores) and posteriores[j].inicio == posicion:
+                    reutilizados = posteriores[j:]
+                    diferencia_lineas = linea_token - posteriores[j].linea
+                    for reutilizado in reutilizados:
+                        reutilizado.desplazar(0, diferencia_lineas)
+                    break
+                partes.append((segmento, tokens_segmento))
+                segmento = SegmentoFuncion(posicion, texto.rfind('\n', 0, posicion) + 1, linea_token)
+                tokens_segmento = []
+            tokens_segmento.append(token)
+        partes.append((segmento, tokens_segmento))
+
+        # Los errores léxicos llegan en orden y pertenecen al último segmento que empieza antes de ellos.
+        errores_segmentos = [[] for _ in partes]
+        k = 0
+        for error in errores:
+            while k + 1 < len(partes) and partes[k + 1][0].inicio <= error.posicion:
+                k += 1
+            errores_segmentos[k].append(error)
+
+        fin = reutilizados[0].inicio if reutilizados else len(texto)
+        for k, (segmento, tokens_segmento) in enumerate(partes):
+            fin_segmento = partes[k + 1][0].inicio if k + 1 < len(partes) else fin
+            self._analizar_segmento(segmento, tokens_segmento, errores_segmentos[k], fin_segmento)
+        return [segmento for segmento, _ in partes], reutilizados
+
+    def _analizar_segmento(self, segmento, tokens_segmento, errores, fin):
+        """Pasa los tokens y errores del segmento a coordenadas relativas y lo analiza."""
+        origen = segmento.origen
+        lineas_antes = segmento.linea - 1
+        lineas = IndiceLineas()
+        lineas.extender(self.texto[segmento.inicio:fin], segmento.inicio - origen)
+        buffer = BufferTokens(lineas)
+        for tipo, valor, linea, posicion in tokens_segmento:
+            buffer.agregar(tipo, valor, linea - lineas_antes, posicion - origen)
+        segmento.comilla_sin_cierre = any(self.texto[error.posicion] == '"' for error in errores)
+        for error in errores:
+            error.linea -= lineas_antes
+            error.posicion -= origen
+            error.lineas = lineas
+        segmento.tokens = buffer
+        segmento.errores_lexicos = errores
+
+        tabla_ll1 = obtener_tabla_ll1()
+        semantico = AnalisisSemanticoFusionado(tabla_ll1, TablaSimbolos())
+        respuesta, arbol, errores_sintacticos = analizador_sintactico(buffer, tabla_ll1, semantico, self.construir_arbol)
+        segmento.sintaxis_valida = respuesta
+        segmento.errores_sintacticos = errores_sintacticos
+        segmento.arbol = arbol
+        if respuesta:
+            # Un segmento válido declara exactamente una función en su tabla.
+            tabla = semantico.tabla_simbolos
+            (segmento.nombre, segmento.atributos), = tabla.simbolos.items()
+            segmento.ambito = tabla.hijos[0]
+            segmento.errores_declaracion = tabla.errores
+            segmento.usos_globales = semantico.usos_globales
+
+    def resultado(self):
+        """Retorna un ResultadoCompilacion con los mismos errores y tabla de símbolos que compile_source,
+        salvo que los errores léxicos son siempre los de todo el código. Los árboles sintácticos quedan
+        en cada segmento, con sus líneas relativas."""
+        resultado = ResultadoCompilacion(self.archivo)
+        for segmento in self.segmentos:
+            if segmento.errores_lexicos:
+                resultado.errores_lexicos.extend(_trasladar(segmento, error) for error in segmento.errores_lexicos)
+        # Como en el análisis completo, solo se reportan los errores del primer segmento inválido.
+        for k, segmento in enumerate(self.segmentos):
+            if not segmento.sintaxis_valida:
+                siguiente = self.segmentos[k + 1] if k + 1 < len(self.segmentos) else None
+                resultado.errores_sintacticos = [_trasladar(segmento, error, siguiente) for error in segmento.errores_sintacticos]
+                return resultado
+        if resultado.errores_lexicos:
+            return resultado
+
+        resultado.sintaxis_valida = True
+        resultado.tabla_simbolos = self._actualizar_tabla()
+        resultado.errores_semanticos = resultado.tabla_simbolos.errores
+        return resultado
+
+    def _actualizar_tabla(self):
+        """Actualiza la tabla de símbolos del documento: rehace el ámbito global y sus errores, y solo
+        incorpora los ámbitos de las funciones analizadas desde la última vez."""
+        tabla = self.tabla_simbolos
+        simbolos = {}
+        errores = tabla.errores
+        errores.clear()
+        tabla.hijos = []
+        tabla.ambitos = [tabla]
+        for segmento in self.segmentos:
+            if segmento.nombre in simbolos:
+                # El mismo error que agregar_simbolo da a una función repetida.
+                errores.append(ErrorSemantico(f"La variable '{segmento.nombre}' ya fue declarada."))
+            else:
+                simbolos[segmento.nombre] = segmento.atributos
+            if segmento.errores_declaracion:
+                errores.extend(segmento.errores_declaracion)
+            if segmento.ambito.raiz is tabla:
+                tabla.hijos.append(segmento.ambito)
+                tabla.ambitos.extend(segmento.ambitos)
+            else:
+                adoptados = len(tabla.ambitos)
+                tabla.adoptar_ambito(segmento.ambito)
+                segmento.ambitos = tabla.ambitos[adoptados:]
+        tabla.simbolos = simbolos
+        tabla.enlaces = {nombre: [(0, atributos)] for nombre, atributos in simbolos.items()}
+        for segmento in self.segmentos:
+            if not segmento.usos_globales:
+                continue
+            for uso in segmento.usos_globales:
+                if uso.valor not in simbolos:
+                    linea, columna = segmento.linea_absoluta(uso.linea), uso.columna
+                    mensaje = f"La variable '{uso.valor}' no está declarada en la línea {linea}, columna {columna}"
+                    errores.append(ErrorSemantico(mensaje, linea, columna))
+        return tabla
+
+    def tokens(self):
+        """Genera los tokens de todo el código con sus líneas y posiciones en el código completo."""
+        for segmento in self.segmentos:
+            buffer = segmento.tokens
+            lineas = _IndiceDesplazado(buffer.lineas, segmento.origen)
+            for token in buffer:
+                yield Token(token.tipo, token.valor, segmento.linea_absoluta(token.linea), token.posicion + segmento.origen, lineas)
+
+# Función que copia un error de un segmento con la línea del código completo. Un error al final de un
+# segmento que no es el último se reporta en el 'fn' del siguiente, que es el token que encontraría
+# el análisis completo en lugar del fin del código.
+def _trasladar(segmento, error, siguiente=None):
+    trasladado = copy.copy(error)
+    if error.linea is None and siguiente is not None:
+        trasladado.linea = siguiente.linea
+        trasladado.posicion = siguiente.inicio - siguiente.origen + 1
+        trasladado.lineas = None
+    else:
+        trasladado.linea = segmento.linea_absoluta(error.linea)
+    return trasladado
@@ -1,44 +1,136 @@
 import os
+import codecs
+import hashlib
+import io
+import mmap
 import ply.lex as lex
+import re
 import sys
-
-from tabulate import tabulate
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from itertools import accumulate
 
 # Ingresar datos del boceto de código.
 directorio = os.path.dirname(__file__)
 archivo = 'verificarvariable.txt' # Ingresar el nombre del boceto.
-ruta_archivo = os.path.join(directorio, '..', 'codigos-bocetos', archivo)
+motor_lexico = 'ply' # Motor léxico por defecto: 'ply' o 'regex'.
+TAMAÑO_BLOQUE = 1 << 20 # Bytes que se decodifican y analizan de una vez al leer un archivo mapeado.
+
+# Clase que indexa los inicios de línea de un código fuente. Se construye una sola vez por código
+# y convierte una posición (desplazamiento en el texto) en su columna con una búsqueda binaria.
+class IndiceLineas:
+    def __init__(self, datos=''):
+        self.inicios = array('I', [0])  # Posición donde empieza cada línea
+        self.extender(datos, 0)
+
+    def extender(self, texto, desplazamiento):
+        """Agrega los inicios de línea de un fragmento del código que empieza en desplazamiento."""
+        inicios = accumulate((len(linea) + 1 for linea in texto.split('\n')[:-1]), initial=desplazamiento)
+        next(inicios)
+        self.inicios.extend(inicios)
+
+    def linea(self, posicion):
+        """Retorna la línea (desde 1) en la que está la posición."""
+        return bisect_right(self.inicios, posicion)
+
+    def columna(self, posicion):
+        """Retorna la columna (desde 1) de la posición dentro de su línea."""
+        return posicion - self.inicios[bisect_right(self.inicios, posicion) - 1] + 1
+
+    def linea_columna(self, posicion):
+        linea = bisect_right(self.inicios, posicion)
+        return linea, posicion - self.inicios[linea - 1] + 1
+
+# Clase base de lo que guarda una posición del código fuente. La columna real solo se calcula
+# cuando se pide, con el índice de líneas del código; sin índice, la posición se usa como columna.
+class ConPosicion:
+    @property
+    def columna(self):
+        if self.lineas is None or self.posicion is None:
+            return self.posicion
+        return self.lineas.columna(self.posicion)
 
 # Clase Token para realizar la tokenización usando ply.
-class Token:
-    def __init__(self, tipo, valor, linea, columna):
+class Token(ConPosicion):
+    def __init__(self, tipo, valor, linea, posicion, lineas=None):
         self.tipo = tipo
         self.valor = valor
         self.linea = linea
-        self.columna = columna
-    
+        self.posicion = posicion
+        self.lineas = lineas
+
     def __str__(self): return f"{self.tipo} {self.valor} {self.linea} {self.columna}"
     
     def __repr__(self): return self.__str__()
 
-# Clase para representar errores.
-class Error:
-    def __init__(self, mensaje, linea, columna):
+# Clase para representar errores. Con el índice lineas, columna es la posición en el código.
+class Error(ConPosicion):
+    def __init__(self, mensaje, linea, columna, lineas=None):
         self.mensaje = mensaje
         self.linea = linea
-        self.columna = columna
+        self.posicion = columna
+        self.lineas = lineas
 
     def __str__(self):
         return f"Error en la línea {self.linea}, columna {self.columna}: {self.mensaje}"
 
+    def a_diccionario(self):
+        return {'mensaje': self.mensaje, 'linea': self.linea, 'columna': self.columna, 'texto': str(self)}
+
 # Subclase para identificar errores léxicos.
 class ErrorLexico(Error):
-    def __init__(self, caracter, linea, columna):
+    def __init__(self, caracter, linea, columna, lineas=None):
         mensaje = f"carácter ilegal {caracter}"
-        super().__init__(mensaje, linea, columna)
+        super().__init__(mensaje, linea, columna, lineas)
+
+# Clase que guarda un flujo de tokens en arreglos paralelos en lugar de un objeto Token por token.
+# El tipo es el índice del token en la lista tokens; el valor es un índice a la tabla valores,
+# donde cada valor distinto (identificador, número, cadena o lexema) aparece una sola vez.
+class BufferTokens:
+    def __init__(self, lineas=None):
+        self.tipo = array('H')  # Código del tipo de cada token
+        self.valor = array('I')  # Índice del valor en self.valores
+        self.linea = array('I')
+        self.posicion = array('I')  # Posición del token en el código
+        self.valores = []  # Valores distintos de los tokens
+        self.indices_valores = {}  # (código, valor) -> índice en self.valores
+        self.lineas = lineas  # IndiceLineas del código, para resolver las columnas
+
+    def __len__(self):
+        return len(self.tipo)
+
+    def agregar(self, tipo, valor, linea, posicion, lineas=None):
+        codigo = CODIGOS_TIPO[tipo]
+        # El código entra en la clave para que 1, 1.0 y True no compartan entrada.
+        clave = (codigo, valor)
+        indice = self.indices_valores.get(clave)
+        if indice is None:
+            indice = self.indices_valores[clave] = len(self.valores)
+            self.valores.append(valor)
+        self.tipo.append(codigo)
+        self.valor.append(indice)
+        self.linea.append(linea)
+        self.posicion.append(posicion)
+
+    def __getitem__(self, indice):
+        """Retorna el token indicado como un objeto Token."""
+        return Token(tokens[self.tipo[indice]], self.valores[self.valor[indice]], self.linea[indice],
+                     self.posicion[indice], self.lineas)
 
-# Lista para almacenar errores léxicos.
-lista_errores_lexicos = []
+    def __iter__(self):
+        for indice in range(len(self.tipo)):
+            yield self[indice]
+
+    def nombres_tipos(self):
+        """Retorna los nombres de los tipos de los tokens en orden."""
+        return [tokens[codigo] for codigo in self.tipo]
+
+    def memoria(self):
+        """Retorna los bytes que ocupan los arreglos, la tabla de valores y los valores."""
+        arreglos = (self.tipo, self.valor, self.linea, self.posicion)
+        return (sum(sys.getsizeof(arreglo) for arreglo in arreglos) + sys.getsizeof(self.valores)
+                + sys.getsizeof(self.indices_valores) + sum(sys.getsizeof(valor) for valor in self.valores))
 
 # Función para mostrar el resultado de la evaluacion léxica.
 def mostrar_resultado_lexico(lista_errores_lexicos):
@@ -56,6 +148,8 @@ def imprimir_tokens(tokens):
     if not tokens:
         print("No hay tokens para imprimir")
         return
+    # tabulate se importa aquí y no al cargar el módulo: compilar sin imprimir tablas no lo necesita.
+    from tabulate import tabulate
     headers = ["Tipo", "Valor", "Línea", "Columna"]
     data = [[token.tipo, token.valor, token.linea, token.columna] for token in tokens]
     # Centrar todos los textos en la tabla.
@@ -63,6 +157,18 @@ def imprimir_tokens(tokens):
     print("\nLista de Tokens:")
     print(table)
 
+# Función que mapea en memoria un archivo fuente para analizarlo por bloques con generar_tokens
+# o tokenizar_en_buffer sin leerlo completo. Se usa con with, que cierra el mapa al salir.
+@contextmanager
+def mapear_archivo(ruta):
+    with open(ruta, 'rb') as archivo:
+        # Un archivo vacío no se puede mapear.
+        if os.fstat(archivo.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            yield mapa
+
 # Función encargada de leer el código situado dentro del boceto seleccionado.
 def generar_datos(archivo):
     try:
@@ -81,7 +187,10 @@ def escribir_tokens_en_txt(lista_de_tokens, nombre_de_archivo):
     archivo_de_salida = os.path.join(carpeta_de_salida, nombre_de_archivo)
     try:
         with open(archivo_de_salida, 'w') as archivo:
-            tokens = ' '.join([token.tipo for token in lista_de_tokens])
+            if isinstance(lista_de_tokens, BufferTokens):
+                tokens = ' '.join(lista_de_tokens.nombres_tipos())
+            else:
+                tokens = ' '.join([token.tipo for token in lista_de_tokens])
             archivo.write(tokens)
             print(f"Tokens escritos exitosamente en el archivo {archivo_de_salida}.\n")
     except Exception as error:
@@ -96,6 +205,9 @@ tokens = [
     'mayorque', 'menorigualque', 'mayorigualque', 'igual', 'igualbool', 
     'diferentede', 'nentero', 'nflotante', 'ncadena', 'nbooleano', 'leer'
 ]
+
+# Código numérico de cada tipo de token en los BufferTokens.
+CODIGOS_TIPO = {tipo: codigo for codigo, tipo in enumerate(tokens)}
  
 # Palabras reservadas de FusionCod.
 palabras_reservadas = {
@@ -162,38 +274,243 @@ def t_newline(t):
     r'\n+'
     t.lexer.lineno += len(t.value)
 
-# Manejo de errores léxicos.
+# Manejo de errores léxicos. Cada análisis guarda sus errores en la lista asociada al lexer;
+# la columna se resuelve con el índice de líneas del código solo cuando se muestra el error.
 def t_error(t):
-    columna = t.lexpos - t.lexer.lexdata.rfind('\n', 0, t.lexpos)
-    error = ErrorLexico(t.value[0], t.lineno, columna)
-    lista_errores_lexicos.append(error)
+    if t.lexer.lineas is None:
+        t.lexer.lineas = IndiceLineas(t.lexer.lexdata)
+    error = ErrorLexico(t.value[0], t.lineno, t.lexpos, t.lexer.lineas)
+    t.lexer.errores.append(error)
     t.lexer.skip(1)
 
-print(f"\nCódigo a compilar: {archivo}")
+# Función que calcula una huella de las reglas léxicas. Se usa para nombrar la tabla lextab de ply,
+# así un cambio en las reglas nunca reutiliza una tabla generada con reglas anteriores.
+def huella_especificacion():
+    reglas = [(nombre, valor if isinstance(valor, str) else valor.__doc__)
+              for nombre, valor in globals().items() if nombre.startswith('t_')]
+    contenido = repr((tokens, sorted(palabras_reservadas.items()), reglas))
+    return hashlib.sha1(contenido.encode('utf-8')).hexdigest()[:12]
 
-# Inicializar el lexer.
-lexer = lex.lex()
-lexer.input(generar_datos(ruta_archivo)) # Cargar datos
+# Lexer de ply construido una sola vez; cada análisis trabaja sobre un clon.
+_lexer = None
 
-# Función para generar la lista de tokens reconocidos en el código fuente.
-def generar_tokens():
-    lista_de_tokens = []
+# Función que devuelve un lexer listo para usar, construyendo el lexer base solo la primera vez.
+def obtener_lexer():
+    global _lexer
+    if _lexer is None:
+        # optimize guarda las expresiones compiladas en un módulo lextab junto a este archivo.
+        _lexer = lex.lex(optimize=1, lextab=f"lextab_{huella_especificacion()}")
+    lexer = _lexer.clone()
+    lexer.lineno = 1
+    lexer.errores = []
+    lexer.lineas = None
+    return lexer
+
+# Función generadora que entrega uno a uno los tokens reconocidos en el código fuente.
+# El analizador sintáctico los consume a medida que el lexer los produce; los errores léxicos
+# se agregan a lista_errores si se indica. motor elige entre el lexer de ply y el de la
+# expresión regular maestra; ambos entregan exactamente los mismos tokens y errores.
+# Si datos son bytes o un archivo mapeado (mapear_archivo) se analizan por bloques con la
+# expresión regular maestra, porque ply solo trabaja sobre el texto completo.
+def generar_tokens(datos, lista_errores=None, motor=None):
+    if not isinstance(datos, str):
+        yield from _escanear_bloques(datos, lista_errores, IndiceLineas(), Token)
+        return
+    if (motor or motor_lexico) == 'regex':
+        yield from generar_tokens_regex(datos, lista_errores)
+        return
+    lineas = IndiceLineas(datos)
+    for tok in _escanear_ply(datos, lista_errores, lineas):
+        yield Token(tok.type, tok.value, tok.lineno, tok.lexpos, lineas)
+
+# Función generadora que entrega los tokens de ply de un código.
+def _escanear_ply(datos, lista_errores, lineas):
+    lexer = obtener_lexer()
+    if lista_errores is not None:
+        lexer.errores = lista_errores
+    lexer.lineas = lineas
+    lexer.input(datos)
     while True:
         tok = lexer.token()
         if not tok: break
-        token_obj = Token(tok.type, tok.value, tok.lineno, tok.lexpos)
-        lista_de_tokens.append(token_obj)
-    return lista_de_tokens
+        yield tok
+
+# Función que analiza léxicamente todo el código y guarda sus tokens en un BufferTokens, sin crear
+# un objeto Token por token. Acepta los mismos motores que generar_tokens.
+def tokenizar_en_buffer(datos, lista_errores=None, motor=None):
+    if not isinstance(datos, str):
+        buffer = BufferTokens(IndiceLineas())
+        for _ in _escanear_bloques(datos, lista_errores, buffer.lineas, buffer.agregar):
+            pass
+        return buffer
+    lineas = IndiceLineas(datos)
+    buffer = BufferTokens(lineas)
+    if (motor or motor_lexico) == 'regex':
+        for _ in _escanear_regex(datos, lista_errores, lineas, buffer.agregar):
+            pass
+    else:
+        agregar = buffer.agregar
+        for tok in _escanear_ply(datos, lista_errores, lineas):
+            agregar(tok.type, tok.value, tok.lineno, tok.lexpos)
+    return buffer
+
+# Conversiones de valor que hacen las reglas de función t_ncadena, t_nflotante y t_nentero.
+CONVERSIONES = {
+    't_ncadena': lambda valor: valor[1:-1],
+    't_nflotante': float,
+    't_nentero': int,
+}
+
+# Función que construye la expresión regular maestra a partir de las mismas reglas t_* que usa ply.
+# Se respeta el orden de ply: primero las reglas de función en el orden en que se definieron y luego
+# las de cadena de la expresión más larga a la más corta. Delante va un grupo para los caracteres de
+# t_ignore (ply los salta antes de probar las reglas) y al final uno que captura cualquier carácter
+# ilegal, así re.finditer recorre el código sin huecos.
+def construir_patron_maestro():
+    reglas = globals()
+    funciones = sorted((valor for nombre, valor in reglas.items()
+                        if nombre.startswith('t_') and callable(valor) and nombre != 't_error'),
+                       key=lambda funcion: funcion.__code__.co_firstlineno)
+    cadenas = sorted(((nombre, valor) for nombre, valor in reglas.items()
+                      if nombre.startswith('t_') and isinstance(valor, str) and nombre != 't_ignore'),
+                     key=lambda regla: len(regla[1]), reverse=True)
+    grupos = [f"(?P<ignorar>[{re.escape(t_ignore)}]+)"]
+    grupos += [f"(?P<{funcion.__name__}>{funcion.__doc__})" for funcion in funciones]
+    grupos += [f"(?P<{nombre}>{patron})" for nombre, patron in cadenas]
+    # (?s:.) acepta cualquier carácter, incluso un salto de línea, sin cambiar el . de las demás reglas.
+    grupos.append("(?P<ilegal>(?s:.))")
+    # ply compila las reglas con re.VERBOSE.
+    return re.compile('|'.join(grupos), re.VERBOSE)
+
+# Expresión regular maestra compilada una sola vez.
+_patron_maestro = None
+
+# Función generadora equivalente a la de ply que recorre el código con la expresión regular maestra.
+def generar_tokens_regex(datos, lista_errores=None):
+    return _escanear_regex(datos, lista_errores, IndiceLineas(datos), Token)
+
+# Función generadora que analiza el código con la expresión regular maestra desde la posición inicio,
+# que está en la línea indicada, sin copiar el resto del texto. Entrega tuplas (tipo, valor, línea,
+# posición) en coordenadas del código completo; los errores léxicos no tienen índice de líneas.
+# El análisis incremental la usa y la abandona en cuanto los tokens vuelven a coincidir.
+def generar_tokens_desde(datos, inicio, linea, lista_errores=None):
+    return _escanear_regex(datos, lista_errores, None, _tupla_token, linea=linea, inicio=inicio)
+
+# Función que crea la tupla de un token para generar_tokens_desde.
+def _tupla_token(tipo, valor, linea, posicion, lineas):
+    return tipo, valor, linea, posicion
+
+# Función generadora que recorre el código con la expresión regular maestra y entrega lo que
+# retorna crear(tipo, valor, linea, posicion, lineas) para cada token.
+# Cada coincidencia se despacha por el nombre de su grupo: las reglas de cadena dan su tipo
+# directamente, los identificadores se buscan en la tabla de palabras reservadas y las reglas
+# de función solo aplican su conversión de valor.
+# Para analizar un bloque, datos empieza en la posición desplazamiento del código y en la línea
+# indicada; con limite el análisis se detiene en la primera coincidencia que termina después de
+# limite y, si parar_en_comillas, en una comilla sin cerrar. Con inicio el análisis empieza en esa
+# posición de datos, que debe estar en la línea indicada. Retorna (línea, posición en datos donde
+# se detuvo).
+def _escanear_regex(datos, lista_errores, lineas, crear, desplazamiento=0, linea=1, limite=None, parar_en_comillas=False,
+                    inicio=0):
+    global _patron_maestro
+    if _patron_maestro is None:
+        _patron_maestro = construir_patron_maestro()
+    errores = lista_errores if lista_errores is not None else []
+    # Tipo de token de cada regla de cadena, que no necesita más trabajo que crear el token.
+    simples = {nombre: nombre[2:] for nombre, valor in globals().items()
+               if nombre.startswith('t_') and isinstance(valor, str) and nombre != 't_ignore'}
+    reservadas = palabras_reservadas
+    conversiones = CONVERSIONES
+    for coincidencia in _patron_maestro.finditer(datos, inicio):
+        if limite is not None and coincidencia.end() > limite:
+            return linea, coincidencia.start()
+        grupo = coincidencia.lastgroup
+        if grupo == 'ignorar':
+            continue
+        if grupo == 't_id':
+            valor = coincidencia.group()
+            yield crear(reservadas.get(valor, 'id'), valor, linea, coincidencia.start() + desplazamiento, lineas)
+        elif grupo in simples:
+            yield crear(simples[grupo], coincidencia.group(), linea, coincidencia.start() + desplazamiento, lineas)
+        elif grupo == 't_newline':
+            linea += coincidencia.end() - coincidencia.start()
+        elif grupo in conversiones:
+            yield crear(grupo[2:], conversiones[grupo](coincidencia.group()), linea, coincidencia.start() + desplazamiento, lineas)
+        elif grupo == 'ilegal':
+            if parar_en_comillas and coincidencia.group() == '"':
+                return linea, coincidencia.start()
+            errores.append(ErrorLexico(coincidencia.group(), linea, coincidencia.start() + desplazamiento, lineas))
+        # t_comentario no produce tokens.
+    return linea, len(datos)
+
+# Función generadora que analiza por bloques un código en bytes UTF-8 (por ejemplo un archivo
+# mapeado) sin tenerlo completo en memoria, con los mismos tokens y errores que analizar el texto.
+# Los bloques se decodifican como al abrir el archivo en modo texto (los \r\n pasan a \n). De cada
+# bloque se entregan las coincidencias que terminan al menos dos caracteres antes de su final,
+# porque ninguna regla, salvo las cadenas, mira más allá para decidirse; el resto pasa al bloque
+# siguiente. Una comilla sin cierre en el bloque solo es ilegal si no hay otra más adelante en el
+# archivo; si la hay, la cadena se termina de leer en el bloque siguiente.
+def _escanear_bloques(datos, lista_errores, lineas, crear, tamaño_bloque=None):
+    tamaño_bloque = tamaño_bloque or TAMAÑO_BLOQUE
+    errores = lista_errores if lista_errores is not None else []
+    decodificador = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+    total = len(datos)
+    leidos = 0  # Bytes de datos ya decodificados
+    minimo = 0  # Bytes que debe alcanzar la siguiente lectura para cerrar una cadena
+    pendiente = ''  # Texto del bloque anterior que aún no se analizó
+    desplazamiento = 0  # Posición de pendiente en el código
+    linea = 1
+    sin_comillas = False  # Ya no quedan comillas por leer en el archivo
+    while True:
+        fin = min(total, max(leidos + tamaño_bloque, minimo))
+        final = fin >= total
+        nuevo = decodificador.decode(datos[leidos:fin], final)
+        leidos = fin
+        lineas.extender(nuevo, desplazamiento + len(pendiente))
+        texto = pendiente + nuevo
+        limite = None if final else len(texto) - 2
+        inicio = 0
+        while True:
+            fragmento = texto[inicio:] if inicio else texto
+            linea, corte = yield from _escanear_regex(fragmento, errores, lineas, crear, desplazamiento + inicio, linea,
+                                                      None if limite is None else limite - inicio, not final and not sin_comillas)
+            corte += inicio
+            # Se detuvo por el límite, salvo que esté en una comilla ilegal: sin otra comilla después
+            # en el bloque, que es lo que necesitaría una cadena.
+            if (limite is None or sin_comillas or corte + 1 > limite or texto[corte:corte + 1] != '"'
+                    or texto.find('"', corte + 1) >= 0):
+                break
+            # Comilla sin cierre en el bloque: si no hay otra en el resto del archivo es ilegal.
+            cierre = datos.find(b'"', leidos)
+            if cierre >= 0:
+                minimo = cierre + 1
+                break
+            sin_comillas = True
+            inicio = corte
+        if final:
+            return
+        pendiente = texto[corte:]
+        desplazamiento += corte
+
+# Función que ejecuta el análisis léxico de un boceto mostrando sus resultados.
+def ejecutar_analisis_lexico(archivo):
+    ruta_archivo = os.path.join(directorio, '..', 'codigos-bocetos', archivo)
+    print(f"\nCódigo a compilar: {archivo}")
+
+    # Generar el buffer de tokens con todo el código.
+    lista_errores_lexicos = []
+    lista_de_tokens = tokenizar_en_buffer(generar_datos(ruta_archivo), lista_errores_lexicos)
 
-# Generar la lista de tokens llamando a la función generar_tokens.
-lista_de_tokens = generar_tokens()
+    # Imprimir la lista de tokens obtenida.
+    imprimir_tokens(lista_de_tokens)
 
-# Imprimir la lista de tokens obtenida.
-imprimir_tokens(lista_de_tokens)
+    # Mostrar el resultado del análisis léxico.
+    mostrar_resultado_lexico(lista_errores_lexicos)
 
-# Mostrar el resultado del análisis léxico.
-mostrar_resultado_lexico(lista_errores_lexicos)
+    # Escribir los tokens para probar en un .txt.
+    salida_nombre_tokens = f"{os.path.splitext(archivo)[0]}-tokens"
+    escribir_tokens_en_txt(lista_de_tokens, salida_nombre_tokens)
+    return lista_de_tokens, lista_errores_lexicos
 
-# Escribir los tokens para probar en un .txt.
-salida_nombre_tokens = f"{os.path.splitext(archivo)[0]}-tokens"
-escribir_tokens_en_txt(lista_de_tokens, salida_nombre_tokens)
\ No newline at end of file
+if __name__ == '__main__':
+    ejecutar_analisis_lexico(sys.argv[1] if len(sys.argv) > 1 else archivo)
@@ -0,0 +1,120 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from cache import CacheArtefactos
+from cache import carpeta_cache
+from compilacion import compile_file
+from lexico import obtener_lexer
+from sintactico import obtener_tabla_ll1
+
+# Clase con el resultado de compilar un archivo dentro del lote.
+class ReporteArchivo:
+    def __init__(self, ruta, estado, errores, tiempo):
+        self.ruta = ruta
+        self.estado = estado  # 'exito', 'errores' o 'fallo' (el archivo no se pudo compilar)
+        self.errores = errores  # Mensajes de error como texto
+        self.tiempo = tiempo  # Segundos empleados en léxico, sintáctico y semántico
+
+    def a_diccionario(self):
+        return {'ruta': self.ruta, 'estado': self.estado, 'errores': self.errores, 'tiempo': self.tiempo}
+
+# Clase que agrega los reportes de todos los archivos del lote.
+class ReporteLote:
+    def __init__(self, archivos, procesos, tiempo_total):
+        self.archivos = archivos
+        self.procesos = procesos
+        self.tiempo_total = tiempo_total
+
+    @property
+    def exito(self):
+        return all(archivo.estado == 'exito' for archivo in self.archivos)
+
+    def a_diccionario(self):
+        return {
+            'exito': self.exito,
+            'procesos': self.procesos,
+            'tiempo_total': self.tiempo_total,
+            'archivos': [archivo.a_diccionario() for archivo in self.archivos],
+        }
+
+    def imprimir(self):
+        from tabulate import tabulate
+        headers = ["Archivo", "Estado", "Errores", "Tiempo (ms)"]
+        data = [[archivo.ruta, archivo.estado, len(archivo.errores), f"{archivo.tiempo * 1000:.2f}"] for archivo in self.archivos]
+        print(tabulate(data, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+        for archivo in self.archivos:
+            for error in archivo.errores:
+                print(f"{archivo.ruta}: {error}")
+        velocidad = len(self.archivos) / self.tiempo_total if self.tiempo_total else 0
+        print(f"\n{len(self.archivos)} archivos en {self.tiempo_total:.2f} s con {self.procesos} procesos ({velocidad:.1f} archivos/s)")
+
+# Función que expande una lista de rutas y patrones glob en rutas de archivos sin repetir.
+def expandir_rutas(patrones):
+    rutas = []
+    for patron in patrones:
+        coincidencias = sorted(glob.glob(patron, recursive=True)) if glob.has_magic(patron) else [patron]
+        for ruta in coincidencias:
+            if ruta not in rutas and not os.path.isdir(ruta):
+                rutas.append(ruta)
+    return rutas
+
+# Caché de artefactos del proceso, None si el lote se compila sin caché.
+_cache = None
+
+# Inicializador de cada proceso: construye el lexer y carga la tabla LL(1) una sola vez.
+def _iniciar_trabajador(carpeta_cache=None):
+    global _cache
+    obtener_lexer()
+    obtener_tabla_ll1()
+    _cache = CacheArtefactos(carpeta_cache) if carpeta_cache else None
+
+# Función que compila un archivo y devuelve su reporte; se ejecuta en los procesos del lote.
+def compilar_archivo_lote(ruta):
+    inicio = time.perf_counter()
+    try:
+        # El lote solo reporta errores, así que no hace falta construir el árbol sintáctico.
+        resultado = compile_file(ruta, construir_arbol=False, cache=_cache)
+    except (OSError, UnicodeDecodeError) as error:
+        return ReporteArchivo(ruta, 'fallo', [str(error)], time.perf_counter() - inicio)
+    tiempo = time.perf_counter() - inicio
+    estado = 'exito' if resultado.exito else 'errores'
+    return ReporteArchivo(ruta, estado, [str(error) for error in resultado.errores], tiempo)
+
+# Función que compila un lote de archivos repartiéndolos entre varios procesos.
+# Con carpeta_cache los archivos que no cambiaron se leen de la caché de artefactos de esa carpeta.
+def compilar_lote(patrones, procesos=None, carpeta_cache=None):
+    rutas = expandir_rutas(patrones)
+    procesos = min(procesos or os.cpu_count() or 1, max(len(rutas), 1))
+    inicio = time.perf_counter()
+    if procesos == 1:
+        _iniciar_trabajador(carpeta_cache)
+        archivos = [compilar_archivo_lote(ruta) for ruta in rutas]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador, initargs=(carpeta_cache,)) as ejecutor:
+            tamaño_bloque = max(1, len(rutas) // (procesos * 4))
+            archivos = list(ejecutor.map(compilar_archivo_lote, rutas, chunksize=tamaño_bloque))
+    return ReporteLote(archivos, procesos, time.perf_counter() - inicio)
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Compila en paralelo varios códigos FusionCod.")
+    parser.add_argument('archivos', nargs='+', help="Rutas o patrones glob de los códigos a compilar")
+    parser.add_argument('-j', '--procesos', type=int, default=None, help="Número de procesos (por defecto, uno por núcleo)")
+    parser.add_argument('--json', dest='salida_json', help="Ruta donde guardar el reporte en formato JSON")
+    parser.add_argument('--cache', dest='carpeta_cache', nargs='?', const=carpeta_cache, default=None,
+                        help=f"Reutilizar los resultados de los archivos sin cambios (por defecto en {carpeta_cache})")
+    opciones = parser.parse_args(argumentos)
+
+    reporte = compilar_lote(opciones.archivos, opciones.procesos, opciones.carpeta_cache)
+    reporte.imprimir()
+    if opciones.salida_json:
+        with open(opciones.salida_json, 'w', encoding='utf-8') as archivo:
+            json.dump(reporte.a_diccionario(), archivo, ensure_ascii=False, indent=2)
+    return 0 if reporte.exito else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
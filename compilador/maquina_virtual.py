@@ -0,0 +1,286 @@
+import argparse
+import io
+import math
+import operator
+import sys
+
+from bytecode import A_FLOTANTE
+from bytecode import CARGAR_CONST
+from bytecode import CARGAR_LOCAL
+from bytecode import CARGAR_LOCAL_CONST
+from bytecode import CARGAR_LOCAL_LOCAL
+from bytecode import COMPARAR
+from bytecode import DEVOLVER
+from bytecode import DIV
+from bytecode import GUARDAR_LOCAL
+from bytecode import INCREMENTAR
+from bytecode import LEER
+from bytecode import LLAMAR
+from bytecode import MOSTRAR
+from bytecode import MUL
+from bytecode import RESIDUO
+from bytecode import RESTA
+from bytecode import SACAR
+from bytecode import SALTAR
+from bytecode import SALTAR_SI
+from bytecode import SALTAR_SI_FALSO
+from bytecode import SALTAR_SI_FALSO_O_SACAR
+from bytecode import SALTAR_SI_NO
+from bytecode import SALTAR_SI_VERDADERO
+from bytecode import SALTAR_SI_VERDADERO_O_SACAR
+from bytecode import SUMA
+from bytecode import compilar_bytecode
+from lexico import Error
+
+# Máquina virtual de pila que ejecuta el bytecode de bytecode.py. Todas las funciones comparten una
+# pila de operandos; cada llamada guarda el marco de la función que llama en una lista, sin recursión
+# de Python, así la profundidad de las llamadas de FusionCod solo está limitada por LIMITE_LLAMADAS.
+
+# Número máximo de llamadas anidadas antes de detener el programa.
+LIMITE_LLAMADAS = 100000
+
+# Comparadores en el orden de bytecode.COMPARADORES.
+COMPARADORES = (operator.lt, operator.le, operator.gt, operator.ge, operator.eq, operator.ne)
+
+# Clase para los errores que ocurren al ejecutar un programa. A diferencia de los errores de
+# compilación, que se acumulan en listas, detiene la ejecución, así que también es una excepción.
+class ErrorEjecucion(Error, Exception):
+    def __str__(self):
+        return f"❌ Error de ejecución en la línea {self.linea}: {self.mensaje}"
+
+# Función que convierte un valor en el texto que muestran show y la concatenación con '+'.
+def texto(valor):
+    if type(valor) is str:
+        return valor
+    if valor is True:
+        return 'true'
+    if valor is False:
+        return 'false'
+    if valor is None:
+        return ''
+    return str(valor)
+
+# Función que divide como en C: entre enteros el cociente se trunca hacia cero.
+def dividir(izquierda, derecha):
+    if type(izquierda) is int and type(derecha) is int:
+        cociente = izquierda // derecha
+        if cociente < 0 and cociente * derecha != izquierda:
+            cociente += 1
+        return cociente
+    return izquierda / derecha
+
+# Función que calcula el residuo con el signo del dividendo, coherente con dividir.
+def residuo(izquierda, derecha):
+    if type(izquierda) is int and type(derecha) is int:
+        return izquierda - derecha * dividir(izquierda, derecha)
+    return math.fmod(izquierda, derecha)
+
+# Función que convierte el texto leído por read en un booleano.
+def _booleano(valor):
+    if valor not in ('true', 'false'):
+        raise ValueError(valor)
+    return valor == 'true'
+
+# Conversiones de read en el orden de bytecode.TIPOS_LECTURA, con el nombre del tipo para los errores.
+CONVERSIONES_LECTURA = ((int, 'int'), (float, 'float'), (str, 'text'), (_booleano, 'bool'))
+
+# Clase que ejecuta un ModuloBytecode.
+class MaquinaVirtual:
+    def __init__(self, modulo, entrada=None, salida=None):
+        self.modulo = modulo
+        self.entrada = entrada if entrada is not None else sys.stdin
+        self.salida = salida if salida is not None else sys.stdout
+        # El código de cada función como lista: indexar una lista es más rápido que un array.
+        self.codigos = [list(funcion.codigo) for funcion in modulo.funciones]
+
+    def leer(self, conversion):
+        """Lee una línea de la entrada y la convierte al tipo de la variable de read."""
+        self.salida.flush()
+        linea = self.entrada.readline()
+        if not linea:
+            raise ValueError("no hay más datos de entrada")
+        valor = linea.rstrip('\r\n')
+        funcion, nombre_tipo = CONVERSIONES_LECTURA[conversion]
+        try:
+            return funcion(valor.strip() if nombre_tipo != 'text' else valor)
+        except ValueError:
+            raise ValueError(f"'{valor}' no es un valor de tipo {nombre_tipo}") from None
+
+    def ejecutar(self, nombre='main', argumentos=()):
+        """Ejecuta la función indicada y retorna lo que devuelve."""
+        funciones = self.modulo.funciones
+        constantes = self.modulo.constantes
+        codigos = self.codigos
+        comparadores = COMPARADORES
+        escribir = self.salida.write
+        indice = self.modulo.indices[nombre]
+        funcion = funciones[indice]
+        codigo = codigos[indice]
+        locales = list(argumentos) + funcion.iniciales
+        pila = []
+        apilar = pila.append
+        sacar = pila.pop
+        marcos = []  # (función, código, pc, locales) de cada función que espera el retorno de una llamada
+        pc = 0
+        try:
+            # Las operaciones están ordenadas según su frecuencia en bucles y llamadas recursivas.
+            while True:
+                operacion = codigo[pc]
+                argumento = codigo[pc + 1]
+                pc += 2
+                if operacion == CARGAR_LOCAL:
+                    apilar(locales[argumento])
+                elif operacion == CARGAR_LOCAL_CONST:
+                    apilar(locales[argumento & 0xFFFF])
+                    apilar(constantes[argumento >> 16])
+                elif operacion == SALTAR_SI_NO:
+                    derecha = sacar()
+                    if not comparadores[argumento >> 24](sacar(), derecha):
+                        pc = argumento & 0xFFFFFF
+                elif operacion == SALTAR_SI:
+                    derecha = sacar()
+                    if comparadores[argumento >> 24](sacar(), derecha):
+                        pc = argumento & 0xFFFFFF
+                elif operacion == INCREMENTAR:
+                    slot = argumento & 0xFFFF
+                    valor = locales[slot]
+                    if type(valor) is str:
+                        locales[slot] = valor + texto(constantes[argumento >> 16])
+                    else:
+                        locales[slot] = valor + constantes[argumento >> 16]
+                elif operacion == SUMA:
+                    derecha = sacar()
+                    izquierda = pila[-1]
+                    if type(izquierda) is str or type(derecha) is str:
+                        pila[-1] = texto(izquierda) + texto(derecha)
+                    else:
+                        pila[-1] = izquierda + derecha
+                elif operacion == RESTA:
+                    derecha = sacar()
+                    pila[-1] -= derecha
+                elif operacion == GUARDAR_LOCAL:
+                    locales[argumento] = sacar()
+                elif operacion == CARGAR_LOCAL_LOCAL:
+                    apilar(locales[argumento & 0xFFFF])
+                    apilar(locales[argumento >> 16])
+                elif operacion == SALTAR:
+                    pc = argumento
+                elif operacion == LLAMAR:
+                    if len(marcos) >= LIMITE_LLAMADAS:
+                        raise RecursionError(f"se superó el límite de {LIMITE_LLAMADAS} llamadas anidadas")
+                    llamada = funciones[argumento]
+                    parametros = llamada.num_parametros
+                    if parametros:
+                        nuevos = pila[-parametros:]
+                        del pila[-parametros:]
+                        nuevos += llamada.iniciales
+                    else:
+                        nuevos = llamada.iniciales[:]
+                    marcos.append((funcion, codigo, pc, locales))
+                    funcion = llamada
+                    codigo = codigos[argumento]
+                    locales = nuevos
+                    pc = 0
+                elif operacion == DEVOLVER:
+                    # El valor devuelto queda en el tope de la pila para la función que llamó.
+                    if not marcos:
+                        return sacar()
+                    funcion, codigo, pc, locales = marcos.pop()
+                elif operacion == CARGAR_CONST:
+                    apilar(constantes[argumento])
+                elif operacion == RESIDUO:
+                    derecha = sacar()
+                    izquierda = pila[-1]
+                    if type(izquierda) is int and type(derecha) is int and izquierda >= 0 and derecha > 0:
+                        pila[-1] = izquierda % derecha
+                    else:
+                        pila[-1] = residuo(izquierda, derecha)
+                elif operacion == MUL:
+                    derecha = sacar()
+                    pila[-1] *= derecha
+                elif operacion == DIV:
+                    derecha = sacar()
+                    pila[-1] = dividir(pila[-1], derecha)
+                elif operacion == COMPARAR:
+                    derecha = sacar()
+                    pila[-1] = comparadores[argumento](pila[-1], derecha)
+                elif operacion == SALTAR_SI_FALSO:
+                    if not sacar():
+                        pc = argumento
+                elif operacion == SALTAR_SI_VERDADERO:
+                    if sacar():
+                        pc = argumento
+                elif operacion == MOSTRAR:
+                    escribir(texto(sacar()))
+                elif operacion == SACAR:
+                    sacar()
+                elif operacion == A_FLOTANTE:
+                    if type(pila[-1]) is int:
+                        pila[-1] = float(pila[-1])
+                elif operacion == SALTAR_SI_FALSO_O_SACAR:
+                    if pila[-1]:
+                        sacar()
+                    else:
+                        pc = argumento
+                elif operacion == SALTAR_SI_VERDADERO_O_SACAR:
+                    if pila[-1]:
+                        pc = argumento
+                    else:
+                        sacar()
+                elif operacion == LEER:
+                    locales[argumento >> 2] = self.leer(argumento & 3)
+        except ZeroDivisionError:
+            raise ErrorEjecucion("división entre cero", funcion.lineas[(pc - 2) // 2], None) from None
+        except TypeError:
+            raise ErrorEjecucion("operación no válida para los tipos de sus operandos", funcion.lineas[(pc - 2) // 2], None) from None
+        except (ValueError, OverflowError, RecursionError) as error:
+            raise ErrorEjecucion(str(error), funcion.lineas[(pc - 2) // 2], None) from None
+
+# Clase que escribe en la salida real y recuerda si lo último que se escribió terminó la línea.
+class _SalidaConsola(io.TextIOBase):
+    def __init__(self, original):
+        self.original = original
+        self.fin_de_linea = True
+
+    def write(self, texto):
+        if texto:
+            self.fin_de_linea = texto.endswith('\n')
+        return self.original.write(texto)
+
+    def flush(self):
+        self.original.flush()
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Compila a bytecode y ejecuta un código FusionCod.")
+    parser.add_argument('archivo', help="Ruta del código a ejecutar")
+    parser.add_argument('--desensamblar', action='store_true', help="Mostrar el bytecode en lugar de ejecutarlo")
+    parser.add_argument('--sin-superinstrucciones', dest='optimizar', action='store_false',
+                        help="Generar el bytecode sin fusionar instrucciones")
+    opciones = parser.parse_args(argumentos)
+
+    with open(opciones.archivo, 'r', encoding='utf-8') as archivo:
+        codigo = archivo.read()
+    modulo, errores = compilar_bytecode(codigo, opciones.archivo, opciones.optimizar)
+    if errores:
+        for error in errores:
+            print(error)
+        return 1
+    if opciones.desensamblar:
+        print(modulo.desensamblar())
+        return 0
+
+    salida = _SalidaConsola(sys.stdout)
+    try:
+        valor = MaquinaVirtual(modulo, salida=salida).ejecutar()
+    except ErrorEjecucion as error:
+        if not salida.fin_de_linea:
+            print()
+        print(error)
+        return 1
+    if not salida.fin_de_linea:
+        print()
+    # El valor de main es el código de salida del proceso.
+    return valor if type(valor) is int else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+# Recorridos de árboles con pila explícita, sin recursión de Python.
+# Los usan las pasadas sobre el árbol sintáctico y la tabla de símbolos, cuya profundidad crece
+# con el número de instrucciones porque la gramática es recursiva por la derecha.
+
+# Valor que una función de visita retorna para terminar el recorrido completo.
+DETENER = object()
+
+# Valor que una función de visita en preorden retorna para no descender a los hijos del nodo.
+OMITIR_HIJOS = object()
+
+# Función que obtiene los hijos de un nodo del árbol sintáctico o de un ámbito de la tabla de símbolos.
+def hijos_de(nodo):
+    return nodo.hijos
+
+# Función que recorre un árbol en preorden llamando a visitar(nodo, contexto).
+# Lo que retorna visitar es el contexto que reciben los hijos del nodo (por ejemplo el ámbito
+# actual o el id del nodo padre), salvo DETENER u OMITIR_HIJOS.
+# Retorna False si el recorrido se detuvo antes de terminar.
+def recorrer_preorden(raiz, visitar, contexto=None, obtener_hijos=hijos_de):
+    pila = [(raiz, contexto)]
+    while pila:
+        nodo, contexto = pila.pop()
+        contexto_hijos = visitar(nodo, contexto)
+        if contexto_hijos is DETENER:
+            return False
+        if contexto_hijos is OMITIR_HIJOS:
+            continue
+        hijos = obtener_hijos(nodo)
+        for i in range(len(hijos) - 1, -1, -1):
+            pila.append((hijos[i], contexto_hijos))
+    return True
+
+# Función que recorre un árbol en postorden llamando a visitar(nodo) después de visitar sus hijos.
+# Retorna False si visitar retornó DETENER.
+def recorrer_postorden(raiz, visitar, obtener_hijos=hijos_de):
+    pila = [(raiz, False)]
+    while pila:
+        nodo, hijos_visitados = pila.pop()
+        if hijos_visitados:
+            if visitar(nodo) is DETENER:
+                return False
+            continue
+        pila.append((nodo, True))
+        hijos = obtener_hijos(nodo)
+        for i in range(len(hijos) - 1, -1, -1):
+            pila.append((hijos[i], False))
+    return True
+
+# Generador que entrega los nodos de un árbol en preorden; basta con un break para detenerse.
+def iterar_preorden(raiz, obtener_hijos=hijos_de):
+    pila = [raiz]
+    while pila:
+        nodo = pila.pop()
+        yield nodo
+        hijos = obtener_hijos(nodo)
+        for i in range(len(hijos) - 1, -1, -1):
+            pila.append(hijos[i])
@@ -0,0 +1,174 @@
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+from cliente import RUTA_SOCKET
+from compilacion import compile_file
+from compilacion import compile_source
+from lexico import obtener_lexer
+from sintactico import obtener_tabla_ll1
+
+# Servidor de compilación que escucha en un socket Unix (ver cliente.py para el protocolo).
+# El bucle de asyncio solo lee y escribe mensajes; la compilación, que ocupa la CPU, se hace en
+# un grupo de procesos cuyo lexer y tabla LL(1) se construyen una vez, al arrancar el servidor.
+
+# Tamaño máximo de una línea del protocolo (el código de una petición viaja en una sola línea).
+LIMITE_MENSAJE = 64 << 20
+
+# Inicializador de cada trabajador: construye el lexer y carga la tabla LL(1) una sola vez.
+def _iniciar_trabajador():
+    obtener_lexer()
+    obtener_tabla_ll1()
+
+# Inicializador de los procesos trabajadores; Ctrl+C lo atiende solo el servidor.
+def _iniciar_proceso():
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _iniciar_trabajador()
+
+# Función vacía que se envía a cada trabajador para que arranque antes de la primera petición.
+def _calentar():
+    return os.getpid()
+
+# Función que atiende una petición de compilación y retorna la respuesta; se ejecuta en los trabajadores.
+def compilar_peticion(peticion):
+    inicio = time.perf_counter()
+    archivo = peticion.get('archivo')
+    tokens = bool(peticion.get('tokens', True))
+    try:
+        # La respuesta no incluye el árbol sintáctico, así que no hace falta construirlo.
+        if peticion.get('codigo') is not None:
+            resultado = compile_source(peticion['codigo'], archivo, conservar_tokens=tokens, construir_arbol=False)
+        elif archivo:
+            resultado = compile_file(archivo, conservar_tokens=tokens, construir_arbol=False)
+        else:
+            return {'ok': False, 'error': "la petición debe tener 'archivo' o 'codigo'"}
+    except (OSError, UnicodeDecodeError) as error:
+        return {'ok': False, 'archivo': archivo, 'error': str(error)}
+    respuesta = resultado.a_diccionario()
+    respuesta['ok'] = True
+    respuesta['tiempo'] = time.perf_counter() - inicio
+    return respuesta
+
+# Función que convierte una respuesta en una línea del protocolo.
+def codificar(respuesta):
+    return json.dumps(respuesta, ensure_ascii=False) + '\n'
+
+# Función que se ejecuta en los trabajadores: la respuesta ya sale en JSON, así entre procesos
+# solo viaja un texto en lugar de las listas de tokens.
+def _atender_en_trabajador(peticion):
+    return codificar(compilar_peticion(peticion))
+
+# Clase del servidor: acepta conexiones concurrentes y reparte las compilaciones entre los trabajadores.
+class ServidorCompilacion:
+    def __init__(self, ruta_socket=RUTA_SOCKET, procesos=None):
+        self.ruta_socket = ruta_socket
+        self.procesos = procesos or os.cpu_count() or 1
+        self.ejecutor = None
+        self.detenido = None
+        self.conexiones = {}  # Tarea que atiende cada conexión abierta -> escritor de la conexión
+        self.peticiones = 0
+
+    async def responder(self, peticion):
+        """Retorna la línea JSON que responde a una petición ya decodificada."""
+        if not isinstance(peticion, dict):
+            return codificar({'ok': False, 'error': "la petición debe ser un objeto JSON"})
+        orden = peticion.get('orden', 'compilar')
+        if orden == 'detener':
+            self.detenido.set()
+            return codificar({'ok': True})
+        if orden == 'estado':
+            return codificar({'ok': True, 'procesos': self.procesos, 'peticiones': self.peticiones})
+        if orden != 'compilar':
+            return codificar({'ok': False, 'error': f"orden desconocida: {orden}"})
+        self.peticiones += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.ejecutor, _atender_en_trabajador, peticion)
+        except Exception as error:
+            # Una petición que falla no debe detener el servidor.
+            return codificar({'ok': False, 'archivo': peticion.get('archivo'), 'error': f"fallo interno: {error!r}"})
+
+    async def atender(self, lector, escritor):
+        """Atiende una conexión: responde sus peticiones en orden hasta que el cliente la cierra."""
+        tarea = asyncio.current_task()
+        self.conexiones[tarea] = escritor
+        try:
+            while linea := await lector.readline():
+                try:
+                    respuesta = await self.responder(json.loads(linea))
+                except json.JSONDecodeError as error:
+                    respuesta = codificar({'ok': False, 'error': f"JSON inválido: {error}"})
+                escritor.write(respuesta.encode('utf-8'))
+                await escritor.drain()
+        except (ConnectionError, ValueError):
+            pass  # El cliente se desconectó o envió una línea mayor que LIMITE_MENSAJE.
+        finally:
+            self.conexiones.pop(tarea, None)
+            escritor.close()
+
+    def crear_ejecutor(self):
+        # Con un solo trabajador basta un hilo: se evita copiar peticiones y respuestas entre procesos
+        # y el bucle de asyncio sigue atendiendo conexiones mientras se compila.
+        if self.procesos == 1:
+            return ThreadPoolExecutor(max_workers=1, initializer=_iniciar_trabajador)
+        return ProcessPoolExecutor(max_workers=self.procesos, initializer=_iniciar_proceso)
+
+    def liberar_socket(self):
+        """Borra el socket de un servidor anterior que terminó sin borrarlo; falla si sigue activo."""
+        if not os.path.exists(self.ruta_socket):
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as prueba:
+            try:
+                prueba.connect(self.ruta_socket)
+            except OSError:
+                os.unlink(self.ruta_socket)
+                return
+        raise OSError(f"ya hay un servidor escuchando en {self.ruta_socket}")
+
+    async def ejecutar(self):
+        loop = asyncio.get_running_loop()
+        self.detenido = asyncio.Event()
+        for señal in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(señal, self.detenido.set)
+        self.liberar_socket()
+        with self.crear_ejecutor() as self.ejecutor:
+            # Cada trabajador construye el lexer y la tabla antes de aceptar la primera conexión.
+            await asyncio.gather(*(loop.run_in_executor(self.ejecutor, _calentar) for _ in range(self.procesos)))
+            servidor = await asyncio.start_unix_server(self.atender, path=self.ruta_socket, limit=LIMITE_MENSAJE)
+            print(f"Servidor de compilación escuchando en {self.ruta_socket} con {self.procesos} procesos", flush=True)
+            try:
+                await self.detenido.wait()
+            finally:
+                servidor.close()
+                await servidor.wait_closed()
+                # Las conexiones que siguen abiertas se cierran (su lector recibe el fin de archivo)
+                # y se espera a que terminen antes de apagar a los trabajadores.
+                for escritor in list(self.conexiones.values()):
+                    escritor.close()
+                await asyncio.gather(*self.conexiones, return_exceptions=True)
+                if os.path.exists(self.ruta_socket):
+                    os.unlink(self.ruta_socket)
+        print(f"Servidor detenido después de {self.peticiones} peticiones", flush=True)
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Servidor de compilación FusionCod en un socket Unix.")
+    parser.add_argument('--socket', dest='ruta_socket', default=RUTA_SOCKET, help=f"Ruta del socket (por defecto {RUTA_SOCKET})")
+    parser.add_argument('-j', '--procesos', type=int, default=None, help="Número de procesos trabajadores (por defecto, uno por núcleo)")
+    opciones = parser.parse_args(argumentos)
+
+    servidor = ServidorCompilacion(opciones.ruta_socket, opciones.procesos)
+    try:
+        asyncio.run(servidor.ejecutar())
+    except OSError as error:
+        print(f"No se pudo iniciar el servidor: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,20 +1,56 @@
-import pandas as pd
 import os
-from graphviz import Digraph
+import re
+import csv
+from array import array
+import sys
+import importlib
+import importlib.util
+import pickle
+from cache import CacheArtefactos
+from cache import capturar_salida
 from lexico import Error
-from lexico import lista_errores_lexicos
 from lexico import mostrar_resultado_lexico
-from lexico import lista_de_tokens
+from lexico import ejecutar_analisis_lexico
 from lexico import archivo
 from lexico import Token
+from lexico import BufferTokens
+from lexico import tokens
+from recorridos import OMITIR_HIJOS
+from recorridos import recorrer_preorden
+from tabla_binaria import huella_gramatica
+from tabla_binaria import leer_tabla_binaria
+from tabla_binaria import escribir_tabla_binaria
+from tabla_comprimida import TablaComprimida
+# pandas y graphviz se importan dentro de los exportadores que los usan (tabla de símbolos en .csv y
+# diagramas), así el léxico, el sintáctico y el semántico se cargan sin ellos.
 
 # Ingresar datos de la tabla en formato .csv
 directorio = os.path.dirname(__file__)
 archivo_ll1 = 'tabla_ll1.csv'  # Ingresar el nombre de la tabla.
 ruta_archivo_ll1 = os.path.join(directorio, '..', 'tabla-ll1', archivo_ll1)
 
-# Agregar el $ a la lista de tokens.
-lista_de_tokens.append(Token("$", "$", None, None))
+# Tabla LL(1) precompilada en binario, la gramática de la que se genera y el generador que la reconstruye.
+ruta_tabla_binaria = os.path.join(directorio, '..', 'tabla-ll1', 'tabla_ll1.bin')
+ruta_gramatica = os.path.join(directorio, '..', 'gramatica', 'gramatica.txt')
+ruta_generador_ll1 = os.path.join(directorio, '..', 'generador-de-tablas-ll1', 'generador-ll1.py')
+ruta_analizador_generado = os.path.join(directorio, 'analizador_generado.py')
+
+# Token de fin de entrada que el analizador usa cuando se agota el flujo de tokens.
+TOKEN_FIN = Token("$", "$", None, None)
+
+# Las trazas de la construcción de la tabla de símbolos solo se muestran al ejecutar el script.
+mostrar_trazas = False
+
+# El script reutiliza la salida de la caché de artefactos si el boceto no cambió.
+usar_cache = True
+
+# Carpetas donde el script escribe sus archivos de salida.
+carpetas_salida = ['salida-tokens', 'salida-arboles']
+
+# Función para imprimir una traza cuando están activadas.
+def traza(mensaje):
+    if mostrar_trazas:
+        print(mensaje)
 
 # Subclase para identificar un error sintáctico.
 class ErrorSintactico(Error):
@@ -22,134 +58,494 @@ class ErrorSintactico(Error):
         mensaje = f"se esperaba {esperado}, pero se encontró {encontrado}"
         super().__init__(mensaje, linea, columna)
 
-# Clase para la Tabla de Símbolos
+# Subclase para identificar un error semántico.
+class ErrorSemantico(Error):
+    def __init__(self, mensaje, linea=None, columna=None):
+        super().__init__(mensaje, linea, columna)
+
+    def __str__(self):
+        return f"❌ Error semántico: {self.mensaje}"
+
+# Clase para la Tabla de Símbolos. Cada instancia es un ámbito y la raíz es el ámbito global.
+# La raíz mantiene un índice plano nombre -> pila de enlaces de los ámbitos activos, así que buscar
+# desde el ámbito activo más interno cuesta O(1). Entrar y salir de un ámbito solo cambia qué ámbitos
+# están activos: el árbol de ámbitos se conserva completo para los exportadores.
 class TablaSimbolos:
-    def __init__(self, padre=None):
+    def __init__(self, padre=None, nombre=None):
         self.simbolos = {}  # Diccionario de símbolos: nombre -> {tipo, categoria, parámetros, retorno}
         self.padre = padre  # Ámbito padre
         self.hijos = []  # Lista de ámbitos hijos (para funciones)
+        self.nombre = nombre  # Nombre de la función dueña del ámbito, None en el ámbito global
+        self.raiz = padre.raiz if padre else self
+        self.nivel = padre.nivel + 1 if padre else 0
+        if padre:
+            self.errores = padre.errores  # Errores semánticos compartidos por todos los ámbitos
+            self.raiz.ambitos.append(self)
+        else:
+            self.errores = []
+            self.ambitos = [self]  # Registro de todos los ámbitos en orden de creación
+            self.activos = [self]  # Pila de ámbitos activos, del global al más interno
+            self.enlaces = {}  # nombre -> pila de (nivel, atributos) visibles desde el ámbito activo
 
     def agregar_simbolo(self, nombre, tipo=None, categoria=None, parámetros=None, retorno=None):
-        """Añade un símbolo al ámbito actual."""
+        """Añade un símbolo al ámbito actual y retorna sus atributos, o None si ya existía."""
         if nombre in self.simbolos:
             #print(f"Advertencia: Símbolo {nombre} ya definido en este ámbito, se sobrescribirá")
-            errores_semanticos.append(f"❌ Error semántico: La variable '{nombre}' ya fue declarada.")
+            self.errores.append(ErrorSemantico(f"La variable '{nombre}' ya fue declarada."))
             #se usa return para ignorar la nueva declaracion
             return
-        self.simbolos[nombre] = {
+        atributos = {
             'tipo': tipo,
             'categoria': categoria,
             'parámetros': parámetros if parámetros is not None else [],
             'retorno': retorno
         }
-        print(f"Símbolo agregado: {nombre}, categoria: {categoria}, tipo: {tipo}, parámetros: {parámetros}, retorno: {retorno}")
+        self.simbolos[nombre] = atributos
+        if self.activo:
+            # El enlace queda debajo de los de ámbitos más internos que también estén activos.
+            pila = self.raiz.enlaces.setdefault(nombre, [])
+            posicion = len(pila)
+            while posicion > 0 and pila[posicion - 1][0] > self.nivel:
+                posicion -= 1
+            pila.insert(posicion, (self.nivel, atributos))
+        traza(f"Símbolo agregado: {nombre}, categoria: {categoria}, tipo: {tipo}, parámetros: {parámetros}, retorno: {retorno}")
+        return atributos
 
     def buscar_simbolo(self, nombre):
         """Busca un símbolo en el ámbito actual o en los padres."""
-        if nombre in self.simbolos:
-            return self.simbolos[nombre]
-        elif self.padre:
-            return self.padre.buscar_simbolo(nombre)
+        raiz = self.raiz
+        if raiz.activos[-1] is self:
+            pila = raiz.enlaces.get(nombre)
+            return pila[-1][1] if pila else None
+        ambito = self
+        while ambito:
+            if nombre in ambito.simbolos:
+                return ambito.simbolos[nombre]
+            ambito = ambito.padre
         return None
 
-    def entrar_ambito(self):
-        """Crea un nuevo ámbito hijo y lo retorna."""
-        nuevo_ambito = TablaSimbolos(padre=self)
+    @property
+    def activo(self):
+        activos = self.raiz.activos
+        return self.nivel < len(activos) and activos[self.nivel] is self
+
+    def activar(self):
+        """Convierte este ámbito (ya creado) en el ámbito activo más interno sin modificar el árbol."""
+        raiz = self.raiz
+        cadena = []
+        ambito = self
+        while not ambito.activo:
+            cadena.append(ambito)
+            ambito = ambito.padre
+        # Desactivar los ámbitos más internos que el ancestro activo común.
+        while raiz.activos[-1] is not ambito:
+            saliente = raiz.activos.pop()
+            for nombre in saliente.simbolos:
+                pila = raiz.enlaces[nombre]
+                pila.pop()
+                if not pila:
+                    del raiz.enlaces[nombre]
+        for entrante in reversed(cadena):
+            raiz.activos.append(entrante)
+            for nombre, atributos in entrante.simbolos.items():
+                raiz.enlaces.setdefault(nombre, []).append((entrante.nivel, atributos))
+        return self
+
+    def entrar_ambito(self, nombre=None):
+        """Crea un nuevo ámbito hijo, lo activa y lo retorna."""
+        nuevo_ambito = TablaSimbolos(padre=self, nombre=nombre)
         self.hijos.append(nuevo_ambito)
-        print(f"Entrando a un nuevo ámbito. Total de hijos: {len(self.hijos)}")
-        return nuevo_ambito
+        traza(f"Entrando a un nuevo ámbito. Total de hijos: {len(self.hijos)}")
+        return nuevo_ambito.activar()
 
     def salir_ambito(self):
         """Retorna al ámbito padre."""
-        print("Saliendo del ámbito")
-        return self.padre if self.padre else self
+        traza("Saliendo del ámbito")
+        if self.padre:
+            return self.padre.activar()
+        return self
+
+    def adoptar_ambito(self, ambito):
+        """Agrega como hijo un ámbito inactivo construido en otra tabla, con sus hijos, y lo retorna."""
+        self.hijos.append(ambito)
+        ambito.padre = self
+        raiz = self.raiz
+        def visitar(adoptado, padre):
+            adoptado.raiz = raiz
+            adoptado.nivel = padre.nivel + 1
+            adoptado.errores = raiz.errores
+            raiz.ambitos.append(adoptado)
+            return adoptado
+        recorrer_preorden(ambito, visitar, self)
+        return ambito
+
+    def a_diccionario(self):
+        """Retorna el ámbito y sus hijos como diccionarios y listas, listos para convertir a JSON."""
+        resultado = []
+        def visitar(ambito, hijos_padre):
+            diccionario = {'nombre': ambito.nombre, 'simbolos': ambito.simbolos, 'hijos': []}
+            hijos_padre.append(diccionario)
+            return diccionario['hijos']
+        recorrer_preorden(self, visitar, resultado)
+        return resultado[0]
+
+# Clase para la tabla LL(1) compilada a identificadores enteros.
+class TablaLL1:
+    def __init__(self, terminales, no_terminales, producciones, acciones):
+        self.terminales = terminales  # Terminales en el orden de las columnas del .csv
+        self.no_terminales = no_terminales  # No terminales en el orden de las filas del .csv
+        # Los símbolos comparten un único espacio de ids: primero terminales y luego no terminales,
+        # así un símbolo es terminal si y solo si su id es menor que num_terminales.
+        self.simbolos = terminales + no_terminales
+        self.num_terminales = len(terminales)
+        self.id_terminal = {terminal: i for i, terminal in enumerate(terminales)}
+        self.id_no_terminal = {no_terminal: i for i, no_terminal in enumerate(no_terminales)}
+        self.producciones = producciones  # Lista de tuplas de ids de símbolos; () es la producción 'e'
+        # Una fila array('h') por no terminal con el id de producción (-1 si está vacía),
+        # o una TablaComprimida con las mismas celdas.
+        self.acciones = acciones
+        self.inicial = no_terminales[0]
+
+# Función encargada de cargar una tabla LL1 y compilarla a una tabla de enteros.
+def cargar_tabla_ll1(direccion, tokens_lexico=tokens):
+    with open(direccion, 'r', newline='', encoding='utf-8') as archivo_csv:
+        filas = list(csv.reader(archivo_csv))
+    # Los terminales se internan una sola vez desde la cabecera del .csv y los tokens del léxico,
+    # de modo que la clasificación terminal/no terminal depende de la gramática y no del programa.
+    terminales = filas[0][1:]
+    columnas_tabla = len(terminales)
+    terminales += [token for token in tokens_lexico if token not in terminales]
+    if '$' not in terminales:
+        terminales.append('$')
+    no_terminales = [fila[0] for fila in filas[1:]]
+    ids_simbolos = {simbolo: i for i, simbolo in enumerate(terminales + no_terminales)}
+    producciones = []
+    ids_producciones = {}  # Cada producción distinta se guarda una sola vez.
+    acciones = []
+    for fila in filas[1:]:
+        fila_acciones = array('h', [-1]) * len(terminales)
+        for columna, produccion in enumerate(fila[1:columnas_tabla + 1]):
+            if not produccion:
+                continue
+            if produccion not in ids_producciones:
+                try:
+                    simbolos = () if produccion == 'e' else tuple(ids_simbolos[simbolo] for simbolo in produccion.split())
+                except KeyError as simbolo:
+                    raise ValueError(f"Símbolo desconocido {simbolo} en la producción {fila[0]} -> {produccion}")
+                ids_producciones[produccion] = len(producciones)
+                producciones.append(simbolos)
+            fila_acciones[columna] = ids_producciones[produccion]
+        acciones.append(fila_acciones)
+    return TablaLL1(terminales, no_terminales, producciones, acciones)
+
+# Función que carga el generador de tablas LL(1); su carpeta y su nombre tienen guiones.
+def cargar_generador_ll1():
+    especificacion = importlib.util.spec_from_file_location('generador_ll1', ruta_generador_ll1)
+    generador = importlib.util.module_from_spec(especificacion)
+    especificacion.loader.exec_module(generador)
+    return generador
+
+# Función que carga la tabla LL(1) binaria y la regenera desde la gramática si no existe,
+# está dañada o su huella no coincide con la de la gramática y los tokens actuales.
+def cargar_tabla_binaria(direccion=ruta_tabla_binaria, direccion_gramatica=ruta_gramatica, tokens_lexico=tokens):
+    huella = huella_gramatica(direccion_gramatica, tokens_lexico)
+    try:
+        huella_tabla, terminales, no_terminales, producciones, acciones = leer_tabla_binaria(direccion)
+    except (OSError, ValueError):
+        huella_tabla = None
+    if huella_tabla != huella:
+        traza(f"Regenerando la tabla LL(1) binaria: {direccion}")
+        generador = cargar_generador_ll1()
+        _, terminales, no_terminales, producciones, acciones = generador.generar_tabla_binaria(None, direccion_gramatica, tokens_lexico)
+        try:
+            escribir_tabla_binaria(direccion, huella, terminales, no_terminales, producciones, acciones)
+        except OSError as error:
+            # Sin permisos de escritura la tabla se usa igual, solo que se regenerará en la próxima ejecución.
+            traza(f"No se pudo guardar la tabla LL(1) binaria: {error}")
+    return TablaLL1(terminales, no_terminales, producciones, acciones)
+
+# Función que importa el analizador descendente recursivo generado desde la gramática.
+# Si no existe o su huella no coincide con la gramática y los tokens actuales, se vuelve a generar.
+def cargar_analizador_generado():
+    huella = huella_gramatica(ruta_gramatica, tokens)
+    try:
+        modulo = importlib.import_module('analizador_generado')
+    except ImportError:
+        modulo = None
+    if modulo is None or modulo.HUELLA != huella:
+        traza(f"Regenerando el analizador sintáctico: {ruta_analizador_generado}")
+        cargar_generador_ll1().generar_analizador(ruta_analizador_generado, ruta_gramatica, tokens)
+        sys.modules.pop('analizador_generado', None)
+        importlib.invalidate_caches()
+        modulo = importlib.import_module('analizador_generado')
+    return modulo
+
+# Tabla LL(1) cargada una sola vez y compartida por todos los análisis.
+_tabla_ll1 = None
+
+# Función que devuelve la tabla LL(1) por defecto, cargándola solo la primera vez.
+# Se usa la tabla binaria; si la gramática no está disponible se recurre al .csv exportado.
+def obtener_tabla_ll1():
+    global _tabla_ll1
+    if _tabla_ll1 is None:
+        if os.path.exists(ruta_gramatica):
+            _tabla_ll1 = cargar_tabla_binaria()
+        else:
+            _tabla_ll1 = cargar_tabla_ll1(ruta_archivo_ll1)
+    return _tabla_ll1
+
+# Clase que guarda el árbol sintáctico como arreglos paralelos indexados por el id del nodo.
+# El nodo 0 es el $ del fondo de la pila y el nodo 1 es la raíz del árbol.
+class AlmacenArbol:
+    def __init__(self, tabla_ll1):
+        self.nombres = tabla_ll1.simbolos + ['e']  # Nombre de cada id de símbolo; el último es 'e'
+        self.num_terminales = tabla_ll1.num_terminales
+        self.id_e = len(self.nombres) - 1
+        self.simbolo = array('h')  # Id de símbolo del nodo
+        self.valor = array('i')  # Índice del valor en self.valores, -1 si no tiene
+        self.linea = array('i')  # -1 si no tiene línea
+        self.posicion = array('i')  # Posición del token en el código, -1 si no tiene
+        self.lineas = None  # IndiceLineas del código, para resolver las columnas al pedirlas
+        self.padre = array('i')
+        self.primer_hijo = array('i')
+        self.siguiente_hermano = array('i')
+        self.valores = ['e']  # Valores de los tokens; el índice 0 es el valor de los nodos 'e'
+
+    def __len__(self):
+        return len(self.simbolo)
 
-# Función encargada de cargar una tabla LL1.
-def cargar_tabla_ll1(direccion):
-    df = pd.read_csv(direccion, index_col=0)
-    df = df.fillna('')
-    return df
+    def agregar_hijos(self, padre, simbolos):
+        """Agrega como hijos de padre un nodo por cada símbolo y retorna el id del primero."""
+        primero = len(self.simbolo)
+        cantidad = len(simbolos)
+        self.simbolo.extend(simbolos)
+        self.valor.extend([-1] * cantidad)
+        self.linea.extend([-1] * cantidad)
+        self.posicion.extend([-1] * cantidad)
+        self.padre.extend([padre] * cantidad)
+        self.primer_hijo.extend([-1] * cantidad)
+        self.siguiente_hermano.extend(range(primero + 1, primero + cantidad))
+        self.siguiente_hermano.append(-1)
+        if padre >= 0:
+            self.primer_hijo[padre] = primero
+        return primero
 
-# Clase Nodo para crear el árbol sintáctico.
+    def asignar_valor(self, nodo, valor):
+        self.valor[nodo] = len(self.valores)
+        self.valores.append(valor)
+
+    def hijos(self, nodo):
+        """Retorna los ids de los hijos de un nodo en orden."""
+        hijos = []
+        hijo = self.primer_hijo[nodo]
+        while hijo >= 0:
+            hijos.append(hijo)
+            hijo = self.siguiente_hermano[hijo]
+        return hijos
+
+    def nodo(self, indice):
+        return Nodo(self, indice)
+
+    def memoria(self):
+        """Retorna los bytes que ocupan los arreglos del árbol y la lista de valores."""
+        arreglos = (self.simbolo, self.valor, self.linea, self.posicion, self.padre, self.primer_hijo, self.siguiente_hermano)
+        return sum(arreglo.itemsize * len(arreglo) for arreglo in arreglos) + sys.getsizeof(self.valores)
+
+# Clase Nodo: vista ligera de un nodo del AlmacenArbol con la interfaz del árbol sintáctico.
 class Nodo:
-    def __init__(self, id, tipo, valor=None, linea=None, columna=None, terminal=False):
+    __slots__ = ('arbol', 'id')
+
+    def __init__(self, arbol, id):
+        self.arbol = arbol
         self.id = id
-        self.tipo = tipo
-        self.valor = valor
-        self.linea = linea
-        self.columna = columna
-        self.terminal = terminal
-        self.hijos = []
-        self.padre = None
-    
+
+    def __eq__(self, otro):
+        return isinstance(otro, Nodo) and otro.arbol is self.arbol and otro.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return f"Nodo({self.id}, {self.tipo})"
+
+    @property
+    def tipo(self):
+        return self.arbol.nombres[self.arbol.simbolo[self.id]]
+
+    @property
+    def terminal(self):
+        simbolo = self.arbol.simbolo[self.id]
+        return simbolo < self.arbol.num_terminales or simbolo == self.arbol.id_e
+
+    @property
+    def valor(self):
+        indice = self.arbol.valor[self.id]
+        return self.arbol.valores[indice] if indice >= 0 else None
+
+    @valor.setter
+    def valor(self, valor):
+        self.arbol.asignar_valor(self.id, valor)
+
+    @property
+    def linea(self):
+        linea = self.arbol.linea[self.id]
+        return linea if linea >= 0 else None
+
+    @linea.setter
+    def linea(self, linea):
+        self.arbol.linea[self.id] = linea if linea is not None else -1
+
+    @property
+    def posicion(self):
+        posicion = self.arbol.posicion[self.id]
+        return posicion if posicion >= 0 else None
+
+    @posicion.setter
+    def posicion(self, posicion):
+        self.arbol.posicion[self.id] = posicion if posicion is not None else -1
+
+    @property
+    def columna(self):
+        posicion = self.arbol.posicion[self.id]
+        if posicion < 0:
+            return None
+        return self.arbol.lineas.columna(posicion) if self.arbol.lineas is not None else posicion
+
+    @property
+    def hijos(self):
+        return [Nodo(self.arbol, hijo) for hijo in self.arbol.hijos(self.id)]
+
+    @property
+    def padre(self):
+        padre = self.arbol.padre[self.id]
+        return Nodo(self.arbol, padre) if padre >= 0 else None
+
     def añadir_hijo(self, hijo):
-        hijo.padre = self  
-        self.hijos.append(hijo)
+        """Enlaza un nodo existente del mismo árbol como último hijo."""
+        arbol = self.arbol
+        arbol.padre[hijo.id] = self.id
+        arbol.siguiente_hermano[hijo.id] = -1
+        ultimo = arbol.primer_hijo[self.id]
+        if ultimo < 0:
+            arbol.primer_hijo[self.id] = hijo.id
+            return
+        while arbol.siguiente_hermano[ultimo] >= 0:
+            ultimo = arbol.siguiente_hermano[ultimo]
+        arbol.siguiente_hermano[ultimo] = hijo.id
+
+# Función que obtiene la etiqueta de un nodo según el atributo que se quiere ver en el diagrama.
+def etiqueta_nodo(node, opcion="tipo"):
+    if opcion == "tipo":
+        return f"{node.tipo}"
+    elif opcion == "linea":
+        return f"{node.linea}"
+    elif opcion == "columna":
+        return f"{node.columna}"
+    elif opcion == "valor":
+        return f"{node.valor}"
+    elif opcion == "id":
+        return f"{node.id}"
+    elif opcion == "terminal":
+        return f"{node.terminal}"
+    else:
+        return f"{node.tipo}"
 
 # Función para generar el Digraph del árbol sintáctico.
 def arbolSintactico(raiz, contorno_hojas=False, opcion="tipo"):
+    from graphviz import Digraph
     graph = Digraph()
-    def generar_nodos(node):
-        if opcion == "tipo":
-            label = f"{node.tipo}"
-        elif opcion == "linea":
-            label = f"{node.linea}"
-        elif opcion == "columna":
-            label = f"{node.columna}"
-        elif opcion == "valor":
-            label = f"{node.valor}"
-        elif opcion == "id":
-            label = f"{node.id}"
-        elif opcion == "terminal":
-            label = f"{node.terminal}"
-        else:
-            label = f"{node.tipo}"
+    def generar_nodos(node, id_padre):
+        label = etiqueta_nodo(node, opcion)
+        # Cada nodo recibe como contexto el id de su padre para dibujar la arista antes del nodo.
+        if id_padre is not None:
+            graph.edge(id_padre, str(node.id))
         if not node.hijos and contorno_hojas:
             graph.node(str(node.id), label, style="filled", fillcolor='lightgrey', peripheries='2')
         else:
             graph.node(str(node.id), label, style="filled", fillcolor='white')
-        for hijo in node.hijos:
-            graph.edge(str(node.id), str(hijo.id))
-            generar_nodos(hijo)
-    generar_nodos(raiz)
+        return str(node.id)
+    recorrer_preorden(raiz, generar_nodos)
     return graph
 
-#Lista de errores semanticos
-errores_semanticos = []
+# Identificadores que el lenguaje DOT acepta sin comillas y palabras reservadas de DOT.
+ID_DOT = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*|-?(\.[0-9]+|[0-9]+(\.[0-9]*)?))$')
+HTML_DOT = re.compile(r'<.*>$', re.DOTALL)
+PALABRAS_DOT = {'node', 'edge', 'graph', 'digraph', 'subgraph', 'strict'}
+COMILLAS_DOT = re.compile(r'(?P<barras>(?:\\{2})*)\\?(?P<comilla>")')
+
+# Función que pone entre comillas una etiqueta igual que graphviz cuando no es un identificador DOT.
+def citar_dot(texto):
+    if HTML_DOT.match(texto) or (ID_DOT.match(texto) and texto.lower() not in PALABRAS_DOT):
+        return texto
+    return '"' + COMILLAS_DOT.sub(r'\g<barras>\\\g<comilla>', texto) + '"'
+
+# Función que escribe el árbol sintáctico en formato DOT directamente en el archivo mientras lo recorre.
+# El resultado es idéntico al de arbolSintactico(...).source sin el salto de línea final, pero sin
+# construir el Digraph ni el texto completo en memoria.
+def escribir_arbol_dot(raiz, ruta, contorno_hojas=False, opcion="tipo"):
+    arbol = raiz.arbol
+    nombres = arbol.nombres
+    simbolo = arbol.simbolo
+    primer_hijo = arbol.primer_hijo
+    hoja = ' fillcolor=lightgrey peripheries=2 style=filled]\n' if contorno_hojas else ' fillcolor=white style=filled]\n'
+    with open(ruta, 'w', buffering=1 << 16) as archivo:
+        escribir = archivo.write
+        escribir("digraph {\n")
+        # Cada nodo recibe como contexto el id de su padre para escribir la arista antes del nodo.
+        def escribir_nodo(id_nodo, id_padre):
+            if id_padre is not None:
+                escribir(f"\t{id_padre} -> {id_nodo}\n")
+            if opcion == "tipo" or opcion not in ("linea", "columna", "valor", "id", "terminal"):
+                label = nombres[simbolo[id_nodo]]
+            else:
+                label = etiqueta_nodo(arbol.nodo(id_nodo), opcion)
+            escribir(f"\t{id_nodo} [label={citar_dot(label)}")
+            escribir(hoja if primer_hijo[id_nodo] < 0 else ' fillcolor=white style=filled]\n')
+            return id_nodo
+        recorrer_preorden(raiz.id, escribir_nodo, obtener_hijos=arbol.hijos)
+        escribir("}")
 
 #Verificar que las variables esten declaradas 
 def verificar_variable(nodo, ambito_actual):
-    if nodo.tipo == 'restofuncn' or nodo.tipo == 'restomain':
-        ambito_actual = ambito_actual.hijos.pop(0)
-
-    if nodo.tipo == 'id' and nodo.valor:
-        simbolo = ambito_actual.buscar_simbolo(nodo.valor)
-        if not simbolo:
-            mensaje = f"❌ Error semántico: La variable '{nodo.valor}' no está declarada en la línea {nodo.linea}, columna {nodo.columna}"
-            errores_semanticos.append(mensaje)
-    for hijo in nodo.hijos:
-        verificar_variable(hijo, ambito_actual)
+    # Los ámbitos de las funciones se recorren en orden sin sacarlos de la tabla de símbolos.
+    ambito_inicial = ambito_actual
+    ambitos_funciones = iter(ambito_actual.hijos)
+    # El contexto de cada nodo es el ámbito en el que se resuelven sus identificadores.
+    def visitar(nodo, ambito_actual):
+        if nodo.tipo == 'restofuncn' or nodo.tipo == 'restomain':
+            ambito_actual = next(ambitos_funciones).activar()
+
+        if nodo.tipo == 'id' and nodo.valor:
+            simbolo = ambito_actual.buscar_simbolo(nodo.valor)
+            if not simbolo:
+                mensaje = f"La variable '{nodo.valor}' no está declarada en la línea {nodo.linea}, columna {nodo.columna}"
+                ambito_actual.errores.append(ErrorSemantico(mensaje, nodo.linea, nodo.columna))
+        return ambito_actual
+    recorrer_preorden(nodo, visitar, ambito_actual)
+    ambito_inicial.activar()
 
 
 # Función para generar el Digraph de la tabla de símbolos.
 def generar_diagrama_tabla_simbolos(tabla_simbolos, graph=None, id_padre=None):
     if graph is None:
+        from graphviz import Digraph
         graph = Digraph()
-    id_nodo = str(id(tabla_simbolos))
-    # Construir la etiqueta con los símbolos del ámbito
-    lista_simbolos = []
-    for nombre, attrs in tabla_simbolos.simbolos.items():
-        if attrs['categoria'] == 'function':
-            params_str = ', '.join([f"{p['nombre']}: {p['tipo']}" for p in attrs['parámetros']])
-            lista_simbolos.append(f"{nombre} (parámetros: [{params_str}], retorno: {attrs['retorno']})")
-        else:
-            lista_simbolos.append(f"{nombre}: {attrs['tipo']}")
-    etiqueta = f"Ámbito\n[{', '.join(lista_simbolos) if lista_simbolos else 'Sin símbolos'}]"
-    graph.node(id_nodo, etiqueta, shape='box')
-    if id_padre:
-        graph.edge(id_padre, id_nodo)
-    for hijo in tabla_simbolos.hijos:
-        generar_diagrama_tabla_simbolos(hijo, graph, id_nodo)
+    def visitar(ambito, id_padre):
+        id_nodo = str(id(ambito))
+        # Construir la etiqueta con los símbolos del ámbito
+        lista_simbolos = []
+        for nombre, attrs in ambito.simbolos.items():
+            if attrs['categoria'] == 'function':
+                params_str = ', '.join([f"{p['nombre']}: {p['tipo']}" for p in attrs['parámetros']])
+                lista_simbolos.append(f"{nombre} (parámetros: [{params_str}], retorno: {attrs['retorno']})")
+            else:
+                lista_simbolos.append(f"{nombre}: {attrs['tipo']}")
+        etiqueta = f"Ámbito\n[{', '.join(lista_simbolos) if lista_simbolos else 'Sin símbolos'}]"
+        graph.node(id_nodo, etiqueta, shape='box')
+        if id_padre:
+            graph.edge(id_padre, id_nodo)
+        return id_nodo
+    recorrer_preorden(tabla_simbolos, visitar, id_padre)
     return graph
 
 # Nueva función para generar una tabla de símbolos en formato CSV
@@ -182,19 +578,20 @@ def generar_tabla_simbolos_csv(tabla_simbolos, nombre_archivo, output_folder):
         # Procesar ámbitos hijos (ámbitos locales de funciones)
         for i, hijo in enumerate(ambito_actual.hijos):
             # Determinar el nombre del ámbito hijo (basado en la función padre)
-            nombre_funcion = list(ambito_actual.simbolos.keys())[i] if i < len(ambito_actual.simbolos) else f"Ámbito_{i}"
+            nombre_funcion = hijo.nombre or (list(ambito_actual.simbolos.keys())[i] if i < len(ambito_actual.simbolos) else f"Ámbito_{i}")
             recorrer_ambitos(hijo, nombre_funcion)
 
     # Recorrer todos los ámbitos desde el global
     recorrer_ambitos(tabla_simbolos)
 
     # Crear un DataFrame con los datos
+    import pandas as pd
     df = pd.DataFrame(datos_tabla, columns=['Símbolo', 'Categoría', 'Tipo', 'Ámbito', 'Parámetros', 'Retorno'])
     
     # Guardar la tabla en un archivo CSV
     ruta_csv = os.path.join(output_folder, f"{nombre_archivo}-tabla-simbolos.csv")
     df.to_csv(ruta_csv, index=False, encoding='utf-8')
-    print(f"Tabla de símbolos generada: {ruta_csv}")
+    traza(f"Tabla de símbolos generada: {ruta_csv}")
 
 # Funciones para construir la tabla de símbolos recorriendo el árbol sintáctico
 def buscar_hijo(nodo, tipo):
@@ -209,29 +606,30 @@ def extraer_parametros(nodo_parametrosf):
     parámetros = []
     if not nodo_parametrosf:
         return parámetros
-    print(f"Extrayendo parámetros del nodo: {nodo_parametrosf.tipo}")
-    # 'parametrosf' -> 'id tipodato masparametrosf' o vacío
-    if not nodo_parametrosf.hijos:
-        return parámetros  # Producción vacía
-    nodo_id = buscar_hijo(nodo_parametrosf, 'id')
-    nodo_tipodato = buscar_hijo(nodo_parametrosf, 'tipodato')
-    nodo_masparametrosf = buscar_hijo(nodo_parametrosf, 'masparametrosf')
-    if nodo_id and nodo_id.valor and nodo_tipodato and nodo_tipodato.hijos:
-        tipo_param = nodo_tipodato.hijos[0].tipo
-        parámetros.append({'nombre': nodo_id.valor, 'tipo': tipo_param})
-        print(f"Parámetro encontrado: {nodo_id.valor}, tipo: {tipo_param}")
-    else:
-        print("No se encontró un parámetro en este nodo")
-    if nodo_masparametrosf and nodo_masparametrosf.hijos:
-        # 'masparametrosf' -> 'coma parametrosf' o vacío
-        siguientes_params = buscar_hijo(nodo_masparametrosf, 'parametrosf')
-        if siguientes_params:
-            parámetros.extend(extraer_parametros(siguientes_params))
+    def visitar(nodo_parametrosf, contexto):
+        traza(f"Extrayendo parámetros del nodo: {nodo_parametrosf.tipo}")
+        # 'parametrosf' -> 'id tipodato masparametrosf' o vacío
+        if not nodo_parametrosf.hijos:
+            return OMITIR_HIJOS  # Producción vacía
+        nodo_id = buscar_hijo(nodo_parametrosf, 'id')
+        nodo_tipodato = buscar_hijo(nodo_parametrosf, 'tipodato')
+        if nodo_id and nodo_id.valor and nodo_tipodato and nodo_tipodato.hijos:
+            tipo_param = nodo_tipodato.hijos[0].tipo
+            parámetros.append({'nombre': nodo_id.valor, 'tipo': tipo_param})
+            traza(f"Parámetro encontrado: {nodo_id.valor}, tipo: {tipo_param}")
+        else:
+            traza("No se encontró un parámetro en este nodo")
+    # Solo se desciende al siguiente 'parametrosf': 'masparametrosf' -> 'coma parametrosf' o vacío
+    def siguiente_parametro(nodo_parametrosf):
+        nodo_masparametrosf = buscar_hijo(nodo_parametrosf, 'masparametrosf')
+        siguientes_params = buscar_hijo(nodo_masparametrosf, 'parametrosf') if nodo_masparametrosf else None
+        return [siguientes_params] if siguientes_params else []
+    recorrer_preorden(nodo_parametrosf, visitar, obtener_hijos=siguiente_parametro)
     return parámetros
 
 def procesar_asignaciones(nodo_asignaciones, ambito):
     """Procesa un nodo 'asignaciones' para registrar variables."""
-    print(f"Procesando nodo asignaciones: {nodo_asignaciones.tipo}")
+    traza(f"Procesando nodo asignaciones: {nodo_asignaciones.tipo}")
     nodo_id = buscar_hijo(nodo_asignaciones, 'id')
     nodo_ext = buscar_hijo(nodo_asignaciones, 'ext')
     if nodo_id and nodo_id.valor and nodo_ext and nodo_ext.hijos:
@@ -239,39 +637,42 @@ def procesar_asignaciones(nodo_asignaciones, ambito):
         if hijo_ext.tipo == 'tipodato' and hijo_ext.hijos:
             tipo_var = hijo_ext.hijos[0].tipo
             ambito.agregar_simbolo(nodo_id.valor, tipo=tipo_var, categoria='variable')
-            print(f"Variable registrada: {nodo_id.valor}, tipo: {tipo_var}")
+            traza(f"Variable registrada: {nodo_id.valor}, tipo: {tipo_var}")
         else:
-            print("No se encontró tipo para la variable")
+            traza("No se encontró tipo para la variable")
     else:
-        print("No se encontró variable en asignaciones")
+        traza("No se encontró variable en asignaciones")
 
 def procesar_instrucciones(nodo_masinstrucciones, ambito):
     """Procesa las instrucciones dentro de un nodo 'masinstrucciones'."""
     if not nodo_masinstrucciones:
         return
-    print(f"Procesando nodo masinstrucciones: {nodo_masinstrucciones.tipo}")
-    for hijo in nodo_masinstrucciones.hijos:
-        print(f"Nodo hijo: {hijo.tipo}")
-        if hijo.tipo == 'instruccion':
-            hijo_instruccion = hijo.hijos[0] if hijo.hijos else None
-            if hijo_instruccion and hijo_instruccion.tipo == 'asignaciones':
-                procesar_asignaciones(hijo_instruccion, ambito)
-        elif hijo.tipo == 'masinstrucciones':
-            procesar_instrucciones(hijo, ambito)
+    def visitar(nodo_masinstrucciones, contexto):
+        traza(f"Procesando nodo masinstrucciones: {nodo_masinstrucciones.tipo}")
+        for hijo in nodo_masinstrucciones.hijos:
+            traza(f"Nodo hijo: {hijo.tipo}")
+            if hijo.tipo == 'instruccion':
+                hijo_instruccion = hijo.hijos[0] if hijo.hijos else None
+                if hijo_instruccion and hijo_instruccion.tipo == 'asignaciones':
+                    procesar_asignaciones(hijo_instruccion, ambito)
+    # Solo se desciende por la cadena 'masinstrucciones' -> 'instruccion masinstrucciones'.
+    def siguientes_instrucciones(nodo_masinstrucciones):
+        return [hijo for hijo in nodo_masinstrucciones.hijos if hijo.tipo == 'masinstrucciones']
+    recorrer_preorden(nodo_masinstrucciones, visitar, obtener_hijos=siguientes_instrucciones)
 
 def procesar_funcion(nodo_func, ambito):
     """Procesa un nodo 'restofuncn' o 'restomain' para registrar una función y su ámbito."""
-    print(f"Procesando nodo función: {nodo_func.tipo}")
+    traza(f"Procesando nodo función: {nodo_func.tipo}")
     if nodo_func.tipo == 'restomain':
         nombre_func = 'main'
         parámetros = []
         retorno = 'tentero'
-        print("Función main encontrada")
+        traza("Función main encontrada")
     elif nodo_func.tipo == 'restofuncn':
         nodo_id = buscar_hijo(nodo_func, 'id')
         nombre_func = nodo_id.valor if nodo_id and nodo_id.valor else None
         if not nombre_func:
-            print("Nombre de función no encontrado")
+            traza("Nombre de función no encontrado")
             return
         nodo_param = buscar_hijo(nodo_func, 'parametrosf')
         parámetros = extraer_parametros(nodo_param) if nodo_param else []
@@ -281,15 +682,15 @@ def procesar_funcion(nodo_func, ambito):
             nodo_tipodato = buscar_hijo(nodo_opciondato, 'tipodato')
             if nodo_tipodato and nodo_tipodato.hijos:
                 retorno = nodo_tipodato.hijos[0].tipo  # Extraer el tipo real (tentero, tflotante, etc.)
-        print(f"Función encontrada: {nombre_func}, parámetros: {parámetros}, retorno: {retorno}")
+        traza(f"Función encontrada: {nombre_func}, parámetros: {parámetros}, retorno: {retorno}")
     else:
-        print("No es un nodo de función")
+        traza("No es un nodo de función")
         return
 
     # Registrar la función en el ámbito actual
     ambito.agregar_simbolo(nombre_func, categoria='function', parámetros=parámetros, retorno=retorno)
     # Crear un nuevo ámbito para la función
-    ambito_func = ambito.entrar_ambito()
+    ambito_func = ambito.entrar_ambito(nombre_func)
     # Registrar los parámetros en el ámbito de la función
     for param in parámetros:
         ambito_func.agregar_simbolo(param['nombre'], tipo=param['tipo'], categoria='parametro')
@@ -301,13 +702,13 @@ def procesar_funcion(nodo_func, ambito):
 def construir_tabla_simbolos(arbol, tabla_simbolos):
     """Construye la tabla de símbolos recorriendo el árbol sintáctico."""
     if arbol.tipo != 'programaprincipal':
-        print(f"El nodo raíz no es 'programaprincipal', se encontró: {arbol.tipo}")
+        traza(f"El nodo raíz no es 'programaprincipal', se encontró: {arbol.tipo}")
         return
-    print("Construyendo tabla de símbolos desde programaprincipal")
+    traza("Construyendo tabla de símbolos desde programaprincipal")
     # Procesar funciones definidas en el programa
     nodo_actual = arbol
     while nodo_actual and nodo_actual.tipo == 'programaprincipal':
-        print(f"Procesando nodo programaprincipal con hijos: {[hijo.tipo for hijo in nodo_actual.hijos]}")
+        traza(f"Procesando nodo programaprincipal con hijos: {[hijo.tipo for hijo in nodo_actual.hijos]}")
         # Buscar 'funcion' -> 'restofuncn' o 'opcionprincipal' -> 'restomain'/'restofuncn'
         nodo_funcion = buscar_hijo(nodo_actual, 'funcion')
         nodo_opcionprincipal = buscar_hijo(nodo_actual, 'opcionprincipal')
@@ -324,137 +725,322 @@ def construir_tabla_simbolos(arbol, tabla_simbolos):
             break
 
 # Función que realiza el algoritmo analizador sintáctico.
-def analizador_sintactico(lista_de_tokens, tabla_ll1):
+# Recibe cualquier iterable de tokens (por ejemplo el generador del léxico) y lo consume
+# con un solo token de anticipación; al agotarse el flujo se usa el token de fin $.
+# acciones_semanticas es opcional y debe tener dos listas de funciones (o None):
+#   expansiones[i](produccion, token) se llama al expandir el no terminal i con la anticipación token;
+#   emparejamientos[t](token) se llama al emparejar el terminal t con un token.
+# Con construir_arbol=False no se crea el árbol y solo se valida (útil junto con las acciones).
+# Un BufferTokens se recorre directamente sobre sus arreglos, con el mismo resultado.
+def analizador_sintactico(flujo_de_tokens, tabla_ll1, acciones_semanticas=None, construir_arbol=True):
+    if isinstance(flujo_de_tokens, BufferTokens):
+        return _analizar_buffer(flujo_de_tokens, tabla_ll1, acciones_semanticas, construir_arbol)
     errores_sintacticos = []
-    pila = []
-    inicial = tabla_ll1.index[0]
-    contador = 0
-    nodo_dolar = Nodo(contador, "$", None, None, None, True)
-    nodo_inicio = Nodo(contador + 1, inicial, None, None, None, False)
-    pila.append(nodo_dolar)
-    pila.append(nodo_inicio)
-    nodoPadre = nodo_inicio
-    arbol = nodoPadre
-    contador += 2
-    indice = 0
+    id_fin = tabla_ll1.id_terminal["$"]
+    num_terminales = tabla_ll1.num_terminales
+    id_inicial = num_terminales + tabla_ll1.id_no_terminal[tabla_ll1.inicial]
+    if construir_arbol:
+        arbol = AlmacenArbol(tabla_ll1)
+        nodo_dolar = arbol.agregar_hijos(-1, (id_fin,))
+        nodo_inicio = arbol.agregar_hijos(-1, (id_inicial,))
+        agregar_hijos = arbol.agregar_hijos
+        asignar_valor = arbol.asignar_valor
+        lineas = arbol.linea
+        posiciones = arbol.posicion
+        produccion_e = (arbol.id_e,)
+    else:
+        arbol = None
+        nodo_dolar = nodo_inicio = -1
+    if acciones_semanticas is not None:
+        expansiones = acciones_semanticas.expansiones
+        emparejamientos = acciones_semanticas.emparejamientos
+    else:
+        expansiones = emparejamientos = None
+    # La pila guarda parejas (id de símbolo, id de nodo); los nodos viven en el AlmacenArbol.
+    pila = [(id_fin, nodo_dolar), (id_inicial, nodo_inicio)]
+    flujo_de_tokens = iter(flujo_de_tokens)
+    token_actual = next(flujo_de_tokens, TOKEN_FIN)
+    if arbol is not None:
+        # Los nodos guardan la posición del token y resuelven su columna con el índice del código.
+        arbol.lineas = token_actual.lineas
+    # Referencias locales a la tabla compilada y al árbol para evitar búsquedas de atributos en el bucle.
+    id_terminal = tabla_ll1.id_terminal
+    acciones = tabla_ll1.acciones
+    # Con la tabla comprimida las celdas se buscan en el vector peine en lugar de en las filas.
+    if isinstance(acciones, TablaComprimida):
+        base, valores_comprimidos, control = acciones.base, acciones.valor, acciones.control
+        acciones = None
+    producciones = tabla_ll1.producciones
+    simbolos_tabla = tabla_ll1.simbolos
 
     while pila:
-        cima = pila.pop()
-        if cima.terminal and indice < len(lista_de_tokens) and lista_de_tokens[indice].tipo == cima.tipo:
-            token_actual = lista_de_tokens[indice]
-            cima.valor = token_actual.valor
-            cima.linea = token_actual.linea
-            cima.columna = token_actual.columna
-            indice += 1
-        elif cima.terminal:
-            return False, None, errores_sintacticos
-        elif cima.tipo in tabla_ll1.index:
-            if indice < len(lista_de_tokens):
-                token_actual = lista_de_tokens[indice].tipo
-                try:
-                    produccion = tabla_ll1.at[cima.tipo, token_actual]
-                    if produccion:
-                        if produccion == 'e':
-                            nodo_e = Nodo(contador, "e", "e", None, None, True)
-                            cima.añadir_hijo(nodo_e)
-                            contador += 1
-                        else:
-                            simbolos = produccion.split()
-                            nuevos_hijos = []
-                            for simbolo in simbolos:
-                                es_terminal = simbolo in [token.tipo for token in lista_de_tokens]
-                                nodo_hijo = Nodo(contador, simbolo, None, None, None, es_terminal)
-                                nuevos_hijos.append(nodo_hijo)
-                                contador += 1
-                            for hijo in reversed(nuevos_hijos):
-                                pila.append(hijo)
-                            for hijo in nuevos_hijos:
-                                cima.añadir_hijo(hijo)
-                    else:
-                        token_error = lista_de_tokens[indice]
-                        error = ErrorSintactico(cima.tipo, "e", token_error.linea, token_error.columna)
-                        errores_sintacticos.append(error)
-                        return False, None, errores_sintacticos
-                except KeyError:
-                    token_error = lista_de_tokens[indice]
-                    error = ErrorSintactico(cima.tipo, "", token_error.linea, token_error.columna)
-                    errores_sintacticos.append(error)
-                    return False, None, errores_sintacticos
+        id_cima, cima = pila.pop()
+        if id_cima < num_terminales:
+            if token_actual is not None and token_actual.tipo == simbolos_tabla[id_cima]:
+                if arbol is not None:
+                    asignar_valor(cima, token_actual.valor)
+                    if token_actual.linea is not None:
+                        lineas[cima] = token_actual.linea
+                        posiciones[cima] = token_actual.posicion
+                if emparejamientos is not None and emparejamientos[id_cima] is not None:
+                    emparejamientos[id_cima](token_actual)
+                # Después del $ ya no quedan tokens por leer.
+                token_actual = next(flujo_de_tokens, TOKEN_FIN) if id_cima != id_fin else None
             else:
-                token_error = lista_de_tokens[indice]
-                error = ErrorSintactico("", "", token_error.linea, token_error.columna)
+                return False, None, errores_sintacticos
+        elif token_actual is not None:
+            columna = id_terminal.get(token_actual.tipo)
+            if columna is None:
+                error = ErrorSintactico(simbolos_tabla[id_cima], "", token_actual.linea, token_actual.columna)
                 errores_sintacticos.append(error)
                 return False, None, errores_sintacticos
+            fila = id_cima - num_terminales
+            if acciones is not None:
+                id_produccion = acciones[fila][columna]
+            else:
+                indice = base[fila] + columna
+                id_produccion = valores_comprimidos[indice] if control[indice] == fila else -1
+            if id_produccion < 0:
+                error = ErrorSintactico(simbolos_tabla[id_cima], "e", token_actual.linea, token_actual.columna)
+                errores_sintacticos.append(error)
+                return False, None, errores_sintacticos
+            produccion = producciones[id_produccion]
+            if expansiones is not None and expansiones[id_cima - num_terminales] is not None:
+                expansiones[id_cima - num_terminales](produccion, token_actual)
+            if arbol is None:
+                pila.extend((id_simbolo, -1) for id_simbolo in reversed(produccion))
+            elif not produccion:
+                nodo_e = agregar_hijos(cima, produccion_e)
+                arbol.valor[nodo_e] = 0
+            else:
+                primero = agregar_hijos(cima, produccion)
+                pila.extend(zip(reversed(produccion), range(primero + len(produccion) - 1, primero - 1, -1)))
         else:
-            token_error = lista_de_tokens[indice]
-            error = ErrorSintactico(cima.tipo, "", token_error.linea, token_error.columna)
+            error = ErrorSintactico("", "", None, None)
             errores_sintacticos.append(error)
             return False, None, errores_sintacticos
-    exito = indice == len(lista_de_tokens)
-    return exito, arbol, errores_sintacticos
+    # El análisis es exitoso si tras el $ no quedan tokens sin consumir.
+    exito = token_actual is None and next(flujo_de_tokens, None) is None
+    return exito, (arbol.nodo(nodo_inicio) if arbol is not None else None), errores_sintacticos
 
-# Cargamos la tabla LL1.
-tabla_ll1 = cargar_tabla_ll1(ruta_archivo_ll1)
+# Versión del analizador sintáctico que lee los tokens de los arreglos de un BufferTokens.
+# Los tipos se traducen una vez a ids de terminal y solo se crea un Token para las acciones
+# semánticas y los errores.
+def _analizar_buffer(buffer, tabla_ll1, acciones_semanticas, construir_arbol):
+    errores_sintacticos = []
+    id_fin = tabla_ll1.id_terminal["$"]
+    num_terminales = tabla_ll1.num_terminales
+    id_inicial = num_terminales + tabla_ll1.id_no_terminal[tabla_ll1.inicial]
+    if construir_arbol:
+        arbol = AlmacenArbol(tabla_ll1)
+        nodo_dolar = arbol.agregar_hijos(-1, (id_fin,))
+        nodo_inicio = arbol.agregar_hijos(-1, (id_inicial,))
+        arbol.lineas = buffer.lineas
+        agregar_hijos = arbol.agregar_hijos
+        asignar_valor = arbol.asignar_valor
+        lineas = arbol.linea
+        posiciones = arbol.posicion
+        produccion_e = (arbol.id_e,)
+    else:
+        arbol = None
+        nodo_dolar = nodo_inicio = -1
+    if acciones_semanticas is not None:
+        expansiones = acciones_semanticas.expansiones
+        emparejamientos = acciones_semanticas.emparejamientos
+    else:
+        expansiones = emparejamientos = None
+    # Id de terminal de cada código de tipo del buffer, -1 si la tabla no tiene ese terminal.
+    traduccion = [tabla_ll1.id_terminal.get(tipo, -1) for tipo in tokens]
+    tipos = buffer.tipo
+    indices_valores = buffer.valor
+    valores = buffer.valores
+    lineas_tokens = buffer.linea
+    posiciones_tokens = buffer.posicion
+    total = len(tipos)
 
-# Llamada al analizador sintáctico.
-respuesta, arbol_sintactico, errores_sintacticos = analizador_sintactico(lista_de_tokens, tabla_ll1)
+    # Función que retorna el token de la posición i, o el token de fin si ya no quedan.
+    def token_en(i):
+        return buffer[i] if i < total else TOKEN_FIN
 
-# Definimos nombre del árbol y del atributo que deseamos mostrar en el .dot.
-nombre_arbol = f"arbol-{os.path.splitext(archivo)[0]}"
-atributo_arbol = "tipo"  # Evaluar el atributo del nodo que se quiere ver
+    pila = [(id_fin, nodo_dolar), (id_inicial, nodo_inicio)]
+    i = 0
+    id_actual = traduccion[tipos[0]] if total else id_fin
+    acciones = tabla_ll1.acciones
+    if isinstance(acciones, TablaComprimida):
+        base, valores_comprimidos, control = acciones.base, acciones.valor, acciones.control
+        acciones = None
+    producciones = tabla_ll1.producciones
+    simbolos_tabla = tabla_ll1.simbolos
 
-# Mostrar el resultado del análisis léxico.
-mostrar_resultado_lexico(lista_errores_lexicos)
+    while pila:
+        id_cima, cima = pila.pop()
+        if id_cima < num_terminales:
+            if id_cima != id_actual:
+                return False, None, errores_sintacticos
+            if i < total:
+                if arbol is not None:
+                    asignar_valor(cima, valores[indices_valores[i]])
+                    lineas[cima] = lineas_tokens[i]
+                    posiciones[cima] = posiciones_tokens[i]
+            elif arbol is not None:
+                asignar_valor(cima, TOKEN_FIN.valor)
+            if emparejamientos is not None and emparejamientos[id_cima] is not None:
+                emparejamientos[id_cima](token_en(i))
+            # Después del $ ya no quedan tokens por leer.
+            if id_cima == id_fin:
+                return i >= total, (arbol.nodo(nodo_inicio) if arbol is not None else None), errores_sintacticos
+            i += 1
+            id_actual = traduccion[tipos[i]] if i < total else id_fin
+        else:
+            if id_actual < 0:
+                token = token_en(i)
+                errores_sintacticos.append(ErrorSintactico(simbolos_tabla[id_cima], "", token.linea, token.columna))
+                return False, None, errores_sintacticos
+            fila = id_cima - num_terminales
+            if acciones is not None:
+                id_produccion = acciones[fila][id_actual]
+            else:
+                indice = base[fila] + id_actual
+                id_produccion = valores_comprimidos[indice] if control[indice] == fila else -1
+            if id_produccion < 0:
+                token = token_en(i)
+                errores_sintacticos.append(ErrorSintactico(simbolos_tabla[id_cima], "e", token.linea, token.columna))
+                return False, None, errores_sintacticos
+            produccion = producciones[id_produccion]
+            if expansiones is not None and expansiones[fila] is not None:
+                expansiones[fila](produccion, token_en(i))
+            if arbol is None:
+                pila.extend((id_simbolo, -1) for id_simbolo in reversed(produccion))
+            elif not produccion:
+                nodo_e = agregar_hijos(cima, produccion_e)
+                arbol.valor[nodo_e] = 0
+            else:
+                primero = agregar_hijos(cima, produccion)
+                pila.extend(zip(reversed(produccion), range(primero + len(produccion) - 1, primero - 1, -1)))
+    return False, None, errores_sintacticos
 
-# Verificamos el análisis sintáctico.
-if respuesta:
-    output_folder = 'salida-arboles'
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder)
-    
-    # Generar el árbol sintáctico
-    graph = arbolSintactico(arbol_sintactico, True, atributo_arbol) 
-    dot_contenido = graph.source
-    salida_arbol_directorio = os.path.join(output_folder, nombre_arbol + ".dot")
-    with open(salida_arbol_directorio, 'w') as f:
-        f.write(dot_contenido)
-    with open(salida_arbol_directorio, 'r+') as file:
-        content = file.read()
-        if content.endswith(('\n', '\r')):
-            content = content.rstrip('\n\r')
-            file.seek(0)
-            file.write(content)
-            file.truncate()
-    
-    # Construir la tabla de símbolos recorriendo el árbol sintáctico
-    tabla_simbolos = TablaSimbolos()
-    construir_tabla_simbolos(arbol_sintactico, tabla_simbolos)
-    
-    # Generar la tabla de símbolos en formato CSV
-    generar_tabla_simbolos_csv(tabla_simbolos, nombre_arbol, output_folder)
-    
-    verificar_variable(arbol_sintactico, tabla_simbolos)
-    if errores_semanticos:
-        print("\n🚨 Errores semánticos encontrados:")
-        for err in errores_semanticos:
-            print(err)
-    else:
-        print("\n✅ Verificación semántica exitosa: todas las variables están declaradas.")
+# Función que retorna la fecha de modificación y el tamaño de cada archivo de las carpetas de salida.
+def instantanea_salidas():
+    archivos = {}
+    for carpeta in carpetas_salida:
+        if os.path.isdir(carpeta):
+            for entrada in os.scandir(carpeta):
+                if entrada.is_file():
+                    estado = entrada.stat()
+                    archivos[entrada.path] = (estado.st_mtime_ns, estado.st_size)
+    return archivos
 
-    # Generar el árbol de ámbitos de la tabla de símbolos
-    grafo_tabla_simbolos = generar_diagrama_tabla_simbolos(tabla_simbolos)
-    ruta_tabla_simbolos = os.path.join(output_folder, f"{nombre_arbol}-symbol-table.dot")
+# Función que ejecuta el análisis de un boceto a través de la caché: si el boceto, la versión del compilador
+# y las opciones no cambiaron, restaura los archivos de salida y repite lo impreso sin volver a analizar.
+def ejecutar_analisis_sintactico_cache(archivo, cache):
+    ruta_archivo = os.path.join(directorio, '..', 'codigos-bocetos', archivo)
     try:
-        grafo_tabla_simbolos.render(ruta_tabla_simbolos, format='png', cleanup=True)
-    except Exception as e:
-        print(f"Error al generar el diagrama de la tabla de símbolos: {str(e)}")
-    
-    print("\nAnálisis sintáctico exitoso ✅✅\n")
-    print(f"Generador del árbol sintáctico: {nombre_arbol}.dot creado en: {salida_arbol_directorio}\n")
-    print(f"Árbol de ámbitos generado: {nombre_arbol}-symbol-table.png en: {output_folder}\n")
-else:
-    print("\n❌❌❌ Análisis sintáctico fallido ❌❌❌\n")
-    print("Error sintáctico reconocido:")
-    for error in errores_sintacticos:
-        print(error)
-    print()
\ No newline at end of file
+        with open(ruta_archivo, 'rb') as boceto:
+            codigo = boceto.read()
+    except OSError:
+        return ejecutar_analisis_sintactico(archivo)
+    clave = cache.clave(codigo, archivo=archivo, trazas=mostrar_trazas)
+
+    artefactos = cache.obtener(clave)
+    if artefactos is not None:
+        try:
+            salidas = pickle.loads(artefactos['salidas.pickle'])
+            consola = artefactos['consola.txt'].decode('utf-8')
+        except (KeyError, pickle.UnpicklingError, EOFError, UnicodeDecodeError):
+            salidas = None  # Entrada dañada: se vuelve a analizar.
+        if salidas is not None:
+            for ruta, contenido in salidas.items():
+                os.makedirs(os.path.dirname(ruta), exist_ok=True)
+                with open(ruta, 'wb') as salida:
+                    salida.write(contenido)
+            print(consola, end='')
+            if 'salida.txt' in artefactos:
+                sys.exit()
+            return
+
+    antes = instantanea_salidas()
+    terminado = True
+    with capturar_salida() as consola:
+        try:
+            ejecutar_analisis_sintactico(archivo)
+        except SystemExit:
+            terminado = False  # Errores léxicos: el script termina, pero el resultado también se guarda.
+    salidas = {}
+    for ruta, estado in instantanea_salidas().items():
+        if antes.get(ruta) != estado:
+            with open(ruta, 'rb') as salida:
+                salidas[ruta] = salida.read()
+    artefactos = {'consola.txt': consola.getvalue().encode('utf-8'), 'salidas.pickle': pickle.dumps(salidas)}
+    if not terminado:
+        artefactos['salida.txt'] = b''
+    cache.guardar(clave, artefactos)
+    if not terminado:
+        sys.exit()
+
+# Función que ejecuta el análisis completo de un boceto y genera sus archivos de salida.
+def ejecutar_analisis_sintactico(archivo):
+    # Análisis léxico del boceto (imprime los tokens y escribe su archivo).
+    lista_de_tokens, lista_errores_lexicos = ejecutar_analisis_lexico(archivo)
+
+    # Cargamos la tabla LL1.
+    tabla_ll1 = obtener_tabla_ll1()
+
+    # Llamada al analizador sintáctico.
+    respuesta, arbol_sintactico, errores_sintacticos = analizador_sintactico(lista_de_tokens, tabla_ll1)
+
+    # Definimos nombre del árbol y del atributo que deseamos mostrar en el .dot.
+    nombre_arbol = f"arbol-{os.path.splitext(archivo)[0]}"
+    atributo_arbol = "tipo"  # Evaluar el atributo del nodo que se quiere ver
+
+    # Mostrar el resultado del análisis léxico.
+    mostrar_resultado_lexico(lista_errores_lexicos)
+
+    # Verificamos el análisis sintáctico.
+    if respuesta:
+        output_folder = 'salida-arboles'
+        if not os.path.exists(output_folder):
+            os.makedirs(output_folder)
+
+        # Generar el árbol sintáctico
+        salida_arbol_directorio = os.path.join(output_folder, nombre_arbol + ".dot")
+        escribir_arbol_dot(arbol_sintactico, salida_arbol_directorio, True, atributo_arbol)
+
+        # Construir la tabla de símbolos recorriendo el árbol sintáctico
+        tabla_simbolos = TablaSimbolos()
+        construir_tabla_simbolos(arbol_sintactico, tabla_simbolos)
+
+        # Generar la tabla de símbolos en formato CSV
+        generar_tabla_simbolos_csv(tabla_simbolos, nombre_arbol, output_folder)
+
+        verificar_variable(arbol_sintactico, tabla_simbolos)
+        if tabla_simbolos.errores:
+            print("\n🚨 Errores semánticos encontrados:")
+            for err in tabla_simbolos.errores:
+                print(err)
+        else:
+            print("\n✅ Verificación semántica exitosa: todas las variables están declaradas.")
+
+        # Generar el árbol de ámbitos de la tabla de símbolos
+        grafo_tabla_simbolos = generar_diagrama_tabla_simbolos(tabla_simbolos)
+        ruta_tabla_simbolos = os.path.join(output_folder, f"{nombre_arbol}-symbol-table.dot")
+        try:
+            grafo_tabla_simbolos.render(ruta_tabla_simbolos, format='png', cleanup=True)
+        except Exception as e:
+            print(f"Error al generar el diagrama de la tabla de símbolos: {str(e)}")
+
+        print("\nAnálisis sintáctico exitoso ✅✅\n")
+        print(f"Generador del árbol sintáctico: {nombre_arbol}.dot creado en: {salida_arbol_directorio}\n")
+        print(f"Árbol de ámbitos generado: {nombre_arbol}-symbol-table.png en: {output_folder}\n")
+    else:
+        print("\n❌❌❌ Análisis sintáctico fallido ❌❌❌\n")
+        print("Error sintáctico reconocido:")
+        for error in errores_sintacticos:
+            print(error)
+        print()
+
+if __name__ == '__main__':
+    mostrar_trazas = True
+    if usar_cache:
+        ejecutar_analisis_sintactico_cache(sys.argv[1] if len(sys.argv) > 1 else archivo, CacheArtefactos())
+    else:
+        ejecutar_analisis_sintactico(sys.argv[1] if len(sys.argv) > 1 else archivo)
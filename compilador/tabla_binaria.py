@@ -0,0 +1,105 @@
+import hashlib
+import struct
+import sys
+from array import array
+
+from tabla_comprimida import TablaComprimida
+
+# Formato binario de la tabla LL(1) precompilada (enteros little-endian):
+#   cabecera: MAGIA, huella de 40 caracteres y los tamaños T, N, P, S y B;
+#   nombres: B bytes UTF-8 con los T terminales y los N no terminales separados por '\n';
+#   producciones: P + 1 desplazamientos 'I' y S ids de símbolos 'h' (los de la producción i
+#   van de desplazamientos[i] a desplazamientos[i + 1]; una producción vacía es 'e');
+#   acciones: matriz densa N x T de ids de producción 'h', -1 si la celda está vacía.
+# Con MAGIA_COMPRIMIDA las acciones son, en cambio, la longitud L ('I') del vector peine, las N
+# bases 'i' y los L valores y L controles 'h' de una TablaComprimida.
+MAGIA = b'FCLL1\x01'
+MAGIA_COMPRIMIDA = b'FCLL1\x02'
+CABECERA = struct.Struct('<6s40sIIIII')
+LONGITUD = struct.Struct('<I')
+
+# Función que calcula la huella de la gramática y de la lista de tokens del léxico.
+# Si cualquiera de los dos cambia, la tabla binaria deja de ser válida.
+def huella_gramatica(ruta_gramatica, tokens):
+    with open(ruta_gramatica, 'rb') as archivo:
+        contenido = archivo.read()
+    return hashlib.sha1(contenido + repr(list(tokens)).encode('utf-8')).hexdigest()
+
+# Función que pasa un arreglo a little-endian (o lo devuelve desde little-endian) en máquinas big-endian.
+def _little_endian(arreglo):
+    if sys.byteorder == 'big':
+        arreglo.byteswap()
+    return arreglo
+
+# Función que escribe la tabla LL(1) compilada a enteros en el archivo binario.
+# acciones puede ser la lista de filas densas o una TablaComprimida.
+def escribir_tabla_binaria(ruta, huella, terminales, no_terminales, producciones, acciones):
+    nombres = '\n'.join(terminales + no_terminales).encode('utf-8')
+    desplazamientos = array('I', [0])
+    simbolos = array('h')
+    for produccion in producciones:
+        simbolos.extend(produccion)
+        desplazamientos.append(len(simbolos))
+    if isinstance(acciones, TablaComprimida):
+        magia = MAGIA_COMPRIMIDA
+        secciones = [array('i', acciones.base), array('h', acciones.valor), array('h', acciones.control)]
+    else:
+        magia = MAGIA
+        matriz = array('h')
+        for fila in acciones:
+            matriz.extend(fila)
+        secciones = [matriz]
+    cabecera = CABECERA.pack(magia, huella.encode('ascii'), len(terminales), len(no_terminales),
+                             len(producciones), len(simbolos), len(nombres))
+    with open(ruta, 'wb') as archivo:
+        archivo.write(cabecera)
+        archivo.write(nombres)
+        for arreglo in (desplazamientos, simbolos):
+            archivo.write(_little_endian(arreglo).tobytes())
+        if magia == MAGIA_COMPRIMIDA:
+            archivo.write(LONGITUD.pack(len(acciones.valor)))
+        for arreglo in secciones:
+            archivo.write(_little_endian(arreglo).tobytes())
+
+# Función que lee la tabla binaria con una sola lectura del archivo.
+# Retorna (huella, terminales, no_terminales, producciones, acciones) o lanza ValueError si el archivo
+# no tiene el formato esperado.
+def leer_tabla_binaria(ruta):
+    with open(ruta, 'rb') as archivo:
+        datos = memoryview(archivo.read())
+    if len(datos) < CABECERA.size:
+        raise ValueError(f"La tabla binaria {ruta} está incompleta")
+    magia, huella, num_terminales, num_no_terminales, num_producciones, num_simbolos, tamaño_nombres = CABECERA.unpack_from(datos)
+    if magia != MAGIA and magia != MAGIA_COMPRIMIDA:
+        raise ValueError(f"{ruta} no es una tabla LL(1) binaria")
+    inicio = CABECERA.size
+    nombres = bytes(datos[inicio:inicio + tamaño_nombres]).decode('utf-8').split('\n')
+    if len(nombres) != num_terminales + num_no_terminales:
+        raise ValueError(f"La tabla binaria {ruta} tiene nombres de símbolos inválidos")
+    inicio += tamaño_nombres
+
+    # Función que lee el siguiente arreglo del archivo.
+    def leer_arreglo(codigo, cantidad):
+        nonlocal inicio
+        arreglo = array(codigo)
+        fin = inicio + cantidad * arreglo.itemsize
+        if fin > len(datos):
+            raise ValueError(f"La tabla binaria {ruta} está incompleta")
+        arreglo.frombytes(datos[inicio:fin])
+        inicio = fin
+        return _little_endian(arreglo)
+
+    desplazamientos = leer_arreglo('I', num_producciones + 1)
+    simbolos = leer_arreglo('h', num_simbolos)
+    producciones = [tuple(simbolos[desplazamientos[i]:desplazamientos[i + 1]]) for i in range(num_producciones)]
+    if magia == MAGIA_COMPRIMIDA:
+        if inicio + LONGITUD.size > len(datos):
+            raise ValueError(f"La tabla binaria {ruta} está incompleta")
+        longitud, = LONGITUD.unpack_from(datos, inicio)
+        inicio += LONGITUD.size
+        base = leer_arreglo('i', num_no_terminales)
+        acciones = TablaComprimida(num_terminales, base, leer_arreglo('h', longitud), leer_arreglo('h', longitud))
+    else:
+        matriz = leer_arreglo('h', num_no_terminales * num_terminales)
+        acciones = [matriz[i * num_terminales:(i + 1) * num_terminales] for i in range(num_no_terminales)]
+    return huella.decode('ascii'), nombres[:num_terminales], nombres[num_terminales:], producciones, acciones
@@ -0,0 +1,62 @@
+import sys
+from array import array
+
+# Tabla de acciones LL(1) comprimida con desplazamiento de filas (vector peine).
+# Las celdas llenas de todas las filas se superponen en un solo vector: la fila i empieza en base[i],
+# valor[base[i] + t] es su producción para el terminal t y control[base[i] + t] == i indica que la
+# celda es de esa fila; si no, la celda está vacía. La búsqueda es O(1).
+class TablaComprimida:
+    def __init__(self, num_terminales, base, valor, control):
+        self.num_terminales = num_terminales
+        self.base = base  # array('i') con el desplazamiento de cada no terminal
+        self.valor = valor  # array('h') con los ids de producción
+        self.control = control  # array('h') con el no terminal dueño de cada celda, -1 si está libre
+
+    def __len__(self):
+        return len(self.base)
+
+    def accion(self, no_terminal, terminal):
+        """Retorna el id de producción de la celda, -1 si está vacía."""
+        indice = self.base[no_terminal] + terminal
+        return self.valor[indice] if self.control[indice] == no_terminal else -1
+
+    def fila(self, no_terminal):
+        """Retorna la fila densa de un no terminal (array('h') con -1 en las celdas vacías)."""
+        return array('h', (self.accion(no_terminal, terminal) for terminal in range(self.num_terminales)))
+
+    def memoria(self):
+        """Retorna los bytes que ocupan los arreglos de la tabla."""
+        return sum(sys.getsizeof(arreglo) for arreglo in (self.base, self.valor, self.control))
+
+# Función que comprime las filas densas de acciones (una por no terminal, -1 en las celdas vacías).
+# Las filas con más celdas llenas se colocan primero, cada una en el primer desplazamiento en que
+# sus celdas no chocan con las ya ocupadas. El vector se rellena hasta base + num_terminales para
+# que cualquier búsqueda quede dentro del arreglo.
+def comprimir_acciones(acciones, num_terminales):
+    columnas_llenas = [[t for t in range(num_terminales) if fila[t] >= 0] for fila in acciones]
+    orden = sorted(range(len(acciones)), key=lambda i: len(columnas_llenas[i]), reverse=True)
+    base = array('i', [0]) * len(acciones)
+    ocupadas = bytearray()
+    valor = array('h')
+    control = array('h')
+    for i in orden:
+        columnas = columnas_llenas[i]
+        desplazamiento = 0
+        while any(desplazamiento + t < len(ocupadas) and ocupadas[desplazamiento + t] for t in columnas):
+            desplazamiento += 1
+        base[i] = desplazamiento
+        fin = desplazamiento + num_terminales
+        if fin > len(ocupadas):
+            crecimiento = fin - len(ocupadas)
+            ocupadas.extend(bytes(crecimiento))
+            valor.extend([-1] * crecimiento)
+            control.extend([-1] * crecimiento)
+        for t in columnas:
+            ocupadas[desplazamiento + t] = 1
+            valor[desplazamiento + t] = acciones[i][t]
+            control[desplazamiento + t] = i
+    return TablaComprimida(num_terminales, base, valor, control)
+
+# Función que mide los bytes de la representación densa: los arreglos y la lista que los contiene.
+def memoria_densa(acciones):
+    return sys.getsizeof(acciones) + sum(sys.getsizeof(fila) for fila in acciones)
@@ -1,23 +1,37 @@
 import os
 import csv
 import sys
+import argparse
+import json
+from array import array
 
 # Módulo para crear diccionarios con valores por defecto.
 from collections import defaultdict
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Los módulos del compilador se importan por su nombre, igual que entre ellos.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'compilador')))
 
-from compilador.lexico import tokens
+from lexico import tokens
+from tabla_binaria import escribir_tabla_binaria
+from tabla_binaria import huella_gramatica
+from tabla_comprimida import comprimir_acciones
 
 # Cargar la gramática desde el archivo.
 directorio = os.path.dirname(__file__)
 gramatica_archivo = 'gramatica.txt'
 archivo_gramatica = os.path.join(directorio, '..', 'gramatica', gramatica_archivo)
 
-# Guardar la tabla en un archivo CSV.
+# Guardar la tabla en un archivo CSV (legible) y en un archivo binario (el que carga el compilador).
 csv_filename = 'tabla_ll1.csv'
+binario_filename = 'tabla_ll1.bin'
 carpeta_salida = 'tabla-ll1'
 
+# Diagnóstico de la gramática (JSON) que se guarda junto a las tablas.
+reporte_filename = 'diagnostico_gramatica.json'
+
+# Módulo de Python con el analizador sintáctico generado (descendente recursivo, sin tabla).
+archivo_analizador = os.path.join(directorio, '..', 'compilador', 'analizador_generado.py')
+
 # Función que lee la gramática desde un archivo.
 def leer_archivo_gramatica(nombre_archivo):
     gramatica = {}
@@ -44,147 +58,604 @@ def leer_archivo_gramatica(nombre_archivo):
             gramatica[lado_izquierdo].append(simbolos)
     return gramatica
 
-# Función para calcular el conjunto de primeros de un símbolo.
-def compute_first(symbol):
-    # Si el conjunto FIRST ya está calculado, lo retorna.
-    if symbol in FIRST and FIRST[symbol]:
-        return FIRST[symbol]
-    # Si es un terminal, agrega el símbolo a su conjunto FIRST.
-    if symbol in tokens:
-        FIRST[symbol] = set([symbol])
-        return FIRST[symbol]
-    first = set()
-    # Para cada producción del símbolo no terminal, calcular el FIRST.
-    for production in gramatica_general[symbol]:
+# Función que asigna un bit a cada terminal; el bit siguiente al último representa 'e'.
+def numerar_terminales(terminales):
+    bits = {terminal: 1 << i for i, terminal in enumerate(terminales)}
+    bits['e'] = 1 << len(terminales)
+    return bits
+
+# Función que convierte un conjunto codificado en bits a un conjunto de símbolos.
+def decodificar(conjunto, terminales):
+    simbolos = set()
+    for i, terminal in enumerate(terminales):
+        if conjunto >> i & 1:
+            simbolos.add(terminal)
+    if conjunto >> len(terminales) & 1:
+        simbolos.add('e')
+    return simbolos
+
+# Función que valida que todos los símbolos de la gramática sean terminales o no terminales conocidos.
+def validar_simbolos(gramatica, bits):
+    for lhs, producciones in gramatica.items():
+        for production in producciones:
+            for sym in production:
+                if sym not in bits and sym not in gramatica:
+                    raise ValueError(f"El símbolo '{sym}' de la producción de '{lhs}' no es un token ni un no terminal")
+
+# Función que calcula el FIRST de todos los no terminales como enteros usados como conjuntos de bits.
+# Usa una lista de trabajo: una producción solo se recalcula cuando cambia el FIRST de un símbolo de su
+# lado derecho, así que el costo es casi lineal en el tamaño de la gramática.
+def calcular_primeros_bits(gramatica, bits):
+    bit_e = bits['e']
+    primeros = dict.fromkeys(gramatica, 0)
+    # Producciones (lhs, símbolos) en las que aparece cada no terminal del lado derecho.
+    dependientes = defaultdict(list)
+    producciones = []
+    for lhs in gramatica:
+        for production in gramatica[lhs]:
+            producciones.append((lhs, production))
+            for sym in set(production):
+                if sym in gramatica:
+                    dependientes[sym].append(len(producciones) - 1)
+    pendientes = list(range(len(producciones)))
+    en_lista = [True] * len(producciones)
+    while pendientes:
+        indice = pendientes.pop()
+        en_lista[indice] = False
+        lhs, production = producciones[indice]
         if production[0] == 'e':
-            first.add('e')
+            first = bit_e
         else:
+            first = 0
             for sym in production:
-                sym_first = compute_first(sym)
-                first.update(sym_first - set(['e']))
+                sym_first = primeros[sym] if sym in primeros else bits[sym]
+                first |= sym_first & ~bit_e
                 # Si no contiene la 'e', se termina.
-                if 'e' not in sym_first:
+                if not sym_first & bit_e:
                     break
             else:
-                first.add('e')
-    FIRST[symbol] = first
-    return first
+                first |= bit_e
+        if first & ~primeros[lhs]:
+            primeros[lhs] |= first
+            for dependiente in dependientes[lhs]:
+                if not en_lista[dependiente]:
+                    en_lista[dependiente] = True
+                    pendientes.append(dependiente)
+    return primeros
 
-# Función para calcular el conjunto de siguientes de un símbolo.
-def compute_follow(symbol):
+# Función que calcula el FOLLOW de todos los no terminales como conjuntos de bits.
+# En A -> α B β, la aparición de B aporta un conjunto fijo, FIRST(β), y si todo β deriva 'e' (o está
+# vacío) una arista desde FOLLOW(A). El FIRST de cada sufijo se calcula una vez por producción, de
+# derecha a izquierda. Los conjuntos se propagan por las aristas con una lista de trabajo hasta el punto fijo.
+def calcular_siguientes_bits(gramatica, bits, primeros):
+    bit_e = bits['e']
+    siguientes = dict.fromkeys(gramatica, 0)
     # El primer símbolo tiene '$' como símbolo de fin de entrada.
-    if symbol == list(gramatica_general.keys())[0]:
-        FOLLOW[symbol].add('$')
-    # Recorre la gramática y calcula los conjuntos FOLLOW.
-    for lhs in gramatica_general:
-        for production in gramatica_general[lhs]:
-            for i, sym in enumerate(production):
-                if sym == symbol:
-                    # Si hay un símbolo siguiente en la producción, se agrega su FIRST.
-                    if i + 1 < len(production):
-                        next_sym = production[i + 1]
-                        next_first = compute_first(next_sym)
-                        FOLLOW[symbol].update(next_first - set(['e']))
-                        if 'e' in next_first:
-                            FOLLOW[symbol].update(FOLLOW[lhs])
-                    else:
-                        # Si es el último, se agregan los FOLLOW del lado izquierdo.
-                        if lhs != symbol:
-                            FOLLOW[symbol].update(FOLLOW[lhs])
-
-gramatica_general = leer_archivo_gramatica(archivo_gramatica)
-
-# Agregar el símbolo de fin de entrada al conjunto de tokens.
-tokens.append('$')
-
-# Obtiene todos los no terminales de la gramática.
-non_terminals = list(gramatica_general.keys())
-
-# Inicializar el conjunto de primeros y siguientes (FIRST y FOLLOW).
-FIRST = defaultdict(set)
-FOLLOW = defaultdict(set)
-
-# Calcular FIRST para todos los no terminales.
-for non_terminal in non_terminals:
-    compute_first(non_terminal)
-
-# Inicializar FOLLOW para todos los no terminales.
-for non_terminal in non_terminals:
-    FOLLOW[non_terminal] = set()
-
-# Recalcular FOLLOW hasta que no haya cambios.
-changed = True
-while changed:
-    changed = False
-    for non_terminal in non_terminals:
-        before = len(FOLLOW[non_terminal])
-        compute_follow(non_terminal)
-        after = len(FOLLOW[non_terminal])
-        if before != after:
-            changed = True
-
-# Crear la tabla LL(1).
-ll1_table = defaultdict(dict)
-
-# Rellenar la tabla LL(1) con las producciones correspondientes.
-for lhs in gramatica_general:
-    for production in gramatica_general[lhs]:
-        firsts = set()
-        if production[0] == 'e':
-            firsts.add('e')
-        else:
+    inicial = next(iter(gramatica))
+    siguientes[inicial] |= bits['$']
+    aristas = defaultdict(set)
+    for lhs in gramatica:
+        for production in gramatica[lhs]:
+            # FIRST del sufijo que sigue al símbolo actual; el sufijo vacío solo deriva 'e'.
+            sufijo = bit_e
+            for sym in reversed(production):
+                if sym in gramatica:
+                    siguientes[sym] |= sufijo & ~bit_e
+                    # Si el sufijo deriva 'e', se agregan los FOLLOW del lado izquierdo.
+                    if sufijo & bit_e and lhs != sym:
+                        aristas[lhs].add(sym)
+                    sym_first = primeros[sym]
+                else:
+                    sym_first = bits[sym]
+                # FIRST(X β): FIRST(X) sin 'e' y, si X deriva 'e', también FIRST(β).
+                sufijo = (sym_first & ~bit_e) | sufijo if sym_first & bit_e else sym_first
+    pendientes = [nt for nt in gramatica if siguientes[nt]]
+    en_lista = set(pendientes)
+    while pendientes:
+        nt = pendientes.pop()
+        en_lista.discard(nt)
+        for destino in aristas[nt]:
+            if siguientes[nt] & ~siguientes[destino]:
+                siguientes[destino] |= siguientes[nt]
+                if destino not in en_lista:
+                    en_lista.add(destino)
+                    pendientes.append(destino)
+    return siguientes
+
+# Función que calcula los conjuntos FIRST y FOLLOW de los no terminales como conjuntos de símbolos.
+def calcular_primeros_siguientes(gramatica, terminales):
+    bits = numerar_terminales(terminales)
+    validar_simbolos(gramatica, bits)
+    primeros = calcular_primeros_bits(gramatica, bits)
+    siguientes = calcular_siguientes_bits(gramatica, bits, primeros)
+    FIRST = {nt: decodificar(primeros[nt], terminales) for nt in gramatica}
+    FOLLOW = {nt: decodificar(siguientes[nt], terminales) for nt in gramatica}
+    return FIRST, FOLLOW
+
+# Función que crea la tabla LL(1): no terminal -> terminal -> producción.
+# Si una celda ya tiene otra producción, la nueva la reemplaza; si se pasa la lista conflictos,
+# cada reemplazo se registra en ella con su tipo (FIRST/FIRST o FIRST/FOLLOW).
+def construir_tabla_ll1(gramatica, terminales, conflictos=None):
+    bits = numerar_terminales(terminales)
+    validar_simbolos(gramatica, bits)
+    bit_e = bits['e']
+    primeros = calcular_primeros_bits(gramatica, bits)
+    siguientes = calcular_siguientes_bits(gramatica, bits, primeros)
+    ll1_table = defaultdict(dict)
+    # Producción y conjunto ('FIRST' o 'FOLLOW') que llenó cada celda.
+    origenes = defaultdict(dict)
+
+    # Función que llena una celda y registra el conflicto si ya la había llenado otra producción.
+    def llenar(lhs, terminal, accion, produccion, conjunto):
+        anterior = origenes[lhs].get(terminal)
+        if conflictos is not None and anterior is not None and anterior[0] != produccion:
+            tipo = 'FIRST/FIRST' if anterior[1] == conjunto else 'FIRST/FOLLOW'
+            conflictos.append({
+                'tipo': tipo,
+                'no_terminal': lhs,
+                'terminal': terminal,
+                'producciones': [f"{lhs} -> {anterior[0]}", f"{lhs} -> {produccion}"],
+            })
+        origenes[lhs][terminal] = (produccion, conjunto)
+        ll1_table[lhs][terminal] = accion
+
+    # Rellenar la tabla LL(1) con las producciones correspondientes.
+    for lhs in gramatica:
+        for production in gramatica[lhs]:
+            if production[0] == 'e':
+                firsts = bit_e
+            else:
+                firsts = 0
+                for sym in production:
+                    sym_first = primeros[sym] if sym in primeros else bits[sym]
+                    firsts |= sym_first & ~bit_e
+                    if not sym_first & bit_e:
+                        break
+                else:
+                    firsts |= bit_e
+            # Llenar la tabla para cada terminal en FIRST.
+            accion = ' '.join(production)
+            for terminal in sorted(decodificar(firsts & ~bit_e, terminales)):
+                llenar(lhs, terminal, accion, accion, 'FIRST')
+            # Si 'e' está en FIRST, se rellena también para los terminales en FOLLOW.
+            if firsts & bit_e:
+                for terminal in sorted(decodificar(siguientes[lhs], terminales)):
+                    llenar(lhs, terminal, 'e', accion, 'FOLLOW')
+    return ll1_table
+
+# Función que encuentra los no terminales que no se alcanzan desde el símbolo inicial.
+def buscar_inalcanzables(gramatica):
+    inicial = next(iter(gramatica))
+    alcanzados = {inicial}
+    pendientes = [inicial]
+    while pendientes:
+        for production in gramatica[pendientes.pop()]:
+            for sym in production:
+                if sym in gramatica and sym not in alcanzados:
+                    alcanzados.add(sym)
+                    pendientes.append(sym)
+    return [nt for nt in gramatica if nt not in alcanzados]
+
+# Función que encuentra los no terminales que no derivan ninguna cadena de terminales.
+# Una producción es productiva cuando todos sus no terminales lo son; se usa un contador de
+# no terminales pendientes por producción para que cada uno se procese una sola vez.
+def buscar_improductivos(gramatica):
+    pendientes_por_produccion = []
+    apariciones = defaultdict(list)
+    productivos = set()
+    listos = []
+    for lhs in gramatica:
+        for production in gramatica[lhs]:
+            no_terminales = {sym for sym in production if sym in gramatica}
+            pendientes_por_produccion.append([lhs, len(no_terminales)])
+            for sym in no_terminales:
+                apariciones[sym].append(len(pendientes_por_produccion) - 1)
+            if not no_terminales and lhs not in productivos:
+                productivos.add(lhs)
+                listos.append(lhs)
+    while listos:
+        nt = listos.pop()
+        for indice in apariciones[nt]:
+            contador = pendientes_por_produccion[indice]
+            contador[1] -= 1
+            if contador[1] == 0 and contador[0] not in productivos:
+                productivos.add(contador[0])
+                listos.append(contador[0])
+    return [nt for nt in gramatica if nt not in productivos]
+
+# Función que encuentra la recursión por la izquierda, directa o indirecta.
+# Hay una arista A -> B si B puede ser el primer símbolo derivado de A (lo precede solo un prefijo
+# anulable); cada componente fuertemente conexa con un ciclo es un grupo de no terminales recursivos.
+def buscar_recursion_izquierda(gramatica, primeros, bit_e):
+    aristas = defaultdict(list)
+    for lhs in gramatica:
+        for production in gramatica[lhs]:
             for sym in production:
-                sym_first = compute_first(sym)
-                firsts.update(sym_first - set(['e']))
-                if 'e' not in sym_first:
+                if sym not in gramatica:
                     break
-            else:
-                firsts.add('e')
-        # Llenar la tabla para cada terminal en FIRST.
-        for terminal in firsts - set(['e']):
-            ll1_table[lhs][terminal] = ' '.join(production)
-        # Si 'e' está en FIRST, se rellena también para los terminales en FOLLOW.
-        if 'e' in firsts:
-            for terminal in FOLLOW[lhs]:
-                ll1_table[lhs][terminal] = 'e'
-
-# Crear la carpeta si no existe.
-if not os.path.exists(carpeta_salida):
-    os.makedirs(carpeta_salida)
-
-# Definir la ruta del archivo CSV de salida.
-archivo_salida = os.path.join(carpeta_salida, csv_filename)
-
-# Abrir el archivo CSV para escribir los datos.
-with open(archivo_salida, 'w', newline='', encoding='utf-8') as csvfile:
-    csvwriter = csv.writer(csvfile)
-    # Escribir las cabeceras (tokens).
-    headers = [''] + tokens
-    csvwriter.writerow(headers)
-    # Escribir cada fila correspondiente a un no terminal.
-    for idx, nt in enumerate(non_terminals):
-        row = [nt]
-        for t in tokens:
-            action = ll1_table[nt].get(t, '')
-            row.append(action)
-        csvwriter.writerow(row)
-
-# Eliminar saltos de línea innecesarios al final del archivo CSV.
-with open(archivo_salida, 'rb+') as csvfile:
-    csvfile.seek(-2, os.SEEK_END)
-    while csvfile.tell() > 0 and csvfile.read(1) in [b'\n', b'\r']:
-        csvfile.seek(-2, os.SEEK_CUR)
-    if csvfile.tell() > 0:
-        csvfile.truncate()
-
-# Después de calcular FIRST y FOLLOW para todos los no terminales
-print("\nConjunto de primeros:")
-for non_terminal in non_terminals:
-    print(f"Primeros de {non_terminal} -> {FIRST[non_terminal]}")
-
-print("\nConjunto de siguientes:")
-for non_terminal in non_terminals:
-    print(f"Siguientes de {non_terminal} -> {FOLLOW[non_terminal]}")
-
-# Imprimir mensaje final.
-print(f"\nTabla LL(1) exportada a {archivo_salida}\n")
\ No newline at end of file
+                if sym not in aristas[lhs]:
+                    aristas[lhs].append(sym)
+                if not primeros[sym] & bit_e:
+                    break
+    # Algoritmo de Tarjan con pila explícita.
+    indices = {}
+    minimos = {}
+    pila = []
+    en_pila = set()
+    grupos = []
+    for origen in gramatica:
+        if origen in indices:
+            continue
+        recorrido = [(origen, iter(aristas[origen]))]
+        indices[origen] = minimos[origen] = len(indices)
+        pila.append(origen)
+        en_pila.add(origen)
+        while recorrido:
+            nodo, sucesores = recorrido[-1]
+            avanzo = False
+            for sucesor in sucesores:
+                if sucesor not in indices:
+                    indices[sucesor] = minimos[sucesor] = len(indices)
+                    pila.append(sucesor)
+                    en_pila.add(sucesor)
+                    recorrido.append((sucesor, iter(aristas[sucesor])))
+                    avanzo = True
+                    break
+                if sucesor in en_pila:
+                    minimos[nodo] = min(minimos[nodo], indices[sucesor])
+            if avanzo:
+                continue
+            recorrido.pop()
+            if recorrido:
+                padre = recorrido[-1][0]
+                minimos[padre] = min(minimos[padre], minimos[nodo])
+            if minimos[nodo] == indices[nodo]:
+                grupo = []
+                while True:
+                    miembro = pila.pop()
+                    en_pila.discard(miembro)
+                    grupo.append(miembro)
+                    if miembro == nodo:
+                        break
+                if len(grupo) > 1 or nodo in aristas[nodo]:
+                    grupos.append(sorted(grupo, key=list(gramatica).index))
+    return grupos
+
+# Función que diagnostica la gramática y retorna el reporte como diccionario (serializable a JSON).
+# Los conflictos, los no terminales improductivos y la recursión por la izquierda son errores: con
+# ellos la tabla LL(1) no es correcta. Los no terminales inalcanzables solo son advertencias.
+def diagnosticar_gramatica(gramatica, terminales):
+    bits = numerar_terminales(terminales)
+    validar_simbolos(gramatica, bits)
+    conflictos = []
+    construir_tabla_ll1(gramatica, terminales, conflictos)
+    primeros = calcular_primeros_bits(gramatica, bits)
+    improductivos = buscar_improductivos(gramatica)
+    recursion_izquierda = buscar_recursion_izquierda(gramatica, primeros, bits['e'])
+    inalcanzables = buscar_inalcanzables(gramatica)
+    return {
+        'valida': not (conflictos or improductivos or recursion_izquierda),
+        'conflictos': conflictos,
+        'improductivos': improductivos,
+        'recursion_izquierda': recursion_izquierda,
+        'inalcanzables': inalcanzables,
+    }
+
+# Excepción que se lanza cuando la gramática no permite construir una tabla LL(1) correcta.
+class ErrorGramatica(Exception):
+    def __init__(self, reporte):
+        self.reporte = reporte
+        super().__init__(resumir_reporte(reporte))
+
+# Función que resume en texto los errores y advertencias del reporte de la gramática.
+def resumir_reporte(reporte):
+    lineas = []
+    for conflicto in reporte['conflictos']:
+        lineas.append(f"Conflicto {conflicto['tipo']} en [{conflicto['no_terminal']}, {conflicto['terminal']}]: "
+                      f"{' | '.join(conflicto['producciones'])}")
+    for nt in reporte['improductivos']:
+        lineas.append(f"No terminal improductivo: {nt}")
+    for grupo in reporte['recursion_izquierda']:
+        lineas.append(f"Recursión por la izquierda: {' -> '.join(grupo + grupo[:1])}")
+    for nt in reporte['inalcanzables']:
+        lineas.append(f"Advertencia: no terminal inalcanzable: {nt}")
+    return '\n'.join(lineas)
+
+# Función que escribe la tabla LL(1) en un archivo CSV sin salto de línea al final.
+def escribir_tabla_csv(ll1_table, non_terminals, terminales, archivo_salida):
+    # Abrir el archivo CSV para escribir los datos.
+    with open(archivo_salida, 'w', newline='', encoding='utf-8') as csvfile:
+        csvwriter = csv.writer(csvfile)
+        # Escribir las cabeceras (tokens).
+        headers = [''] + terminales
+        csvwriter.writerow(headers)
+        # Escribir cada fila correspondiente a un no terminal.
+        for nt in non_terminals:
+            row = [nt]
+            for t in terminales:
+                action = ll1_table[nt].get(t, '')
+                row.append(action)
+            csvwriter.writerow(row)
+
+    # Eliminar saltos de línea innecesarios al final del archivo CSV.
+    with open(archivo_salida, 'rb+') as csvfile:
+        csvfile.seek(-2, os.SEEK_END)
+        while csvfile.tell() > 0 and csvfile.read(1) in [b'\n', b'\r']:
+            csvfile.seek(-2, os.SEEK_CUR)
+        if csvfile.tell() > 0:
+            csvfile.truncate()
+
+# Función que compila la tabla LL(1) a ids enteros con el mismo esquema que cargar_tabla_ll1:
+# terminales y luego no terminales comparten los ids, y cada producción distinta se guarda una vez.
+def compilar_tabla(ll1_table, non_terminals, terminales):
+    ids_simbolos = {simbolo: i for i, simbolo in enumerate(terminales + non_terminals)}
+    producciones = []
+    ids_producciones = {}
+    acciones = []
+    for nt in non_terminals:
+        fila_acciones = array('h', [-1]) * len(terminales)
+        for columna, t in enumerate(terminales):
+            produccion = ll1_table[nt].get(t, '')
+            if not produccion:
+                continue
+            if produccion not in ids_producciones:
+                simbolos = () if produccion == 'e' else tuple(ids_simbolos[simbolo] for simbolo in produccion.split())
+                ids_producciones[produccion] = len(producciones)
+                producciones.append(simbolos)
+            fila_acciones[columna] = ids_producciones[produccion]
+        acciones.append(fila_acciones)
+    return producciones, acciones
+
+# Función que genera la tabla LL(1) binaria a partir de la gramática y los tokens del léxico.
+# Retorna (huella, terminales, no_terminales, producciones, acciones); si ruta_salida es None no escribe nada.
+# Con comprimida=True las acciones son una TablaComprimida en lugar de filas densas.
+# Lanza ErrorGramatica si la gramática tiene conflictos u otros errores, sin escribir la tabla.
+def generar_tabla_binaria(ruta_salida, ruta_gramatica=archivo_gramatica, tokens_lexico=tokens, comprimida=False):
+    gramatica_general = leer_archivo_gramatica(ruta_gramatica)
+    terminales = list(tokens_lexico) + ['$']
+    non_terminals = list(gramatica_general.keys())
+    reporte = diagnosticar_gramatica(gramatica_general, terminales)
+    if not reporte['valida']:
+        raise ErrorGramatica(reporte)
+    ll1_table = construir_tabla_ll1(gramatica_general, terminales)
+    producciones, acciones = compilar_tabla(ll1_table, non_terminals, terminales)
+    if comprimida:
+        acciones = comprimir_acciones(acciones, len(terminales))
+    huella = huella_gramatica(ruta_gramatica, tokens_lexico)
+    if ruta_salida is not None:
+        escribir_tabla_binaria(ruta_salida, huella, terminales, non_terminals, producciones, acciones)
+    return huella, terminales, non_terminals, producciones, acciones
+
+# Función que genera el código de un analizador descendente recursivo con una función por no terminal.
+# Cada función elige la producción con if/elif sobre el tipo del token de anticipación (las celdas de
+# su fila en la tabla LL(1)) y crea los nodos en el mismo orden que analizador_sintactico, así que el
+# árbol resultante es idéntico. Una llamada en la última posición de la producción no se anida: la
+# función retorna (función, nodo) y quien la llamó continúa en un bucle, de modo que las cadenas
+# recursivas por la derecha (instrucciones, funciones, expresiones) no agotan la pila de Python.
+def generar_codigo_analizador(gramatica, terminales, huella, ll1_table=None):
+    if ll1_table is None:
+        ll1_table = construir_tabla_ll1(gramatica, terminales)
+    non_terminals = list(gramatica.keys())
+    simbolos = terminales + non_terminals
+    ids_simbolos = {simbolo: i for i, simbolo in enumerate(simbolos)}
+    funciones = {nt: f"p_{nt}" if nt.isidentifier() else f"p_{i}" for i, nt in enumerate(non_terminals)}
+    codigo = [
+        "# Analizador sintáctico generado por generador-ll1.py a partir de gramatica.txt; no editar a mano.",
+        "from sintactico import AlmacenArbol",
+        "from sintactico import ErrorSintactico",
+        "from sintactico import TOKEN_FIN",
+        "from sintactico import obtener_tabla_ll1",
+        "",
+        "# Huella de la gramática y de los tokens con los que se generó este módulo.",
+        f"HUELLA = {huella!r}",
+        "",
+        "# Símbolos en el orden de ids de la tabla LL(1): primero terminales y luego no terminales.",
+        f"SIMBOLOS = {simbolos!r}",
+        f"TERMINALES = frozenset(SIMBOLOS[:{len(terminales)}])",
+        "",
+    ]
+    # Conjuntos de terminales de las producciones que se eligen con más de un token.
+    conjuntos = {}
+    ramas_por_no_terminal = {}
+    for nt in non_terminals:
+        ramas = {}
+        for t in terminales:
+            accion = ll1_table[nt].get(t)
+            if accion:
+                ramas.setdefault(accion, []).append(t)
+        ramas_por_no_terminal[nt] = ramas
+        for indice, (accion, tipos) in enumerate(ramas.items()):
+            if len(tipos) > 1:
+                nombre = f"_{funciones[nt][2:].upper()}_{indice}"
+                conjuntos[(nt, accion)] = nombre
+                codigo.append(f"{nombre} = frozenset({sorted(tipos)!r})")
+    codigo += [
+        "",
+        "# Excepción interna que detiene el análisis; lleva el ErrorSintactico o None.",
+        "class _Fallo(Exception):",
+        "    pass",
+        "",
+        "# Función que analiza un flujo de tokens igual que sintactico.analizador_sintactico.",
+        "# Retorna (exito, raiz del árbol o None, errores sintácticos).",
+        "def analizador_sintactico(flujo_de_tokens, tabla_ll1=None):",
+        "    if tabla_ll1 is None:",
+        "        tabla_ll1 = obtener_tabla_ll1()",
+        "    if tabla_ll1.simbolos != SIMBOLOS:",
+        "        raise ValueError(\"El analizador generado no corresponde a la tabla LL(1); vuelva a generarlo\")",
+        "    errores_sintacticos = []",
+        "    arbol = AlmacenArbol(tabla_ll1)",
+        "    agregar_hijos = arbol.agregar_hijos",
+        "    asignar_valor = arbol.asignar_valor",
+        "    lineas = arbol.linea",
+        "    posiciones = arbol.posicion",
+        "    flujo = iter(flujo_de_tokens)",
+        "    siguiente = next",
+        "    actual = siguiente(flujo, TOKEN_FIN)",
+        "    arbol.lineas = actual.lineas",
+        "",
+        "    # Error al expandir un no terminal: 'e' si el token es de la gramática pero no tiene producción.",
+        "    def fallar(no_terminal):",
+        "        encontrado = 'e' if actual.tipo in TERMINALES else ''",
+        "        raise _Fallo(ErrorSintactico(no_terminal, encontrado, actual.linea, actual.columna))",
+    ]
+
+    # Código que empareja el terminal del nodo indicado con el token actual; si la elección de la
+    # producción ya garantiza el tipo del token, no se vuelve a comprobar.
+    def emparejar(terminal, nodo, sangria, comprobar=True):
+        comprobacion = [f"{sangria}if actual.tipo != {terminal!r}:", f"{sangria}    raise _Fallo(None)"] if comprobar else []
+        return comprobacion + [
+            f"{sangria}asignar_valor({nodo}, actual.valor)",
+            f"{sangria}if actual.linea is not None:",
+            f"{sangria}    lineas[{nodo}] = actual.linea",
+            f"{sangria}    posiciones[{nodo}] = actual.posicion",
+            f"{sangria}actual = siguiente(flujo, TOKEN_FIN)",
+        ]
+
+    # Código que analiza un no terminal que no es el último de la producción.
+    def llamar(no_terminal, nodo, sangria):
+        return [
+            f"{sangria}continuacion = {funciones[no_terminal]}({nodo})",
+            f"{sangria}while continuacion is not None:",
+            f"{sangria}    continuacion = continuacion[0](continuacion[1])",
+        ]
+
+    for nt in non_terminals:
+        codigo += ["", f"    def {funciones[nt]}(nodo):", "        nonlocal actual", "        tipo = actual.tipo"]
+        primera = True
+        for accion, tipos in ramas_por_no_terminal[nt].items():
+            condicion = f"tipo in {conjuntos[(nt, accion)]}" if (nt, accion) in conjuntos else f"tipo == {tipos[0]!r}"
+            codigo.append(f"        {'if' if primera else 'elif'} {condicion}:")
+            primera = False
+            codigo.append(f"            # {nt} -> {accion}")
+            if accion == 'e':
+                codigo.append(f"            arbol.valor[agregar_hijos(nodo, ({len(simbolos)},))] = 0")
+                codigo.append("            return None")
+                continue
+            produccion = accion.split()
+            ids = ', '.join(str(ids_simbolos[sym]) for sym in produccion) + (',' if len(produccion) == 1 else '')
+            codigo.append(f"            primero = agregar_hijos(nodo, ({ids}))")
+            for posicion, sym in enumerate(produccion):
+                nodo = "primero" if posicion == 0 else f"primero + {posicion}"
+                if sym not in gramatica:
+                    codigo += emparejar(sym, nodo, "            ", posicion > 0 or tipos != [sym])
+                elif posicion == len(produccion) - 1:
+                    codigo.append(f"            return {funciones[sym]}, {nodo}")
+                else:
+                    codigo += llamar(sym, nodo, "            ")
+            if produccion[-1] not in gramatica:
+                codigo.append("            return None")
+        if primera:
+            codigo.append(f"        fallar({nt!r})")
+        else:
+            codigo += ["        else:", f"            fallar({nt!r})"]
+
+    inicial = non_terminals[0]
+    codigo += [
+        "",
+        f"    nodo_dolar = agregar_hijos(-1, ({ids_simbolos['$']},))",
+        f"    nodo_inicio = agregar_hijos(-1, ({ids_simbolos[inicial]},))",
+        "    try:",
+    ]
+    codigo += llamar(inicial, "nodo_inicio", "        ")
+    codigo += emparejar('$', "nodo_dolar", "        ")
+    codigo += [
+        "    except _Fallo as fallo:",
+        "        if fallo.args[0] is not None:",
+        "            errores_sintacticos.append(fallo.args[0])",
+        "        return False, None, errores_sintacticos",
+        "    # El análisis es exitoso si tras el $ no quedan tokens sin consumir.",
+        "    exito = actual is TOKEN_FIN and siguiente(flujo, None) is None",
+        "    return exito, arbol.nodo(nodo_inicio), errores_sintacticos",
+        "",
+    ]
+    return '\n'.join(codigo)
+
+# Función que genera el módulo del analizador descendente recursivo y lo escribe en ruta_salida.
+# Lanza ErrorGramatica si la gramática no es LL(1).
+def generar_analizador(ruta_salida=archivo_analizador, ruta_gramatica=archivo_gramatica, tokens_lexico=tokens):
+    gramatica_general = leer_archivo_gramatica(ruta_gramatica)
+    terminales = list(tokens_lexico) + ['$']
+    reporte = diagnosticar_gramatica(gramatica_general, terminales)
+    if not reporte['valida']:
+        raise ErrorGramatica(reporte)
+    codigo = generar_codigo_analizador(gramatica_general, terminales, huella_gramatica(ruta_gramatica, tokens_lexico))
+    with open(ruta_salida, 'w', encoding='utf-8') as archivo:
+        archivo.write(codigo)
+    return ruta_salida
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Genera la tabla LL(1) de la gramática de FusionCod.")
+    parser.add_argument('--sin-csv', action='store_true', help="Solo genera la tabla binaria, sin exportar el .csv")
+    parser.add_argument('--comprimida', action='store_true', help="Guarda las acciones comprimidas por desplazamiento de filas")
+    parser.add_argument('--reporte', default=os.path.join(carpeta_salida, reporte_filename),
+                        help="Ruta donde guardar el diagnóstico de la gramática en formato JSON")
+    parser.add_argument('--analizador', action='store_true', help="Genera también el analizador descendente recursivo en Python")
+    opciones = parser.parse_args(argumentos)
+
+    gramatica_general = leer_archivo_gramatica(archivo_gramatica)
+
+    # Agregar el símbolo de fin de entrada al conjunto de tokens.
+    terminales = tokens + ['$']
+
+    # Obtiene todos los no terminales de la gramática.
+    non_terminals = list(gramatica_general.keys())
+
+    # Crear la carpeta si no existe.
+    if not os.path.exists(carpeta_salida):
+        os.makedirs(carpeta_salida)
+
+    # Diagnosticar la gramática antes de escribir las tablas: con errores solo se guarda el reporte.
+    reporte = diagnosticar_gramatica(gramatica_general, terminales)
+    if opciones.reporte:
+        with open(opciones.reporte, 'w', encoding='utf-8') as archivo_reporte:
+            json.dump(reporte, archivo_reporte, ensure_ascii=False, indent=2)
+    resumen = resumir_reporte(reporte)
+    if resumen:
+        print(resumen)
+    if not reporte['valida']:
+        print("\n❌ La gramática no es LL(1); no se generó la tabla.\n")
+        return 1
+
+    # Calcular FIRST, FOLLOW y la tabla LL(1).
+    FIRST, FOLLOW = calcular_primeros_siguientes(gramatica_general, terminales)
+    ll1_table = construir_tabla_ll1(gramatica_general, terminales)
+
+    # Escribir la tabla binaria con la huella de la gramática y de los tokens.
+    archivo_binario = os.path.join(carpeta_salida, binario_filename)
+    producciones, acciones = compilar_tabla(ll1_table, non_terminals, terminales)
+    if opciones.comprimida:
+        acciones = comprimir_acciones(acciones, len(terminales))
+    escribir_tabla_binaria(archivo_binario, huella_gramatica(archivo_gramatica, tokens), terminales, non_terminals, producciones, acciones)
+
+    # Generar el analizador descendente recursivo a partir de la misma tabla.
+    if opciones.analizador:
+        codigo = generar_codigo_analizador(gramatica_general, terminales, huella_gramatica(archivo_gramatica, tokens), ll1_table)
+        with open(archivo_analizador, 'w', encoding='utf-8') as archivo:
+            archivo.write(codigo)
+
+    # Definir la ruta del archivo CSV de salida.
+    archivo_salida = os.path.join(carpeta_salida, csv_filename)
+    if not opciones.sin_csv:
+        escribir_tabla_csv(ll1_table, non_terminals, terminales, archivo_salida)
+
+    # Después de calcular FIRST y FOLLOW para todos los no terminales
+    print("\nConjunto de primeros:")
+    for non_terminal in non_terminals:
+        print(f"Primeros de {non_terminal} -> {FIRST[non_terminal]}")
+
+    print("\nConjunto de siguientes:")
+    for non_terminal in non_terminals:
+        print(f"Siguientes de {non_terminal} -> {FOLLOW[non_terminal]}")
+
+    # Imprimir mensaje final.
+    print(f"\nTabla LL(1) binaria generada en {archivo_binario}")
+    if opciones.analizador:
+        print(f"\nAnalizador descendente recursivo generado en {os.path.normpath(archivo_analizador)}")
+    if opciones.reporte:
+        print(f"\nDiagnóstico de la gramática guardado en {opciones.reporte}")
+    if not opciones.sin_csv:
+        print(f"\nTabla LL(1) exportada a {archivo_salida}\n")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
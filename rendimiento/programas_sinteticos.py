@@ -0,0 +1,29 @@
+# Generador de programas FusionCod sintéticos para las pruebas de rendimiento.
+
+# Plantillas de instrucciones que se repiten de forma cíclica dentro de main.
+PLANTILLAS = [
+    "v{i} int = {i} + total;",
+    "total = total + v{i};",
+    "while (total > 1000) {{ total = total - 1000; }}",
+    "if (v{i} % 2 == 0) {{ show(\"par \" + v{i}); }} elif (v{i} % 3 == 0) {{ show(\"tres\"); }} else {{ total = total + 1; }}",
+    "total = sumar(total, v{i});",
+]
+
+# Función que genera un programa válido con el número de instrucciones indicado.
+def generar_programa(instrucciones):
+    lineas = [
+        "fn sumar (a int, b int) int {",
+        "    resultado int = a + b;",
+        "    return resultado;",
+        "}",
+        "",
+        "fn main () int {",
+        "    total int = 0;",
+    ]
+    for i in range(instrucciones):
+        # Cada bloque de plantillas declara su variable antes de usarla.
+        bloque = i - i % len(PLANTILLAS)
+        lineas.append("    " + PLANTILLAS[i % len(PLANTILLAS)].format(i=bloque))
+    lineas.append("    return total;")
+    lineas.append("}")
+    return "\n".join(lineas)
@@ -0,0 +1,70 @@
+import os
+import sys
+import tracemalloc
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+import lexico
+import sintactico
+
+# Tamaños (número de instrucciones) de los programas sintéticos a analizar.
+TAMAÑOS = [1000, 4000, 16000]
+
+# Nodo con un objeto por nodo, como el árbol sintáctico anterior, para comparar la memoria.
+class NodoObjeto:
+    def __init__(self, id, tipo, valor=None, linea=None, columna=None, terminal=False):
+        self.id = id
+        self.tipo = tipo
+        self.valor = valor
+        self.linea = linea
+        self.columna = columna
+        self.terminal = terminal
+        self.hijos = []
+        self.padre = None
+
+# Función que copia el árbol de arreglos a un árbol de objetos NodoObjeto.
+def construir_arbol_objetos(raiz):
+    arbol = raiz.arbol
+    raiz_objeto = NodoObjeto(raiz.id, raiz.tipo)
+    pendientes = [(raiz.id, raiz_objeto)]
+    while pendientes:
+        indice, nodo_objeto = pendientes.pop()
+        for hijo in arbol.hijos(indice):
+            vista = arbol.nodo(hijo)
+            hijo_objeto = NodoObjeto(hijo, vista.tipo, vista.valor, vista.linea, vista.columna, vista.terminal)
+            hijo_objeto.padre = nodo_objeto
+            nodo_objeto.hijos.append(hijo_objeto)
+            pendientes.append((hijo, hijo_objeto))
+    return raiz_objeto
+
+# Función que mide los bytes retenidos por el resultado de una función.
+def medir_memoria(funcion, *argumentos):
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    resultado = funcion(*argumentos)
+    memoria = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    return resultado, memoria
+
+def main():
+    tabla_ll1 = sintactico.obtener_tabla_ll1()
+    filas = []
+    for tamaño in TAMAÑOS:
+        lista_de_tokens = list(lexico.generar_tokens(generar_programa(tamaño)))
+        (_, raiz, _), memoria_arreglos = medir_memoria(sintactico.analizador_sintactico, lista_de_tokens, tabla_ll1)
+        nodos = len(raiz.arbol)
+        arbol_objetos, memoria_objetos = medir_memoria(construir_arbol_objetos, raiz)
+        filas.append([tamaño, nodos, f"{memoria_arreglos / nodos:.1f}", f"{memoria_objetos / nodos:.1f}",
+                      f"{memoria_objetos / memoria_arreglos:.1f}x"])
+        del arbol_objetos
+    headers = ["Instrucciones", "Nodos", "Bytes/nodo (arreglos)", "Bytes/nodo (objetos)", "Reducción"]
+    print("\nMemoria del árbol sintáctico:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+import time
+
+from tabulate import tabulate
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+carpeta_compilador = os.path.join(directorio, '..', 'compilador')
+
+# Módulos que se importan en un proceso nuevo y módulos que cada uno no debe cargar al arrancar.
+# Compilar (léxico, sintáctico y semántico) no usa los exportadores, así que no carga sus dependencias;
+# el cliente del servidor solo usa la biblioteca estándar.
+PESADOS = ['pandas', 'numpy', 'graphviz', 'tabulate']
+COMPILADOR = ['ply', 'lexico', 'sintactico', 'compilacion']
+MODULOS = [
+    ('compilacion', PESADOS),
+    ('incremental', PESADOS),
+    ('servidor', PESADOS),
+    ('cliente', PESADOS + COMPILADOR),
+]
+
+# Tiempo máximo de importación (según -X importtime) de los módulos que compilan.
+LIMITE_MS = 200
+REPETICIONES = 5
+
+# Función que importa un módulo en un proceso nuevo con -X importtime y retorna el tiempo acumulado
+# de cada módulo cargado (nombre -> microsegundos).
+def tiempos_importacion(codigo):
+    proceso = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo], cwd=carpeta_compilador,
+                             capture_output=True, text=True, check=True)
+    tiempos = {}
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith('import time:') or 'cumulative' in linea:
+            continue
+        _, acumulado, nombre = linea[len('import time:'):].split('|')
+        tiempos[nombre.strip()] = int(acumulado)
+    return tiempos
+
+# Función que retorna el mejor tiempo total de un proceso nuevo que ejecuta el código indicado.
+def medir_proceso(codigo):
+    mejor = float('inf')
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, '-c', codigo], cwd=carpeta_compilador, check=True)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def main():
+    base = medir_proceso('pass')
+    filas = []
+    fallos = []
+    for modulo, prohibidos in MODULOS:
+        # Se toma la mejor de varias importaciones para no contar el ruido de la máquina.
+        importaciones = [tiempos_importacion(f"import {modulo}") for _ in range(REPETICIONES)]
+        tiempo = min(tiempos[modulo] for tiempos in importaciones) / 1000
+        cargados = [nombre for nombre in prohibidos if nombre in importaciones[0]]
+        if cargados:
+            fallos.append(f"{modulo} carga al arrancar: {', '.join(cargados)}")
+        if prohibidos is PESADOS and tiempo > LIMITE_MS:
+            fallos.append(f"{modulo} tarda {tiempo:.1f} ms en importarse (límite {LIMITE_MS} ms)")
+        arranque = medir_proceso(f"import {modulo}") - base
+        filas.append([modulo, len(importaciones[0]), f"{tiempo:.1f}", f"{arranque * 1000:.1f}",
+                      ', '.join(cargados) if cargados else 'ninguno'])
+
+    # Referencia: lo que costaría cargar también las dependencias de los exportadores.
+    referencia = min(tiempos_importacion("import compilacion, tabulate, graphviz, pandas")['pandas']
+                     for _ in range(REPETICIONES)) / 1000
+    headers = ["Módulo", "Módulos cargados", "Importación (ms)", "Arranque (ms)", "Dependencias no permitidas"]
+    print("\nTiempo de arranque en frío de los módulos del compilador (python -X importtime):")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print(f"Arranque es el tiempo de un proceso que importa el módulo menos el de un proceso vacío ({base * 1000:.1f} ms).")
+    print(f"Solo importar pandas, con el compilador ya cargado, tarda {referencia:.1f} ms.\n")
+
+    if fallos:
+        for fallo in fallos:
+            print(f"❌ {fallo}")
+        return 1
+    print("✅ El arranque está dentro de los límites")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
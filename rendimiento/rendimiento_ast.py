@@ -0,0 +1,45 @@
+import glob
+import os
+import sys
+import time
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+import lexico
+import sintactico
+from arbol_abstracto import contar_nodos, reducir_arbol
+
+# Tamaños (número de instrucciones) de los programas sintéticos a reducir.
+TAMAÑOS = [1000, 4000, 16000]
+
+# Función que analiza un código y retorna la fila del reporte con los nodos antes y después de reducirlo.
+def medir(nombre, codigo, tabla_ll1):
+    respuesta, raiz, errores = sintactico.analizador_sintactico(lexico.generar_tokens(codigo), tabla_ll1)
+    if not respuesta:
+        return [nombre, "-", "-", "-", "-"]
+    inicio = time.perf_counter()
+    programa = reducir_arbol(raiz)
+    tiempo = time.perf_counter() - inicio
+    nodos_arbol = len(raiz.arbol) - 1  # Sin el nodo $ del fondo de la pila
+    nodos_ast = contar_nodos(programa)
+    return [nombre, nodos_arbol, nodos_ast, f"{nodos_arbol / nodos_ast:.1f}x", f"{tiempo * 1000:.2f}"]
+
+def main():
+    tabla_ll1 = sintactico.obtener_tabla_ll1()
+    filas = []
+    for ruta in sorted(glob.glob(os.path.join(directorio, '..', 'codigos-bocetos', '*.txt'))):
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            filas.append(medir(os.path.basename(ruta), archivo.read(), tabla_ll1))
+    for tamaño in TAMAÑOS:
+        filas.append(medir(f"sintético {tamaño}", generar_programa(tamaño), tabla_ll1))
+    headers = ["Programa", "Nodos del árbol", "Nodos del AST", "Reducción", "Tiempo de reducción (ms)"]
+    print("\nNodos antes y después de reducir el árbol sintáctico a AST:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+
+if __name__ == '__main__':
+    main()
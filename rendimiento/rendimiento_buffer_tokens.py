@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+import tracemalloc
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+import lexico
+import sintactico
+
+# Tamaños (número de instrucciones) de los programas sintéticos.
+TAMAÑOS = [1000, 4000, 16000]
+REPETICIONES = 3
+
+# Función que mide la memoria retenida por el resultado de una función y el tiempo que tarda.
+def medir_memoria(funcion, *argumentos):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcion(*argumentos)
+    segundos = time.perf_counter() - inicio
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, memoria, segundos
+
+# Función que mide el mejor tiempo del analizador sintáctico sin árbol.
+def medir_analisis(flujo_de_tokens, tabla_ll1):
+    mejor = float('inf')
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        respuesta, _, errores = sintactico.analizador_sintactico(flujo_de_tokens, tabla_ll1, construir_arbol=False)
+        mejor = min(mejor, time.perf_counter() - inicio)
+        if not respuesta:
+            raise RuntimeError(f"El programa sintético no es válido: {errores}")
+    return mejor
+
+def main():
+    tabla_ll1 = sintactico.obtener_tabla_ll1()
+    lexico.obtener_lexer()
+    filas = []
+    for tamaño in TAMAÑOS:
+        codigo = generar_programa(tamaño)
+        lista_de_tokens, memoria_lista, tiempo_lista = medir_memoria(lambda: list(lexico.generar_tokens(codigo)))
+        buffer, memoria_buffer, tiempo_buffer = medir_memoria(lexico.tokenizar_en_buffer, codigo)
+        if [str(token) for token in lista_de_tokens] != [str(token) for token in buffer]:
+            raise RuntimeError(f"El buffer no coincide con la lista de tokens en el programa de {tamaño} instrucciones")
+        analisis_lista = medir_analisis(lista_de_tokens, tabla_ll1)
+        analisis_buffer = medir_analisis(buffer, tabla_ll1)
+        filas.append([tamaño, len(buffer), f"{memoria_lista / 1024:.0f}", f"{memoria_buffer / 1024:.0f}",
+                      f"{memoria_lista / memoria_buffer:.1f}x", f"{tiempo_lista * 1000:.0f}", f"{tiempo_buffer * 1000:.0f}",
+                      f"{analisis_lista * 1000:.0f}", f"{analisis_buffer * 1000:.0f}"])
+    headers = ["Instrucciones", "Tokens", "KB (lista)", "KB (buffer)", "Reducción", "Léxico lista (ms)", "Léxico buffer (ms)",
+               "Sintáctico lista (ms)", "Sintáctico buffer (ms)"]
+    print("\nLista de objetos Token frente al buffer de arreglos paralelos:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print("La memoria es la que queda retenida al terminar el análisis léxico (tracemalloc).\n")
+
+if __name__ == '__main__':
+    main()
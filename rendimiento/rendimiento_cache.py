@@ -0,0 +1,63 @@
+import glob
+import os
+import sys
+import tempfile
+import time
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+from cache import CacheArtefactos
+from compilacion import compile_source
+
+# Tamaños (número de instrucciones) de los programas sintéticos.
+TAMAÑOS = [1000, 4000, 16000]
+REPETICIONES = 3
+
+# Función que mide el mejor tiempo de compilar un código con la caché indicada.
+def medir(codigo, cache):
+    mejor = float('inf')
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        resultado = compile_source(codigo, conservar_tokens=True, generar_ast=True, cache=cache)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return resultado, mejor
+
+def main():
+    programas = []
+    for ruta in sorted(glob.glob(os.path.join(directorio, '..', 'codigos-bocetos', '*.txt'))):
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            programas.append((os.path.basename(ruta), archivo.read()))
+    programas += [(f"Sintético de {tamaño} instrucciones", generar_programa(tamaño)) for tamaño in TAMAÑOS]
+
+    # Se construyen el lexer y la tabla LL(1) antes de medir.
+    compile_source('')
+
+    filas = []
+    with tempfile.TemporaryDirectory() as carpeta:
+        cache = CacheArtefactos(carpeta)
+        for nombre, codigo in programas:
+            resultado, tiempo_sin_cache = medir(codigo, None)
+            # La primera compilación con caché es un fallo que guarda la entrada; las siguientes, aciertos.
+            inicio = time.perf_counter()
+            compile_source(codigo, conservar_tokens=True, generar_ast=True, cache=cache)
+            tiempo_fallo = time.perf_counter() - inicio
+            guardado, tiempo_acierto = medir(codigo, cache)
+            if [str(error) for error in resultado.errores] != [str(error) for error in guardado.errores] \
+                    or [str(token) for token in resultado.tokens] != [str(token) for token in guardado.tokens]:
+                raise RuntimeError(f"El resultado de la caché no coincide en {nombre}")
+            tamaño = sum(entrada.stat().st_size for entrada in os.scandir(cache.ruta(cache.clave(
+                codigo, conservar_tokens=True, generar_ast=True, fusionado=False, construir_arbol=True))))
+            filas.append([nombre, f"{tamaño / 1024:.0f}", f"{tiempo_sin_cache * 1000:.2f}", f"{tiempo_fallo * 1000:.2f}",
+                          f"{tiempo_acierto * 1000:.2f}", f"{tiempo_sin_cache / tiempo_acierto:.1f}x"])
+    headers = ["Programa", "Entrada (KB)", "Sin caché (ms)", "Fallo (ms)", "Acierto (ms)", "Mejora"]
+    print("\nCompilación (tokens, árbol, AST y tabla de símbolos) sin caché frente a la caché de artefactos:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print("Un acierto lee y deserializa la entrada guardada en lugar de volver a analizar el código.\n")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+import lexico
+
+# Número de instrucciones de los programas y cada cuántas se inserta un carácter ilegal.
+TAMAÑOS = [1000, 4000, 16000]
+CADA = 5
+
+# Función que crea un programa con errores léxicos; en una sola línea si se pide, como un código minificado.
+def programa_con_errores(instrucciones, una_linea):
+    lineas = generar_programa(instrucciones).split('\n')
+    lineas = [linea + (' @' if i % CADA == 0 else '') for i, linea in enumerate(lineas)]
+    return (' ' if una_linea else '\n').join(lineas)
+
+# Función que calcula las columnas de los errores buscando hacia atrás el último salto de línea.
+def columnas_rfind(datos, errores):
+    return [error.posicion - datos.rfind('\n', 0, error.posicion) for error in errores]
+
+# Función que calcula las columnas de los errores con el índice de líneas que ya construyó el lexer.
+def columnas_indice(lineas, errores):
+    return [lineas.columna(error.posicion) for error in errores]
+
+# Función que mide el mejor tiempo de una función.
+def medir(funcion, *argumentos):
+    mejor = float('inf')
+    for _ in range(3):
+        inicio = time.perf_counter()
+        resultado = funcion(*argumentos)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return resultado, mejor
+
+def main():
+    filas = []
+    for una_linea in (False, True):
+        for tamaño in TAMAÑOS:
+            datos = programa_con_errores(tamaño, una_linea)
+            errores = []
+            for _ in lexico.generar_tokens(datos, errores):
+                pass
+            if [str(error) for error in errores] != [f"Error en la línea {error.linea}, columna {columna}: {error.mensaje}"
+                                                     for error, columna in zip(errores, columnas_rfind(datos, errores))]:
+                raise RuntimeError(f"Las columnas de los errores no coinciden en el programa de {tamaño} instrucciones")
+            columnas, tiempo_rfind = medir(columnas_rfind, datos, errores)
+            lineas, tiempo_construccion = medir(lexico.IndiceLineas, datos)
+            columnas_bisect, tiempo_indice = medir(columnas_indice, lineas, errores)
+            if columnas != columnas_bisect:
+                raise RuntimeError(f"Las columnas no coinciden en el programa de {tamaño} instrucciones")
+            filas.append(["Una línea" if una_linea else "Varias líneas", tamaño, len(errores),
+                          f"{tiempo_construccion * 1000:.2f}", f"{tiempo_rfind * 1000:.2f}", f"{tiempo_indice * 1000:.2f}",
+                          f"{tiempo_rfind / tiempo_indice:.1f}x"])
+    headers = ["Código", "Instrucciones", "Errores", "Construir índice (ms)", "rfind (ms)", "bisect (ms)", "Mejora"]
+    print("\nCálculo de las columnas de los errores léxicos:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print("El lexer construye el índice una vez por código; ambas formas dan las mismas columnas.\n")
+
+if __name__ == '__main__':
+    main()
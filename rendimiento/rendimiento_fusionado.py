@@ -0,0 +1,64 @@
+import glob
+import os
+import sys
+import time
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+from compilacion import compile_source
+
+# Tamaños (número de instrucciones) de los programas sintéticos a compilar.
+TAMAÑOS = [1000, 4000, 16000]
+REPETICIONES = 3
+
+# Modos de compilación comparados: argumentos de compile_source para cada uno.
+MODOS = [
+    ("Árbol + dos pasadas", {}),
+    ("Fusionado con árbol", {'fusionado': True}),
+    ("Fusionado sin árbol", {'construir_arbol': False}),
+]
+
+# Función que resume un resultado para comparar los modos: errores y símbolos de cada ámbito.
+def resumen(resultado):
+    ambitos = None
+    if resultado.tabla_simbolos is not None:
+        ambitos = [(ambito.nombre, ambito.nivel, list(ambito.simbolos.items())) for ambito in resultado.tabla_simbolos.ambitos]
+    return resultado.exito, [str(error) for error in resultado.errores], ambitos
+
+# Función que verifica que los tres modos den los mismos errores y la misma tabla de símbolos.
+def verificar_equivalencia(codigo, nombre):
+    resumenes = [resumen(compile_source(codigo, **opciones)) for _, opciones in MODOS]
+    if any(otro != resumenes[0] for otro in resumenes[1:]):
+        raise RuntimeError(f"Los modos de compilación no coinciden en {nombre}")
+
+# Función que mide el mejor tiempo de compilación de un programa con un modo.
+def medir(codigo, opciones):
+    mejor = float('inf')
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        compile_source(codigo, **opciones)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def main():
+    for ruta in sorted(glob.glob(os.path.join(directorio, '..', 'codigos-bocetos', '*.txt'))):
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            verificar_equivalencia(archivo.read(), os.path.basename(ruta))
+    filas = []
+    for tamaño in TAMAÑOS:
+        codigo = generar_programa(tamaño)
+        verificar_equivalencia(codigo, f"el programa de {tamaño} instrucciones")
+        tiempos = [medir(codigo, opciones) for _, opciones in MODOS]
+        filas.append([tamaño] + [f"{segundos * 1000:.1f}" for segundos in tiempos] + [f"{tiempos[0] / tiempos[-1]:.2f}x"])
+    headers = ["Instrucciones"] + [f"{nombre} (ms)" for nombre, _ in MODOS] + ["Mejora"]
+    print("\nCompilación en varias pasadas frente a acciones semánticas fusionadas:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print("Los tres modos producen los mismos errores y la misma tabla de símbolos.\n")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+import glob
+import os
+import sys
+import time
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+import lexico
+import sintactico
+
+# Tamaños (número de instrucciones) de los programas sintéticos a analizar.
+TAMAÑOS = [1000, 4000, 16000]
+REPETICIONES = 3
+
+# Función que resume un árbol sintáctico para comparar los dos analizadores.
+def resumen(resultado):
+    exito, raiz, errores = resultado
+    if raiz is None:
+        return exito, None, [str(error) for error in errores]
+    arbol = raiz.arbol
+    arreglos = (arbol.simbolo, arbol.valor, arbol.linea, arbol.posicion, arbol.padre, arbol.primer_hijo, arbol.siguiente_hermano)
+    return exito, [arreglo.tobytes() for arreglo in arreglos] + [arbol.valores], [str(error) for error in errores]
+
+# Función que mide el mejor tiempo de un analizador sintáctico sobre una lista de tokens.
+def medir(analizador, lista_de_tokens, tabla_ll1):
+    mejor = float('inf')
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        analizador(lista_de_tokens, tabla_ll1)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def main():
+    tabla_ll1 = sintactico.obtener_tabla_ll1()
+    generado = sintactico.cargar_analizador_generado()
+    programas = []
+    for ruta in sorted(glob.glob(os.path.join(directorio, '..', 'codigos-bocetos', '*.txt'))):
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            programas.append((os.path.basename(ruta), archivo.read()))
+    programas += [(f"Sintético de {tamaño} instrucciones", generar_programa(tamaño)) for tamaño in TAMAÑOS]
+
+    filas = []
+    for nombre, codigo in programas:
+        lista_de_tokens = list(lexico.generar_tokens(codigo))
+        if resumen(sintactico.analizador_sintactico(lista_de_tokens, tabla_ll1)) != resumen(generado.analizador_sintactico(lista_de_tokens, tabla_ll1)):
+            raise RuntimeError(f"Los analizadores no coinciden en {nombre}")
+        tiempo_tabla = medir(sintactico.analizador_sintactico, lista_de_tokens, tabla_ll1)
+        tiempo_generado = medir(generado.analizador_sintactico, lista_de_tokens, tabla_ll1)
+        filas.append([nombre, len(lista_de_tokens), f"{tiempo_tabla * 1000:.2f}", f"{tiempo_generado * 1000:.2f}",
+                      f"{tiempo_tabla / tiempo_generado:.2f}x"])
+    headers = ["Programa", "Tokens", "Tabla LL(1) (ms)", "Generado (ms)", "Mejora"]
+    print("\nAnalizador guiado por tabla frente al analizador descendente recursivo generado:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print("Ambos analizadores construyen el mismo árbol y reportan los mismos errores.\n")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+import importlib.util
+import os
+import sys
+import time
+from collections import defaultdict
+
+from tabulate import tabulate
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+from lexico import tokens
+
+# El generador está en una carpeta con guiones, así que se carga desde su ruta.
+ruta_generador = os.path.join(directorio, '..', 'generador-de-tablas-ll1', 'generador-ll1.py')
+especificacion = importlib.util.spec_from_file_location('generador_ll1', ruta_generador)
+generador_ll1 = importlib.util.module_from_spec(especificacion)
+especificacion.loader.exec_module(generador_ll1)
+
+# Número de copias de la gramática de FusionCod que forman cada gramática sintética.
+COPIAS = [1, 2, 4, 8, 16, 32]
+
+# Función que crea una gramática con varias copias de la de FusionCod encadenadas.
+# Cada copia renombra sus no terminales con un sufijo y se enlaza con la siguiente por medio de un
+# terminal nuevo, de modo que los FOLLOW se propagan a lo largo de toda la cadena.
+def gramatica_sintetica(gramatica, copias):
+    sintetica = {'inicio': [['programaprincipal_0', 'resto_0']]}
+    terminales = list(tokens)
+    for k in range(copias):
+        for lhs, producciones in gramatica.items():
+            sintetica[f"{lhs}_{k}"] = [[f"{sym}_{k}" if sym in gramatica else sym for sym in production] for production in producciones]
+        terminales.append(f"enlace_{k}")
+        if k + 1 < copias:
+            sintetica[f"resto_{k}"] = [[f"enlace_{k}", f"programaprincipal_{k + 1}", f"resto_{k + 1}"], ['e']]
+        else:
+            sintetica[f"resto_{k}"] = [['e']]
+    return sintetica, terminales + ['$']
+
+# Generador anterior: FIRST recursivo y FOLLOW recorriendo toda la gramática hasta que no haya cambios.
+# El FOLLOW usa el FIRST de todo el sufijo que sigue al símbolo, no solo el del símbolo siguiente.
+def tabla_referencia(gramatica_general, terminales):
+    FIRST = defaultdict(set)
+    FOLLOW = defaultdict(set)
+    inicial = list(gramatica_general.keys())[0]
+
+    def compute_first(symbol):
+        if symbol in FIRST and FIRST[symbol]:
+            return FIRST[symbol]
+        if symbol in terminales:
+            FIRST[symbol] = set([symbol])
+            return FIRST[symbol]
+        first = set()
+        for production in gramatica_general[symbol]:
+            if production[0] == 'e':
+                first.add('e')
+            else:
+                for sym in production:
+                    sym_first = compute_first(sym)
+                    first.update(sym_first - set(['e']))
+                    if 'e' not in sym_first:
+                        break
+                else:
+                    first.add('e')
+        FIRST[symbol] = first
+        return first
+
+    def compute_follow(symbol):
+        if symbol == inicial:
+            FOLLOW[symbol].add('$')
+        for lhs in gramatica_general:
+            for production in gramatica_general[lhs]:
+                for i, sym in enumerate(production):
+                    if sym == symbol:
+                        # Se agrega el FIRST de todo el sufijo y, si todo el sufijo deriva 'e', el FOLLOW del lado izquierdo.
+                        for next_sym in production[i + 1:]:
+                            next_first = compute_first(next_sym)
+                            FOLLOW[symbol].update(next_first - set(['e']))
+                            if 'e' not in next_first:
+                                break
+                        else:
+                            if lhs != symbol:
+                                FOLLOW[symbol].update(FOLLOW[lhs])
+
+    for non_terminal in gramatica_general:
+        compute_first(non_terminal)
+    changed = True
+    while changed:
+        changed = False
+        for non_terminal in gramatica_general:
+            before = len(FOLLOW[non_terminal])
+            compute_follow(non_terminal)
+            if before != len(FOLLOW[non_terminal]):
+                changed = True
+
+    ll1_table = defaultdict(dict)
+    for lhs in gramatica_general:
+        for production in gramatica_general[lhs]:
+            firsts = set()
+            if production[0] == 'e':
+                firsts.add('e')
+            else:
+                for sym in production:
+                    sym_first = compute_first(sym)
+                    firsts.update(sym_first - set(['e']))
+                    if 'e' not in sym_first:
+                        break
+                else:
+                    firsts.add('e')
+            for terminal in firsts - set(['e']):
+                ll1_table[lhs][terminal] = ' '.join(production)
+            if 'e' in firsts:
+                for terminal in FOLLOW[lhs]:
+                    ll1_table[lhs][terminal] = 'e'
+    return ll1_table
+
+# Gramáticas pequeñas con sus conjuntos FIRST y FOLLOW calculados a mano.
+CASOS_CONOCIDOS = [
+    # Un no terminal anulable seguido de otro anulable: FOLLOW(A) incluye lo que sigue a B.
+    ({'S': [['A', 'B', 'c']], 'A': [['a'], ['e']], 'B': [['b'], ['e']]},
+     ['a', 'b', 'c', '$'],
+     {'S': {'a', 'b', 'c'}, 'A': {'a', 'e'}, 'B': {'b', 'e'}},
+     {'S': {'$'}, 'A': {'b', 'c'}, 'B': {'c'}}),
+    # Gramática de expresiones sin recursión por la izquierda.
+    ({'E': [['T', 'Ep']], 'Ep': [['mas', 'T', 'Ep'], ['e']], 'T': [['F', 'Tp']], 'Tp': [['por', 'F', 'Tp'], ['e']],
+      'F': [['pabierto', 'E', 'pcerrado'], ['id']]},
+     ['mas', 'por', 'pabierto', 'pcerrado', 'id', '$'],
+     {'E': {'pabierto', 'id'}, 'Ep': {'mas', 'e'}, 'T': {'pabierto', 'id'}, 'Tp': {'por', 'e'}, 'F': {'pabierto', 'id'}},
+     {'E': {'pcerrado', '$'}, 'Ep': {'pcerrado', '$'}, 'T': {'mas', 'pcerrado', '$'}, 'Tp': {'mas', 'pcerrado', '$'},
+      'F': {'por', 'mas', 'pcerrado', '$'}}),
+]
+
+# Función que comprueba los FIRST y FOLLOW del generador con los de CASOS_CONOCIDOS.
+def verificar_casos_conocidos():
+    for gramatica, terminales, primeros, siguientes in CASOS_CONOCIDOS:
+        FIRST, FOLLOW = generador_ll1.calcular_primeros_siguientes(gramatica, terminales)
+        if FIRST != primeros:
+            raise RuntimeError(f"FIRST incorrecto: {FIRST}, se esperaba {primeros}")
+        if FOLLOW != siguientes:
+            raise RuntimeError(f"FOLLOW incorrecto: {FOLLOW}, se esperaba {siguientes}")
+
+# Función que comprueba que el diagnóstico rechaza una gramática con un conflicto FIRST/FOLLOW que solo
+# aparece con el FOLLOW correcto (A anulable seguida de B anulable y luego c) y acepta la de FusionCod.
+def verificar_diagnosticos(gramatica):
+    conflictiva = {'S': [['A', 'B', 'c']], 'A': [['c'], ['e']], 'B': [['b'], ['e']]}
+    reporte = generador_ll1.diagnosticar_gramatica(conflictiva, ['a', 'b', 'c', '$'])
+    encontrados = [(conflicto['tipo'], conflicto['no_terminal'], conflicto['terminal']) for conflicto in reporte['conflictos']]
+    if reporte['valida'] or encontrados != [('FIRST/FOLLOW', 'A', 'c')]:
+        raise RuntimeError(f"El diagnóstico no detectó el conflicto FIRST/FOLLOW en [A, c]: {reporte}")
+    reporte = generador_ll1.diagnosticar_gramatica(gramatica, list(tokens) + ['$'])
+    if not reporte['valida']:
+        raise RuntimeError(f"La gramática de FusionCod no es LL(1):\n{generador_ll1.resumir_reporte(reporte)}")
+
+# Función que mide el tiempo de una función y retorna su resultado.
+def medir(funcion, *argumentos):
+    inicio = time.perf_counter()
+    resultado = funcion(*argumentos)
+    return resultado, time.perf_counter() - inicio
+
+def main():
+    verificar_casos_conocidos()
+    gramatica = generador_ll1.leer_archivo_gramatica(generador_ll1.archivo_gramatica)
+    verificar_diagnosticos(gramatica)
+    filas = []
+    for copias in COPIAS:
+        sintetica, terminales = gramatica_sintetica(gramatica, copias)
+        producciones = sum(len(producciones) for producciones in sintetica.values())
+        tabla, segundos = medir(generador_ll1.construir_tabla_ll1, sintetica, terminales)
+        tabla_anterior, segundos_anterior = medir(tabla_referencia, sintetica, terminales)
+        if {nt: dict(fila) for nt, fila in tabla.items()} != {nt: dict(fila) for nt, fila in tabla_anterior.items()}:
+            raise RuntimeError(f"Las tablas no coinciden con {copias} copias de la gramática")
+        filas.append([copias, len(sintetica), producciones, f"{segundos_anterior * 1000:.1f}", f"{segundos * 1000:.1f}",
+                      f"{segundos_anterior / segundos:.1f}x"])
+    headers = ["Copias", "No terminales", "Producciones", "Anterior (ms)", "Lista de trabajo (ms)", "Mejora"]
+    print("\nGeneración de la tabla LL(1) para gramáticas sintéticas:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print("Las tablas de ambos generadores coinciden en todas las gramáticas, y los FIRST y FOLLOW coinciden")
+    print("con los calculados a mano para gramáticas pequeñas. El diagnóstico detecta los conflictos FIRST/FOLLOW.\n")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+from compilacion import compile_source
+from incremental import CompilacionIncremental
+
+# Número de funciones de los programas y de cambios que se aplican a cada uno.
+FUNCIONES = [10, 100, 1000]
+CAMBIOS = 20
+
+# Función que genera un programa con varias funciones antes de las de generar_programa.
+def programa_con_funciones(funciones):
+    lineas = []
+    for k in range(funciones):
+        lineas += [
+            f"fn f{k} (a int, b int) int {{",
+            "    r int = a + b;",
+            "    while (r > 100) { r = r - 100; }",
+            "    if (r % 2 == 0) { show(\"par \" + r); } else { r = r + 1; }",
+            f"    return f{k - 1}(r, b);" if k else "    return r;",
+            "}",
+            "",
+        ]
+    return "\n".join(lineas) + generar_programa(50)
+
+def main():
+    # Se construyen el lexer y la tabla LL(1) antes de medir.
+    compile_source('')
+    filas = []
+    for funciones in FUNCIONES:
+        codigo = programa_con_funciones(funciones)
+        documento = CompilacionIncremental(codigo, construir_arbol=False)
+        # Los cambios se hacen en la función del medio: se agrega y se quita un sumando.
+        posicion = codigo.index(f"fn f{funciones // 2} ")
+        posicion = codigo.index("r int = ", posicion) + len("r int = ")
+        tiempo_incremental = 0
+        segmentos = 0
+        for cambio in range(CAMBIOS):
+            inicio = time.perf_counter()
+            if cambio % 2 == 0:
+                nuevos = documento.editar(posicion, 0, "1 + ")
+            else:
+                nuevos = documento.editar(posicion, len("1 + "), "")
+            resultado = documento.resultado()
+            tiempo_incremental += time.perf_counter() - inicio
+            segmentos += len(nuevos)
+            if not resultado.exito:
+                raise RuntimeError(f"El programa de {funciones} funciones no compila: {resultado.errores}")
+        completo = compile_source(documento.texto, fusionado=True, construir_arbol=False)
+        if [str(error) for error in completo.errores] != [str(error) for error in documento.resultado().errores]:
+            raise RuntimeError(f"El análisis incremental no coincide con el completo en {funciones} funciones")
+        inicio = time.perf_counter()
+        for _ in range(3):
+            compile_source(documento.texto, fusionado=True, construir_arbol=False)
+        tiempo_completo = (time.perf_counter() - inicio) / 3
+        tiempo_incremental /= CAMBIOS
+        filas.append([funciones, f"{len(codigo) / 1024:.0f}", f"{segmentos / CAMBIOS:.1f}", f"{tiempo_completo * 1000:.2f}",
+                      f"{tiempo_incremental * 1000:.2f}", f"{tiempo_completo / tiempo_incremental:.1f}x"])
+    headers = ["Funciones", "KB", "Segmentos por cambio", "Completo (ms)", "Incremental (ms)", "Mejora"]
+    print("\nRevisión del código después de cada cambio, completa frente a incremental:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print("El tiempo incremental incluye aplicar el cambio y armar el resultado con la tabla de símbolos.\n")
+
+if __name__ == '__main__':
+    main()
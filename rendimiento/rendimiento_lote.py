@@ -0,0 +1,35 @@
+import os
+import sys
+import tempfile
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+from lote import compilar_lote
+
+# Número de archivos del lote y de instrucciones por archivo.
+ARCHIVOS = 64
+INSTRUCCIONES = 500
+
+def main():
+    with tempfile.TemporaryDirectory() as carpeta:
+        for i in range(ARCHIVOS):
+            with open(os.path.join(carpeta, f"programa{i}.txt"), 'w', encoding='utf-8') as archivo:
+                archivo.write(generar_programa(INSTRUCCIONES))
+        patron = os.path.join(carpeta, '*.txt')
+        filas = []
+        procesos = 1
+        while procesos <= (os.cpu_count() or 1):
+            reporte = compilar_lote([patron], procesos)
+            filas.append([procesos, f"{reporte.tiempo_total:.2f}", f"{len(reporte.archivos) / reporte.tiempo_total:.1f}"])
+            procesos *= 2
+    headers = ["Procesos", "Tiempo (s)", "Archivos por segundo"]
+    print(f"\nCompilación por lotes de {ARCHIVOS} programas sintéticos:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+import lexico
+
+# Tamaños aproximados (MB) de los archivos generados.
+TAMAÑOS = [2, 8, 16]
+
+# Función que escribe un archivo FusionCod de al menos los MB indicados repitiendo un programa sintético.
+def escribir_archivo(ruta, megabytes):
+    programa = generar_programa(2000).encode('utf-8') + b'\n'
+    with open(ruta, 'wb') as archivo:
+        escritos = 0
+        while escritos < megabytes * 1e6:
+            archivo.write(programa)
+            escritos += len(programa)
+
+# Función que cuenta los tokens y errores leyendo el archivo completo a memoria.
+def analizar_leyendo(ruta):
+    errores = []
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        datos = archivo.read()
+    return sum(1 for _ in lexico.generar_tokens(datos, errores, motor='regex')), len(errores)
+
+# Función que cuenta los tokens y errores analizando el archivo mapeado por bloques.
+def analizar_mapeado(ruta):
+    errores = []
+    with lexico.mapear_archivo(ruta) as datos:
+        return sum(1 for _ in lexico.generar_tokens(datos, errores)), len(errores)
+
+# Función que mide el tiempo y, en otra ejecución (tracemalloc la hace más lenta), el pico de memoria de Python.
+def medir(funcion, *argumentos):
+    inicio = time.perf_counter()
+    resultado = funcion(*argumentos)
+    segundos = time.perf_counter() - inicio
+    tracemalloc.start()
+    funcion(*argumentos)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, segundos, pico
+
+def main():
+    filas = []
+    with tempfile.TemporaryDirectory() as carpeta:
+        for megabytes in TAMAÑOS:
+            ruta = os.path.join(carpeta, f"programa-{megabytes}.txt")
+            escribir_archivo(ruta, megabytes)
+            tamaño = os.path.getsize(ruta) / 1e6
+            leido, tiempo_leido, pico_leido = medir(analizar_leyendo, ruta)
+            mapeado, tiempo_mapeado, pico_mapeado = medir(analizar_mapeado, ruta)
+            if leido != mapeado:
+                raise RuntimeError(f"La lectura por bloques no coincide con la completa en {megabytes} MB")
+            filas.append([f"{tamaño:.1f}", leido[0], f"{pico_leido / 1e6:.1f}", f"{pico_mapeado / 1e6:.1f}",
+                          f"{tamaño / tiempo_leido:.2f}", f"{tamaño / tiempo_mapeado:.2f}"])
+    headers = ["MB", "Tokens", "Pico leyendo (MB)", "Pico mapeado (MB)", "Leyendo (MB/s)", "Mapeado (MB/s)"]
+    print("\nAnálisis léxico de archivos grandes leídos completos frente a mapeados por bloques:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print(f"Bloques de {lexico.TAMAÑO_BLOQUE >> 20} MB; lo que crece con el mapeo es solo el índice de líneas.\n")
+
+if __name__ == '__main__':
+    main()
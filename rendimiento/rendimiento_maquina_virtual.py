@@ -0,0 +1,137 @@
+import io
+import os
+import sys
+import time
+
+from tabulate import tabulate
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+from bytecode import compilar_bytecode
+from maquina_virtual import MaquinaVirtual
+
+REPETICIONES = 3
+
+# Programas FusionCod de prueba, con una función de Python equivalente que da la salida esperada.
+FIBONACCI = """
+fn fibonacci (n int) int {
+    if (n <= 1) {
+        return n;
+    }
+    return fibonacci(n - 1) + fibonacci(n - 2);
+}
+
+fn main () int {
+    show(fibonacci(24) + "\\n");
+    return 0;
+}
+"""
+
+BUCLES_ANIDADOS = """
+fn main () int {
+    total int = 0;
+    i int = 0;
+    while (i < 400) {
+        j int = 0;
+        while (j < 400) {
+            total = total + i * j % 7;
+            j = j + 1;
+        }
+        i = i + 1;
+    }
+    show(total + "\\n");
+    return 0;
+}
+"""
+
+BUCLE_FOR = """
+fn main () int {
+    pares int = 0;
+    otros int = 0;
+    for (i int = 0; i < 200000; i = i + 1) {
+        if (i % 2 == 0 and i % 3 <> 0) {
+            pares = pares + 1;
+        } else {
+            otros = otros + i;
+        }
+    }
+    show(pares + " " + otros + "\\n");
+    return 0;
+}
+"""
+
+def fibonacci(n):
+    if n <= 1:
+        return n
+    return fibonacci(n - 1) + fibonacci(n - 2)
+
+def python_fibonacci():
+    return f"{fibonacci(24)}\n"
+
+def python_bucles_anidados():
+    total = 0
+    for i in range(400):
+        for j in range(400):
+            total = total + i * j % 7
+    return f"{total}\n"
+
+def python_bucle_for():
+    pares = 0
+    otros = 0
+    for i in range(200000):
+        if i % 2 == 0 and i % 3 != 0:
+            pares = pares + 1
+        else:
+            otros = otros + i
+    return f"{pares} {otros}\n"
+
+PROGRAMAS = [
+    ('Fibonacci recursivo', FIBONACCI, python_fibonacci),
+    ('Bucles while anidados', BUCLES_ANIDADOS, python_bucles_anidados),
+    ('Bucle for', BUCLE_FOR, python_bucle_for),
+]
+
+# Función que retorna el mejor tiempo de varias ejecuciones de una función y su último resultado.
+def medir(funcion):
+    mejor = float('inf')
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+# Función que ejecuta un módulo de bytecode y retorna lo que el programa mostró.
+def ejecutar(modulo):
+    salida = io.StringIO()
+    MaquinaVirtual(modulo, salida=salida).ejecutar()
+    return salida.getvalue()
+
+def main():
+    filas = []
+    for nombre, codigo, referencia in PROGRAMAS:
+        tiempo_compilacion, (modulo, errores) = medir(lambda: compilar_bytecode(codigo))
+        if errores:
+            raise RuntimeError(f"{nombre} no compila: {[str(error) for error in errores]}")
+        simple, errores = compilar_bytecode(codigo, optimizar=False)
+        tiempo_simple, salida_simple = medir(lambda: ejecutar(simple))
+        tiempo_vm, salida_vm = medir(lambda: ejecutar(modulo))
+        tiempo_python, esperado = medir(referencia)
+        if salida_simple != esperado or salida_vm != esperado:
+            raise RuntimeError(f"{nombre}: la máquina virtual mostró {salida_vm!r} y {salida_simple!r}, se esperaba {esperado!r}")
+
+        instrucciones = sum(len(funcion.codigo) // 2 for funcion in modulo.funciones)
+        instrucciones_simple = sum(len(funcion.codigo) // 2 for funcion in simple.funciones)
+        filas.append([nombre, f"{instrucciones_simple} → {instrucciones}", f"{tiempo_compilacion * 1000:.1f}",
+                      f"{tiempo_simple * 1000:.1f}", f"{tiempo_vm * 1000:.1f}", f"{tiempo_simple / tiempo_vm:.2f}x",
+                      f"{tiempo_python * 1000:.1f}", f"{tiempo_vm / tiempo_python:.1f}x"])
+
+    headers = ["Programa", "Instrucciones", "Compilación (ms)", "Sin superinstrucciones (ms)", "Máquina virtual (ms)",
+               "Mejora", "Python (ms)", "Relación con Python"]
+    print("\nEjecución de programas FusionCod en la máquina virtual de bytecode:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print("Compilación incluye léxico, sintáctico, AST y bytecode. Python es el mismo programa escrito en Python,")
+    print("como referencia del intérprete sobre el que corre la máquina virtual.\n")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+import os
+import sys
+import tempfile
+import time
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+import sintactico
+from arbol_abstracto import reducir_arbol
+from compilacion import compile_source
+
+# Número de instrucciones del programa: la profundidad del árbol sintáctico crece con él.
+INSTRUCCIONES = 100000
+
+# Función que ejecuta una pasada y retorna la fila del reporte con su tiempo.
+def medir(nombre, funcion, *argumentos):
+    inicio = time.perf_counter()
+    resultado = funcion(*argumentos)
+    return resultado, [nombre, f"{time.perf_counter() - inicio:.2f}"]
+
+def main():
+    print(f"\nPasadas sobre un programa de {INSTRUCCIONES} instrucciones (límite de recursión: {sys.getrecursionlimit()}):")
+    resultado, fila_compilacion = medir("Léxico, sintáctico y semántico", compile_source, generar_programa(INSTRUCCIONES))
+    if not resultado.exito:
+        raise RuntimeError(f"El programa sintético tiene errores: {resultado.errores[:3]}")
+    filas = [fila_compilacion]
+    filas.append(medir("Árbol sintáctico (Digraph)", sintactico.arbolSintactico, resultado.arbol, True, "tipo")[1])
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta_dot = os.path.join(carpeta, "arbol.dot")
+        filas.append(medir("Árbol sintáctico (DOT en streaming)", sintactico.escribir_arbol_dot, resultado.arbol, ruta_dot, True, "tipo")[1])
+    filas.append(medir("Diagrama de la tabla de símbolos", sintactico.generar_diagrama_tabla_simbolos, resultado.tabla_simbolos)[1])
+    filas.append(medir("Reducción a AST", reducir_arbol, resultado.arbol)[1])
+    print(tabulate(filas, headers=["Pasada", "Tiempo (s)"], tablefmt="double_outline", stralign="center", numalign="center"))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+carpeta_compilador = os.path.join(directorio, '..', 'compilador')
+sys.path.append(carpeta_compilador)
+
+from cliente import ClienteCompilacion
+
+# Tamaños (número de instrucciones) de los programas sintéticos.
+TAMAÑOS = [1000, 16000]
+REPETICIONES = 5
+
+# Función que retorna el mejor tiempo de varias ejecuciones de un comando en un proceso nuevo.
+def medir_proceso(comando):
+    mejor = float('inf')
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        subprocess.run(comando, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+# Función que retorna el mejor tiempo de varias peticiones por una conexión ya abierta.
+def medir_peticion(cliente, ruta, tokens):
+    mejor = float('inf')
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        respuesta = cliente.compilar_archivo(ruta, tokens)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    if not respuesta['ok']:
+        raise RuntimeError(f"El servidor no pudo compilar {ruta}: {respuesta['error']}")
+    return mejor
+
+def main():
+    with tempfile.TemporaryDirectory() as carpeta:
+        rutas = sorted(glob.glob(os.path.join(directorio, '..', 'codigos-bocetos', '*.txt')))
+        for tamaño in TAMAÑOS:
+            ruta = os.path.join(carpeta, f"sintetico_{tamaño}.txt")
+            with open(ruta, 'w', encoding='utf-8') as archivo:
+                archivo.write(generar_programa(tamaño))
+            rutas.append(ruta)
+
+        ruta_socket = os.path.join(carpeta, 'servidor.sock')
+        servidor = subprocess.Popen([sys.executable, os.path.join(carpeta_compilador, 'servidor.py'), '--socket', ruta_socket],
+                                    stdout=subprocess.DEVNULL)
+        try:
+            # El servidor crea el socket cuando sus trabajadores ya tienen el lexer y la tabla listos.
+            while not os.path.exists(ruta_socket):
+                if servidor.poll() is not None:
+                    raise RuntimeError("El servidor de compilación terminó al arrancar")
+                time.sleep(0.05)
+
+            filas = []
+            with ClienteCompilacion(ruta_socket) as cliente:
+                for ruta in rutas:
+                    # Sin servidor, cada compilación arranca Python, importa el compilador y carga la tabla.
+                    # Igual que el lote, el cliente pide solo los errores y la tabla de símbolos.
+                    tiempo_frio = medir_proceso([sys.executable, os.path.join(carpeta_compilador, 'lote.py'), ruta, '-j', '1'])
+                    tiempo_cliente = medir_proceso([sys.executable, os.path.join(carpeta_compilador, 'cliente.py'),
+                                                    '--socket', ruta_socket, '--sin-tokens', ruta])
+                    tiempo_peticion = medir_peticion(cliente, ruta, False)
+                    tiempo_tokens = medir_peticion(cliente, ruta, True)
+                    filas.append([os.path.basename(ruta), f"{tiempo_frio * 1000:.1f}", f"{tiempo_cliente * 1000:.1f}",
+                                  f"{tiempo_peticion * 1000:.1f}", f"{tiempo_tokens * 1000:.1f}",
+                                  f"{tiempo_frio / tiempo_cliente:.1f}x"])
+                cliente.enviar({'orden': 'detener'})
+            servidor.wait(timeout=10)
+        finally:
+            if servidor.poll() is None:
+                servidor.terminate()
+                servidor.wait()
+
+    headers = ["Programa", "Proceso nuevo (ms)", "Cliente (ms)", "Conexión abierta (ms)", "Con tokens (ms)",
+               "Mejora del cliente"]
+    print("\nCompilación de un archivo en un proceso nuevo frente al servidor de compilación:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print("El cliente es un proceso que solo usa la biblioteca estándar. \"Con tokens\" es la petición por la conexión")
+    print("abierta incluyendo la lista de tokens en el JSON de la respuesta.\n")
+
+if __name__ == '__main__':
+    main()
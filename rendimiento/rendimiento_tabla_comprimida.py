@@ -0,0 +1,99 @@
+import os
+import random
+import sys
+import time
+
+from tabulate import tabulate
+
+from programas_sinteticos import generar_programa
+from rendimiento_generador import generador_ll1
+from rendimiento_generador import gramatica_sintetica
+
+directorio = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(directorio, '..', 'compilador'))
+
+import lexico
+import sintactico
+from tabla_comprimida import comprimir_acciones
+from tabla_comprimida import memoria_densa
+
+# Copias de la gramática de FusionCod en las gramáticas sintéticas (0 es la gramática real).
+COPIAS = [0, 4, 16, 64]
+BUSQUEDAS = 200000
+INSTRUCCIONES = 4000
+
+# Función que mide el tiempo de buscar las celdas indicadas en las filas densas.
+def buscar_densa(acciones, celdas):
+    inicio = time.perf_counter()
+    for fila, columna in celdas:
+        acciones[fila][columna]
+    return time.perf_counter() - inicio
+
+# Función que mide el tiempo de buscar las celdas indicadas en el vector peine.
+def buscar_comprimida(tabla, celdas):
+    base, valor, control = tabla.base, tabla.valor, tabla.control
+    inicio = time.perf_counter()
+    for fila, columna in celdas:
+        indice = base[fila] + columna
+        valor[indice] if control[indice] == fila else -1
+    return time.perf_counter() - inicio
+
+# Función que verifica que cada celda de la tabla comprimida sea igual a la de las filas densas.
+def verificar_celdas(acciones, tabla, num_terminales, nombre):
+    for fila in range(len(acciones)):
+        for columna in range(num_terminales):
+            if tabla.accion(fila, columna) != acciones[fila][columna]:
+                raise RuntimeError(f"La celda ({fila}, {columna}) de {nombre} no coincide")
+
+# Función que mide el mejor tiempo del analizador sintáctico con una tabla LL(1).
+def medir_analisis(lista_de_tokens, tabla_ll1):
+    mejor = float('inf')
+    for _ in range(3):
+        inicio = time.perf_counter()
+        respuesta, _, errores = sintactico.analizador_sintactico(lista_de_tokens, tabla_ll1, construir_arbol=False)
+        mejor = min(mejor, time.perf_counter() - inicio)
+        if not respuesta:
+            raise RuntimeError(f"El programa sintético no es válido: {errores}")
+    return mejor
+
+def main():
+    # Cada celda de la tabla real se compara con la tabla_ll1.csv exportada.
+    tabla_csv = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+    comprimida_csv = comprimir_acciones(tabla_csv.acciones, tabla_csv.num_terminales)
+    verificar_celdas(tabla_csv.acciones, comprimida_csv, tabla_csv.num_terminales, "tabla_ll1.csv")
+
+    gramatica = generador_ll1.leer_archivo_gramatica(generador_ll1.archivo_gramatica)
+    generador_aleatorio = random.Random(0)
+    filas = []
+    for copias in COPIAS:
+        if copias == 0:
+            acciones, num_terminales = tabla_csv.acciones, tabla_csv.num_terminales
+        else:
+            sintetica, terminales = gramatica_sintetica(gramatica, copias)
+            tabla = generador_ll1.construir_tabla_ll1(sintetica, terminales)
+            _, acciones = generador_ll1.compilar_tabla(tabla, list(sintetica), terminales)
+            num_terminales = len(terminales)
+        comprimida = comprimir_acciones(acciones, num_terminales)
+        verificar_celdas(acciones, comprimida, num_terminales, f"la gramática con {copias} copias")
+        llenas = sum(1 for fila in acciones for celda in fila if celda >= 0)
+        celdas = [(generador_aleatorio.randrange(len(acciones)), generador_aleatorio.randrange(num_terminales)) for _ in range(BUSQUEDAS)]
+        tiempo_densa = buscar_densa(acciones, celdas)
+        tiempo_comprimida = buscar_comprimida(comprimida, celdas)
+        filas.append([copias, f"{len(acciones)} x {num_terminales}", f"{llenas / (len(acciones) * num_terminales):.1%}",
+                      memoria_densa(acciones), comprimida.memoria(), f"{memoria_densa(acciones) / comprimida.memoria():.1f}x",
+                      f"{tiempo_densa / BUSQUEDAS * 1e9:.0f}", f"{tiempo_comprimida / BUSQUEDAS * 1e9:.0f}"])
+    headers = ["Copias", "Tamaño", "Celdas llenas", "Bytes (densa)", "Bytes (peine)", "Reducción", "ns/búsqueda (densa)", "ns/búsqueda (peine)"]
+    print("\nTabla de acciones LL(1) densa frente a comprimida por desplazamiento de filas:")
+    print(tabulate(filas, headers=headers, tablefmt="double_outline", stralign="center", numalign="center"))
+    print("Cada celda de la tabla comprimida coincide con la densa y con tabla_ll1.csv.")
+
+    # El analizador acepta cualquiera de las dos representaciones.
+    tabla_comprimida = sintactico.TablaLL1(tabla_csv.terminales, tabla_csv.no_terminales, tabla_csv.producciones, comprimida_csv)
+    lista_de_tokens = list(lexico.generar_tokens(generar_programa(INSTRUCCIONES)))
+    filas = [["Densa", f"{medir_analisis(lista_de_tokens, tabla_csv) * 1000:.1f}"],
+             ["Peine", f"{medir_analisis(lista_de_tokens, tabla_comprimida) * 1000:.1f}"]]
+    print(f"\nAnálisis sintáctico (sin árbol) de un programa de {INSTRUCCIONES} instrucciones:")
+    print(tabulate(filas, headers=["Tabla", "Tiempo (ms)"], tablefmt="double_outline", stralign="center", numalign="center"))
+
+if __name__ == '__main__':
+    main()